@@ -1,16 +1,289 @@
 import csv
-from typing import List, Tuple
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from models.action import Action
+from models.action_table import ActionTable
 
 
-def load_actions(file_path: str) -> Tuple[List[Action], List[Tuple[Action, List[str]]], List[str]]:
+def parse_quantity(value) -> int:
+    """Convertit la valeur de la colonne quantité en entier (1 si la cellule est vide)."""
+    if pd.isna(value):
+        return 1
+    quantity = float(value)
+    if not quantity.is_integer():
+        raise ValueError(f"quantité non entière : {value}")
+    return int(quantity)
+
+
+def parse_risk(value) -> float:
+    """Convertit la valeur de la colonne risque en nombre (0 si la cellule est vide)."""
+    if pd.isna(value):
+        return 0.0
+    return float(value)
+
+
+# Noms reconnus (sans tenir compte de la casse) pour les colonnes facultatives de quantité
+# maximale et de risque
+QUANTITY_COLUMNS = ("quantity", "quantité", "qty")
+RISK_COLUMNS = ("risk", "risque")
+
+
+def find_optional_columns(data: pd.DataFrame) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Repère les colonnes facultatives de quantité et de risque par leur nom, parmi les colonnes
+    qui suivent nom, coût et bénéfice. Les autres colonnes sont ignorées.
+
+    Retourne: (indice_colonne_quantité, indice_colonne_risque), None si absente
+    """
+    return optional_column_positions(list(data.columns))
+
+
+def optional_column_positions(columns: List[object]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Comme `find_optional_columns`, à partir des seuls noms de colonnes (schéma d'un fichier
+    Parquet).
+    """
+    names = [str(column).strip().lower() for column in columns]
+    quantity_column = next((i for i in range(3, len(names)) if names[i] in QUANTITY_COLUMNS), None)
+    risk_column = next((i for i in range(3, len(names)) if names[i] in RISK_COLUMNS), None)
+    return quantity_column, risk_column
+
+
+# Extensions des fichiers d'actions lus en Parquet (les autres sont lus en CSV)
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+
+def is_parquet(file_path: str) -> bool:
+    """Vérifie si un fichier d'actions est au format Parquet, d'après son extension."""
+    return file_path.lower().endswith(PARQUET_EXTENSIONS)
+
+
+def read_action_frame(file_path: str) -> pd.DataFrame:
+    """
+    Lit un fichier d'actions en DataFrame : un CSV en entier, ou un fichier Parquet dont seules les
+    colonnes utiles sont lues et dont les lignes au coût ou au bénéfice non positif sont écartées
+    dès la lecture (voir parquet_loader).
+    """
+    if is_parquet(file_path):
+        # Import local : pyarrow n'est nécessaire que pour les fichiers Parquet
+        from parquet_loader import read_parquet_frame
+        return read_parquet_frame(file_path)
+    return pd.read_csv(file_path, header=0)
+
+
+# Raisons d'invalidité dans l'ordre de Action.get_invalid_reasons : la raison i correspond au bit i
+# du code de validation d'une ligne
+INVALID_REASONS = ("Coût <= 0", "Bénéfice % <= 0", "Quantité maximale < 1", "Risque < 0")
+
+# Nombre de lignes lues à la fois par le chargement en flux
+STREAM_CHUNK_ROWS = 100_000
+
+# État d'une ligne après conversion : valide, invalide, erreur de conversion, ou non lue
+# (après une erreur qui interrompt le chargement)
+ROW_VALID, ROW_INVALID, ROW_ERROR, ROW_SKIPPED = range(4)
+
+
+def to_numbers(column: pd.Series, strip_percent: bool = False) -> np.ndarray:
+    """
+    Convertit une colonne en flottants, NaN là où la conversion échoue (« % » retiré si
+    `strip_percent`).
+    """
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.float64)
+    # Les chaînes NumPy se découpent et se convertissent sans boucle Python, avec les règles de
+    # float() ; si une valeur n'est pas un nombre, pandas convertit les autres et met NaN à sa place
+    texts = column.to_numpy().astype(np.dtypes.StringDType())
+    if strip_percent:
+        texts = np.strings.strip(texts, '%')
+    try:
+        return texts.astype(np.float64)
+    except ValueError:
+        values = pd.to_numeric(pd.Series(texts, dtype=object), errors='coerce')
+        return values.to_numpy(dtype=np.float64)
+
+
+def invalid_flags(cost: np.ndarray, benefit_percent: np.ndarray, max_quantity: np.ndarray,
+                  risk: np.ndarray) -> np.ndarray:
+    """
+    Code de validation de chaque ligne : le bit i est levé si la raison INVALID_REASONS[i]
+    s'applique.
+    """
+    flags = (cost <= 0).astype(np.uint8)
+    flags |= (benefit_percent <= 0).astype(np.uint8) << 1
+    flags |= (max_quantity < 1).astype(np.uint8) << 2
+    flags |= (risk < 0).astype(np.uint8) << 3
+    return flags
+
+
+def reasons_from_flags(flags: int) -> List[str]:
+    """Raisons d'invalidité correspondant à un code de validation."""
+    return [reason for bit, reason in enumerate(INVALID_REASONS) if flags >> bit & 1]
+
+
+class ParsedRows:
+    """
+    Lignes d'un fichier d'actions converties et validées colonne par colonne.
+
+    Les colonnes sont converties en une fois (`pd.to_numeric`), et seules les lignes qui posent
+    problème (texte non numérique, valeur non finie, quantité non entière, nom absent) repassent
+    par la conversion ligne à ligne d'origine : les résultats, messages d'erreur compris, restent
+    ceux du chargement par `iterrows`, dans l'ordre du fichier.
+    """
+
+    def __init__(self, data: pd.DataFrame, fixed_point: bool = False, strip_names: bool = True):
+        """
+        Convertit `data` (nom, coût, bénéfice et colonnes facultatives). `strip_names` retire les
+        espaces autour des noms, comme le fait `load_actions`.
+        """
+        self.fixed_point = fixed_point
+        self.quantity_column, self.risk_column = find_optional_columns(data)
+        count = len(data)
+
+        names = data.iloc[:, 0]
+        if pd.api.types.infer_dtype(names, skipna=True) == 'string':
+            regular = names.notna().to_numpy()
+            self.names = names.to_numpy(dtype=object)
+            if strip_names:
+                # Découpage par les chaînes NumPy plutôt que `Series.str`, dont les objets
+                # intermédiaires font grossir la mémoire au fil des blocs
+                names = self.names.astype(np.dtypes.StringDType())
+                self.names = np.strings.strip(names).astype(object)
+        else:
+            regular = np.zeros(count, dtype=np.bool_)
+            self.names = names.to_numpy(dtype=object)
+
+        self.cost = to_numbers(data.iloc[:, 1])
+        self.benefit_percent = to_numbers(data.iloc[:, 2], strip_percent=True)
+        regular &= np.isfinite(self.cost) & np.isfinite(self.benefit_percent)
+
+        if self.quantity_column is not None:
+            column = data.iloc[:, self.quantity_column]
+            quantities = to_numbers(column)
+            missing = column.isna().to_numpy()
+            with np.errstate(invalid='ignore'):
+                whole = (np.abs(quantities) < 2 ** 53) & (quantities == np.floor(quantities))
+            regular &= missing | whole
+            self.max_quantity = np.where(missing | ~regular, 1, quantities).astype(np.int64)
+        else:
+            self.max_quantity = np.ones(count, dtype=np.int64)
+
+        if self.risk_column is not None:
+            column = data.iloc[:, self.risk_column]
+            self.risk = to_numbers(column)
+            missing = column.isna().to_numpy()
+            regular &= missing | ~np.isnan(self.risk)
+            self.risk[missing] = 0.0
+        else:
+            self.risk = np.zeros(count, dtype=np.float64)
+
+        self.status = np.full(count, ROW_SKIPPED, dtype=np.int8)
+        self.errors = {}
+        self.failure = None
+        self.convert_irregular(data, np.flatnonzero(~regular), strip_names)
+        self.validate()
+
+    def convert_irregular(self, data: pd.DataFrame, rows: np.ndarray, strip_names: bool):
+        """
+        Convertit une à une les lignes `rows` comme le chargement d'origine. Une erreur de
+        conversion est notée pour la ligne ; toute autre exception interrompt le chargement à cette
+        ligne.
+        """
+        self.stop = len(data)
+        for row_index in rows:
+            row = data.iloc[row_index]
+            try:
+                name = row.iloc[0].strip() if strip_names else row.iloc[0]
+                try:
+                    cost = float(row.iloc[1])
+                    benefit_percent = float(str(row.iloc[2]).strip('%'))
+                    max_quantity = (parse_quantity(row.iloc[self.quantity_column])
+                                    if self.quantity_column is not None else 1)
+                    risk = (parse_risk(row.iloc[self.risk_column])
+                            if self.risk_column is not None else 0.0)
+                    # Le mode virgule fixe peut lui aussi rejeter la ligne (valeur non finie)
+                    Action(name, cost, benefit_percent, fixed_point=self.fixed_point,
+                           max_quantity=max_quantity, risk=risk)
+                except ValueError as e:
+                    self.errors[row_index] = f"Erreur de conversion pour {name}: {e}"
+                    continue
+            except Exception as e:
+                self.stop = row_index
+                self.failure = e
+                break
+            self.names[row_index] = name
+            self.cost[row_index] = cost
+            self.benefit_percent[row_index] = benefit_percent
+            self.max_quantity[row_index] = max_quantity
+            self.risk[row_index] = risk
+
+    def validate(self):
+        """Calcule le code de validation et l'état de chaque ligne lue."""
+        cost, benefit_percent = self.cost, self.benefit_percent
+        if self.fixed_point:
+            # Action valide les valeurs arrondies au centième
+            cost = np.rint(cost * 100) / 100
+            benefit_percent = np.rint(benefit_percent * 100) / 100
+        self.flags = invalid_flags(cost, benefit_percent, self.max_quantity, self.risk)
+        with np.errstate(invalid='ignore'):
+            valid = (cost > 0) & (benefit_percent > 0) & (self.max_quantity >= 1) & (self.risk >= 0)
+        read = slice(0, self.stop)
+        self.status[read] = np.where(valid[read], ROW_VALID, ROW_INVALID)
+        self.status[list(self.errors)] = ROW_ERROR
+
+    def rows(self, status: int) -> np.ndarray:
+        """Indices, dans l'ordre du fichier, des lignes dans l'état `status`."""
+        return np.flatnonzero(self.status == status)
+
+    def actions(self, rows: np.ndarray) -> List[Action]:
+        """Actions des lignes `rows`."""
+        return Action.from_columns(
+            self.names[rows].tolist(), self.cost[rows].tolist(),
+            self.benefit_percent[rows].tolist(), self.fixed_point,
+            self.max_quantity[rows].tolist(), self.risk[rows].tolist()
+        )
+
+    def table(self, rows: np.ndarray) -> ActionTable:
+        """Table en colonnes des lignes `rows`, sans créer d'objets Action."""
+        return ActionTable(self.names[rows], self.cost[rows], self.benefit_percent[rows],
+                           fixed_point=self.fixed_point, max_quantities=self.max_quantity[rows],
+                           risks=self.risk[rows])
+
+    def invalid_reasons(self, rows: np.ndarray) -> List[List[str]]:
+        """Raisons d'invalidité des lignes `rows`, d'après leur code de validation."""
+        return [reasons_from_flags(flags) for flags in self.flags[rows].tolist()]
+
+    def error_messages(self, include_invalid: bool = False) -> List[str]:
+        """
+        Messages d'erreur de conversion dans l'ordre du fichier ; avec `include_invalid`, les
+        actions invalides y figurent aussi (« Action invalide nom: raisons »).
+        """
+        if not include_invalid:
+            return [self.errors[row] for row in sorted(self.errors)]
+        rows = np.flatnonzero((self.status == ROW_INVALID) | (self.status == ROW_ERROR))
+        messages = []
+        for row in rows.tolist():
+            if row in self.errors:
+                messages.append(self.errors[row])
+            else:
+                reasons = reasons_from_flags(int(self.flags[row]))
+                messages.append(f"Action invalide {self.names[row]}: {', '.join(reasons)}")
+        return messages
+
+
+def load_actions(file_path: str, fixed_point: bool = False
+                 ) -> Tuple[List[Action], List[Tuple[Action, List[str]]], List[str]]:
     """
     Charge et valide les actions depuis un fichier CSV.
     Retourne une liste d'actions valides, une liste de tuples d'actions invalides avec leurs raisons,
     et une liste d'erreurs de chargement.
+    Avec `fixed_point`, les prix sont convertis en centimes entiers dès le chargement (voir Action).
+    Une colonne facultative nommée « quantity », « quantité » ou « qty » donne la quantité maximale
+    achetable de chaque action (1 si absente ou vide), et une colonne facultative nommée « risk »
+    ou « risque » son score de risque (0 si absente ou vide). Les autres colonnes sont ignorées.
     """
     valid_actions = []
     invalid_actions = []
@@ -18,7 +291,7 @@ def load_actions(file_path: str) -> Tuple[List[Action], List[Tuple[Action, List[
 
     try:
 
-        data = pd.read_csv(file_path, header=0)
+        data = read_action_frame(file_path)
         
         # Note pandas :
         # La propriété .shape() renvoie le tuple représentant la forme du DataFrame. 
@@ -29,25 +302,130 @@ def load_actions(file_path: str) -> Tuple[List[Action], List[Tuple[Action, List[
         if data.shape[1] < 3:
             raise ValueError("Le fichier CSV doit contenir au moins trois colonnes : nom, coût, et bénéfice.")
 
-        for _, row in data.iterrows():
-            try:
-                name = row.iloc[0].strip()
-                cost = float(row.iloc[1])
-                benefit_percent = float(str(row.iloc[2]).strip('%'))
-
-                action = Action(name, cost, benefit_percent)
-                if action.is_valid():
-                    valid_actions.append(action)
-                else:
-                    reasons = action.get_invalid_reasons()
-                    invalid_actions.append((action, reasons))
-            
-            except ValueError as e:
-                errors.append(f"Erreur de conversion pour {name}: {e}")
+        # Conversion et validation colonne par colonne (voir ParsedRows)
+        parsed = ParsedRows(data, fixed_point=fixed_point)
+        valid_actions = parsed.actions(parsed.rows(ROW_VALID))
+        invalid_rows = parsed.rows(ROW_INVALID)
+        invalid_actions = list(zip(parsed.actions(invalid_rows),
+                                   parsed.invalid_reasons(invalid_rows)))
+        errors = parsed.error_messages()
+        if parsed.failure is not None:
+            raise parsed.failure
 
     except FileNotFoundError:
         errors.append(f"Le fichier {file_path} n'a pas été trouvé.")
     except Exception as e:
         errors.append(f"Erreur lors de la lecture du fichier: {str(e)}")
 
-    return valid_actions, invalid_actions, errors
\ No newline at end of file
+    return valid_actions, invalid_actions, errors
+
+
+def load_action_table(file_path: str, fixed_point: bool = False,
+                      strip_names: bool = True
+                      ) -> Tuple[ActionTable, List[Tuple[Action, List[str]]], List[str]]:
+    """
+    Comme `load_actions`, mais les actions valides sont renvoyées en une `ActionTable`, sans créer
+    d'objet Action par ligne (seules les actions invalides, en général peu nombreuses, en sont).
+    Sans `strip_names`, les noms sont gardés tels quels, comme dans `optimized.load_actions`.
+    """
+    valid_table = ActionTable([], [], [], fixed_point=fixed_point)
+    invalid_actions = []
+    errors = []
+
+    try:
+        data = read_action_frame(file_path)
+        if data.shape[1] < 3:
+            raise ValueError(
+                "Le fichier CSV doit contenir au moins trois colonnes : nom, coût, et bénéfice."
+            )
+
+        parsed = ParsedRows(data, fixed_point=fixed_point, strip_names=strip_names)
+        valid_table = parsed.table(parsed.rows(ROW_VALID))
+        invalid_rows = parsed.rows(ROW_INVALID)
+        invalid_actions = list(zip(parsed.actions(invalid_rows),
+                                   parsed.invalid_reasons(invalid_rows)))
+        errors = parsed.error_messages()
+        if parsed.failure is not None:
+            raise parsed.failure
+
+    except FileNotFoundError:
+        errors.append(f"Le fichier {file_path} n'a pas été trouvé.")
+    except Exception as e:
+        errors.append(f"Erreur lors de la lecture du fichier: {str(e)}")
+
+    return valid_table, invalid_actions, errors
+
+
+def iter_action_batches(file_path: str, fixed_point: bool = False,
+                        chunk_size: int = STREAM_CHUNK_ROWS) -> Iterator[Tuple[int, ParsedRows]]:
+    """
+    Lit le fichier (CSV ou Parquet) par blocs de `chunk_size` lignes et produit chaque bloc converti
+    et validé, avec l'indice de sa première ligne dans le fichier : la mémoire ne dépend que de la
+    taille des blocs, pas de celle du fichier.
+
+    Une erreur qui interrompt le chargement est levée après le bloc où elle se produit, ce bloc ne
+    contenant que les lignes qui la précèdent.
+    """
+    if is_parquet(file_path):
+        from parquet_loader import iter_parquet_frames
+        frames = iter_parquet_frames(file_path, chunk_size)
+    else:
+        frames = pd.read_csv(file_path, header=0, chunksize=chunk_size)
+
+    offset = 0
+    with frames as reader:
+        for data in reader:
+            if data.shape[1] < 3:
+                raise ValueError(
+                    "Le fichier CSV doit contenir au moins trois colonnes : nom, coût, et bénéfice."
+                )
+            parsed = ParsedRows(data, fixed_point=fixed_point)
+            yield offset, parsed
+            if parsed.failure is not None:
+                raise parsed.failure
+            offset += len(data)
+
+
+class LoadSummary:
+    """Compteurs et statistiques d'un chargement, mis à jour bloc par bloc."""
+
+    def __init__(self):
+        """Initialise des compteurs vides."""
+        self.rows = 0
+        self.valid = 0
+        self.invalid = 0
+        self.reason_counts = Counter()
+        self.errors = []
+        self.total_cost = 0.0
+        self.total_benefit = 0.0
+        self.min_cost = float('inf')
+        self.max_cost = 0.0
+        self.best_ratio = 0.0
+
+    def update(self, parsed: ParsedRows, table: Optional[ActionTable] = None):
+        """Ajoute les lignes d'un bloc (`table` : ses actions valides, si déjà en table)."""
+        valid_rows = parsed.rows(ROW_VALID)
+        invalid_rows = parsed.rows(ROW_INVALID)
+        self.rows += parsed.stop
+        self.valid += len(valid_rows)
+        self.invalid += len(invalid_rows)
+        flags = parsed.flags[invalid_rows]
+        for bit, reason in enumerate(INVALID_REASONS):
+            count = int(np.count_nonzero(flags >> bit & 1))
+            if count:
+                self.reason_counts[reason] += count
+        self.errors.extend(parsed.error_messages())
+
+        if len(valid_rows):
+            if table is None:
+                table = parsed.table(valid_rows)
+            self.total_cost += float(table.cost.sum())
+            self.total_benefit += float(table.benefit.sum())
+            self.min_cost = min(self.min_cost, float(table.cost.min()))
+            self.max_cost = max(self.max_cost, float(table.cost.max()))
+            self.best_ratio = max(self.best_ratio, float(table.ratio.max()))
+
+    @property
+    def mean_cost(self) -> float:
+        """Coût moyen d'une action valide."""
+        return self.total_cost / self.valid if self.valid else 0.0
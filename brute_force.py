@@ -1,11 +1,16 @@
+import os
 import sys
 import time
 import webbrowser
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple
 
+import numpy as np
 from rich import box
 from rich.align import Align
 from rich.console import Console
+from InquirerPy import prompt
 from rich.panel import Panel
 
 from action_loader import load_actions
@@ -13,10 +18,19 @@ from console.display_utils import display_results
 from console.progress_utils import show_step_progress
 from dashboard.app import create_dashboard
 from models.action import Action
+from solvers.branch_and_bound import branch_and_bound
+from solvers.dynamic_programming import to_cents, to_exact_benefit
+from solvers.reduction import reduce_instance, solve_reduced
 
 # Configuration de la console pour l'affichage
 console = Console()
 
+# Mémoire de travail par bloc de la force brute vectorisée, choisie pour tenir en cache L2/L3
+VECTORIZED_CHUNK_MEMORY_MB = 4
+# Octets de travail par sous-ensemble d'un bloc :
+# sommes (2 × int64), candidats (int64), test du budget (bool)
+BYTES_PER_SUBSET = 25
+
 # ====================
 # Fonctions de calcul des combinaisons
 # ====================
@@ -36,6 +50,46 @@ def get_combinations_with_memory(actions: List[Action]) -> Tuple[List[List[Actio
     memory_size = sys.getsizeof(combinations) / (1024 * 1024)
     return combinations, memory_size
 
+
+def generate_gray_code_steps(n: int) -> Iterator[Tuple[int, int, bool]]:
+    """
+    Parcourt les 2^n sous-ensembles dans l'ordre du code de Gray, sans les matérialiser.
+
+    Chaque étape ne modifie qu'une seule action : on produit (masque, indice_modifié, ajoutée).
+    Le sous-ensemble vide (masque 0) est le point de départ et n'est pas produit.
+    """
+    mask = 0
+    for step in range(1, 2 ** n):
+        index = (step & -step).bit_length() - 1
+        mask ^= 1 << index
+        yield mask, index, bool(mask >> index & 1)
+
+
+def get_exact_values(actions: List[Action]) -> Tuple[List[int], List[int]]:
+    """
+    Convertit coûts et bénéfices en entiers exacts.
+
+    Coûts en centimes, bénéfices en millionièmes d'euro (centimes × centièmes de pourcent).
+    """
+    costs = [to_cents(action.cost) for action in actions]
+    benefits = [to_exact_benefit(action) for action in actions]
+    return costs, benefits
+
+
+def generate_subset_sums(costs: List[int], benefits: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcule le coût et le bénéfice de tous les sous-ensembles d'une liste d'actions.
+
+    L'indice d'un sous-ensemble dans les tableaux renvoyés est son masque binaire
+    (bit i = action i), soit le même ordre que `generate_combinations`.
+    """
+    cost_sums = np.zeros(1, dtype=np.int64)
+    benefit_sums = np.zeros(1, dtype=np.int64)
+    for cost, benefit in zip(costs, benefits):
+        cost_sums = np.concatenate((cost_sums, cost_sums + cost))
+        benefit_sums = np.concatenate((benefit_sums, benefit_sums + benefit))
+    return cost_sums, benefit_sums
+
 # ====================
 # Fonctions d'optimisation
 # ====================
@@ -68,16 +122,359 @@ def find_best_combination(actions: List[Action], max_budget: float) -> Tuple[Lis
 
     return best_combination, best_cost, best_benefit, memory_used
 
+
+def find_best_combination_mitm(
+    actions: List[Action], max_budget: float
+) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche exhaustive de la combinaison optimale par « meet-in-the-middle » en O(2^(n/2)).
+
+    Les actions sont coupées en deux moitiés dont on énumère toutes les sommes. La moitié haute
+    est triée par coût et réduite à sa frontière de Pareto, puis chaque sous-ensemble de la moitié
+    basse y est apparié par recherche dichotomique sur le budget restant. Les sommes sont exactes
+    (centimes entiers) et, à bénéfice égal, le plus petit masque est retenu, comme le premier
+    rencontré par `find_best_combination`.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    capacity = to_cents(max_budget)
+    if not actions or capacity < 0:
+        return [], 0.0, 0.0, 0.0
+
+    costs, benefits = get_exact_values(actions)
+
+    half = len(actions) // 2
+    high_size = len(actions) - half
+    low_costs, low_benefits = generate_subset_sums(costs[:half], benefits[:half])
+    high_costs, high_benefits = generate_subset_sums(costs[half:], benefits[half:])
+
+    # Clé unique pour la moitié haute : bénéfice d'abord, puis plus petit masque à égalité
+    if (int(high_benefits.max()) + 1) << high_size >= 2 ** 63:
+        raise ValueError(
+            "Les bénéfices sont trop élevés pour une recherche meet-in-the-middle exacte."
+        )
+    high_masks = np.arange(high_costs.size, dtype=np.int64)
+    high_keys = (high_benefits << high_size) + (high_costs.size - 1 - high_masks)
+
+    # Frontière de Pareto : triée par coût croissant, on garde les clés strictement meilleures
+    order = np.lexsort((-high_keys, high_costs))
+    sorted_costs = high_costs[order]
+    sorted_keys = high_keys[order]
+    running_best = np.maximum.accumulate(sorted_keys)
+    on_frontier = np.empty(sorted_keys.size, dtype=np.bool_)
+    on_frontier[0] = True
+    on_frontier[1:] = sorted_keys[1:] > running_best[:-1]
+    frontier_costs = sorted_costs[on_frontier]
+    frontier_masks = order[on_frontier].astype(np.int64)
+    frontier_benefits = high_benefits[frontier_masks]
+
+    # Appariement de chaque sous-ensemble bas avec le meilleur sous-ensemble haut compatible
+    low_masks = np.flatnonzero(low_costs <= capacity)
+    matches = np.searchsorted(frontier_costs, capacity - low_costs[low_masks], side='right') - 1
+    total_benefits = low_benefits[low_masks] + frontier_benefits[matches]
+    total_masks = low_masks + (frontier_masks[matches] << half)
+
+    best_benefit = total_benefits.max()
+    best_mask = int(total_masks[total_benefits == best_benefit].min())
+
+    memory_used = sum(array.nbytes for array in (
+        low_costs, low_benefits, high_costs, high_benefits, high_keys, order,
+        frontier_costs, frontier_masks, matches, total_benefits, total_masks
+    )) / (1024 * 1024)
+
+    if best_benefit <= 0:
+        return [], 0, 0, memory_used
+
+    best_combination = [action for i, action in enumerate(actions) if best_mask >> i & 1]
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+def find_best_combination_gray(
+    actions: List[Action], max_budget: float
+) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche exhaustive en flux : les sous-ensembles sont parcourus en code de Gray.
+
+    Le coût et le bénéfice courants sont mis à jour en O(1) à chaque étape et seul le meilleur
+    masque est conservé, la mémoire reste donc constante quel que soit n. À bénéfice égal,
+    le plus petit masque est retenu, comme dans `find_best_combination`.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    if not actions:
+        return [], 0.0, 0.0, 0.0
+
+    capacity = to_cents(max_budget)
+    costs, benefits = get_exact_values(actions)
+
+    cost = 0
+    benefit = 0
+    best_mask = 0
+    best_benefit = 0
+    for mask, index, added in generate_gray_code_steps(len(actions)):
+        if added:
+            cost += costs[index]
+            benefit += benefits[index]
+        else:
+            cost -= costs[index]
+            benefit -= benefits[index]
+
+        better = benefit > best_benefit or (benefit == best_benefit and mask < best_mask)
+        if cost <= capacity and better:
+            best_mask = mask
+            best_benefit = benefit
+
+    memory_used = (sys.getsizeof(costs) + sys.getsizeof(benefits)) / (1024 * 1024)
+
+    if best_benefit <= 0:
+        return [], 0, 0, memory_used
+
+    best_combination = [action for i, action in enumerate(actions) if best_mask >> i & 1]
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+def get_chunk_bits(n: int, max_memory_mb: float) -> int:
+    """Calcule k tel qu'un bloc de 2^k sous-ensembles respecte le plafond mémoire."""
+    max_subsets = max(int(max_memory_mb * 1024 * 1024) // BYTES_PER_SUBSET, 1)
+    return min(n, max_subsets.bit_length() - 1)
+
+
+def search_best_mask(costs: List[int], benefits: List[int], capacity: int,
+                     max_memory_mb: float = VECTORIZED_CHUNK_MEMORY_MB) -> Tuple[int, int, float]:
+    """
+    Cherche le meilleur masque en valeurs entières exactes, par blocs vectorisés de 2^k
+    sous-ensembles.
+
+    Les k actions basses sont développées une seule fois en matrice de bits (2^k × k), dont le
+    produit avec les vecteurs de coûts et de bénéfices donne les sommes de chaque bloc. Chaque
+    bloc correspond ensuite à un préfixe des actions hautes, filtré par le budget puis réduit
+    par argmax. `max_memory_mb` plafonne la mémoire de travail d'un bloc.
+
+    Retourne: (meilleur_masque, meilleur_bénéfice, mémoire_utilisée)
+    """
+    chunk_bits = get_chunk_bits(len(costs), max_memory_mb)
+
+    # Sommes des sous-ensembles bas par produit matrice de bits × vecteur
+    chunk_masks = np.arange(2 ** chunk_bits, dtype=np.int64)
+    bits = ((chunk_masks[:, None] >> np.arange(chunk_bits)) & 1).astype(np.int64)
+    low_costs = bits @ np.array(costs[:chunk_bits], dtype=np.int64)
+    low_benefits = bits @ np.array(benefits[:chunk_bits], dtype=np.int64)
+    del bits
+
+    high_costs = costs[chunk_bits:]
+    high_benefits = benefits[chunk_bits:]
+    high_steps = chain([(0, 0, True)], generate_gray_code_steps(len(high_costs)))
+
+    # Les préfixes hauts sont parcourus en code de Gray pour ne jamais les stocker
+    high_cost = 0
+    high_benefit = 0
+    best_mask = 0
+    best_benefit = 0
+    for high_mask, index, added in high_steps:
+        if high_mask:
+            sign = 1 if added else -1
+            high_cost += sign * high_costs[index]
+            high_benefit += sign * high_benefits[index]
+
+        remaining = capacity - high_cost
+        if remaining < 0:
+            continue
+        candidates = np.where(low_costs <= remaining, low_benefits, -1)
+        # argmax renvoie la première occurrence : le plus petit masque du bloc à égalité
+        low_mask = int(candidates.argmax())
+        benefit = int(candidates[low_mask]) + high_benefit
+        mask = (high_mask << chunk_bits) | low_mask
+        if benefit > best_benefit or (benefit == best_benefit and mask < best_mask):
+            best_mask = mask
+            best_benefit = benefit
+
+    memory_used = chunk_masks.size * BYTES_PER_SUBSET / (1024 * 1024)
+    return best_mask, best_benefit, memory_used
+
+
+def find_best_combination_vectorized(actions: List[Action], max_budget: float,
+                                     max_memory_mb: float = VECTORIZED_CHUNK_MEMORY_MB
+                                     ) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche exhaustive vectorisée avec NumPy, par blocs de taille bornée
+    (voir `search_best_mask`).
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    if not actions:
+        return [], 0.0, 0.0, 0.0
+
+    costs, benefits = get_exact_values(actions)
+    best_mask, best_benefit, memory_used = search_best_mask(
+        costs, benefits, to_cents(max_budget), max_memory_mb
+    )
+
+    if best_benefit <= 0:
+        return [], 0, 0, memory_used
+
+    best_combination = [action for i, action in enumerate(actions) if best_mask >> i & 1]
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+# Données partagées par chaque processus de calcul, transmises une seule fois à son démarrage
+_worker_state = {}
+
+
+def init_worker(costs: List[int], benefits: List[int], capacity: int, prefix_bits: int):
+    """Initialise un processus de calcul avec les valeurs exactes des actions."""
+    _worker_state.update(costs=costs, benefits=benefits, capacity=capacity, prefix_bits=prefix_bits)
+
+
+def search_prefix(prefix: int) -> Tuple[int, int, int]:
+    """
+    Explore tous les sous-ensembles dont les `prefix_bits` bits de poids fort valent `prefix`.
+
+    Retourne: (meilleur_masque, coût, bénéfice), avec un bénéfice de -1 si le préfixe dépasse
+    le budget.
+    """
+    costs = _worker_state['costs']
+    benefits = _worker_state['benefits']
+    low_size = len(costs) - _worker_state['prefix_bits']
+
+    prefix_indices = [low_size + i for i in range(_worker_state['prefix_bits']) if prefix >> i & 1]
+    prefix_cost = sum(costs[i] for i in prefix_indices)
+    remaining = _worker_state['capacity'] - prefix_cost
+    if remaining < 0:
+        return 0, 0, -1
+
+    low_mask, low_benefit, _ = search_best_mask(costs[:low_size], benefits[:low_size], remaining)
+    mask = (prefix << low_size) | low_mask
+    cost = prefix_cost + sum(costs[i] for i in range(low_size) if low_mask >> i & 1)
+    return mask, cost, low_benefit + sum(benefits[i] for i in prefix_indices)
+
+
+def find_best_combination_parallel(
+    actions: List[Action], max_budget: float, workers: Optional[int] = None,
+    prefix_bits: Optional[int] = None
+) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche exhaustive répartie sur plusieurs cœurs.
+
+    L'espace des 2^n sous-ensembles est découpé selon les `prefix_bits` bits de poids fort du
+    masque : chaque tâche explore un préfixe et ne renvoie que son meilleur (masque, coût,
+    bénéfice).
+    Par défaut, on crée environ 4 tâches par processus pour équilibrer la charge.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    if not actions:
+        return [], 0.0, 0.0, 0.0
+
+    workers = workers or os.cpu_count() or 1
+    if prefix_bits is None:
+        prefix_bits = (workers * 4 - 1).bit_length()
+    prefix_bits = min(prefix_bits, len(actions))
+
+    costs, benefits = get_exact_values(actions)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(costs, benefits, to_cents(max_budget), prefix_bits)
+    ) as executor:
+        results = list(executor.map(search_prefix, range(2 ** prefix_bits)))
+
+    best_mask = 0
+    best_benefit = 0
+    for mask, _, benefit in results:
+        if benefit > best_benefit or (benefit == best_benefit and mask < best_mask):
+            best_mask = mask
+            best_benefit = benefit
+
+    # Mémoire de travail d'un processus, multipliée par le nombre de processus actifs
+    low_size = len(actions) - prefix_bits
+    chunk_size = 2 ** get_chunk_bits(low_size, VECTORIZED_CHUNK_MEMORY_MB)
+    memory_used = min(workers, len(results)) * chunk_size * BYTES_PER_SUBSET / (1024 * 1024)
+
+    if best_benefit <= 0:
+        return [], 0, 0, memory_used
+
+    best_combination = [action for i, action in enumerate(actions) if best_mask >> i & 1]
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+def find_best_combination_reduced(actions: List[Action], max_budget: float
+                                  ) -> Tuple[List[Action], float, float, float]:
+    """
+    Force brute vectorisée sur l'instance réduite (voir `solvers.reduction`) : les actions hors
+    budget, dominées ou fixées par les bornes ne sont pas énumérées.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    return solve_reduced(find_best_combination_vectorized, actions, max_budget)
+
+
+# Modes de recherche sélectionnables au lancement (argument de la ligne de commande ou menu)
+SEARCH_MODES = {
+    "classic": {
+        "label": "Force brute classique, toutes les combinaisons en mémoire",
+        "run": find_best_combination
+    },
+    "mitm": {
+        "label": "Meet-in-the-middle, O(2^(n/2))",
+        "run": find_best_combination_mitm
+    },
+    "gray": {
+        "label": "Parcours en code de Gray, mémoire constante",
+        "run": find_best_combination_gray
+    },
+    "vectorized": {
+        "label": "Force brute vectorisée NumPy, par blocs",
+        "run": find_best_combination_vectorized
+    },
+    "parallel": {
+        "label": "Force brute vectorisée répartie sur tous les cœurs",
+        "run": find_best_combination_parallel
+    },
+    "reduced": {
+        "label": "Force brute vectorisée sur l'instance réduite",
+        "run": find_best_combination_reduced
+    },
+    "bb": {
+        "label": "Branch-and-bound (exacte, non exhaustive)",
+        "run": branch_and_bound
+    }
+}
+DEFAULT_MODE = "classic"
+
 # ====================
 # Fonctions de mesure de performance
 # ====================
 
-def measure_performance(actions_list: List[Action], max_budget: float) -> Tuple[List[int], List[float], List[float], float, float]:
+
+def measure_performance(
+    actions_list: List[Action], max_budget: float, mode: str = DEFAULT_MODE
+) -> Tuple[List[int], List[float], List[float], float, float]:
     """
     Analyse les performances de l'algorithme en mesurant:
     - Le temps d'exécution pour différentes tailles d'entrée
     - L'utilisation de la mémoire
     """
+    search = SEARCH_MODES[mode]['run']
     n_values = []
     times = []
     memories = []
@@ -87,7 +484,7 @@ def measure_performance(actions_list: List[Action], max_budget: float) -> Tuple[
     for n in range(1, len(actions_list) + 1):
         current_actions = actions_list[:n]
         start_time = time.time()
-        _, _, _, memory_used = find_best_combination(current_actions, max_budget)
+        _, _, _, memory_used = search(current_actions, max_budget)
         elapsed_time = time.time() - start_time
 
         n_values.append(n)
@@ -112,6 +509,29 @@ def print_header():
     console.print(Panel(title, box=box.ROUNDED, style="cyan", padding=(1, 2)))
     console.print("\n")
 
+
+def select_mode() -> str:
+    """
+    Renvoie le mode passé en argument (ex. `python brute_force.py mitm`), sinon le demande ; hors
+    terminal interactif (entrée redirigée, CI), le mode par défaut est retenu sans question.
+    """
+    if len(sys.argv) > 1 and sys.argv[1] in SEARCH_MODES:
+        return sys.argv[1]
+    if not sys.stdin.isatty():
+        return DEFAULT_MODE
+    questions = [
+        {
+            "type": "list",
+            "name": "mode",
+            "message": "Choisissez le mode de recherche :",
+            "choices": [
+                {"name": mode['label'], "value": key} for key, mode in SEARCH_MODES.items()
+            ],
+            "default": DEFAULT_MODE
+        }
+    ]
+    return prompt(questions)["mode"]
+
 # ====================
 # Fonction principale
 # ====================
@@ -121,6 +541,7 @@ def main():
     FILE_PATH = "data/actions.csv"
     MAX_BUDGET = 500
 
+    mode = select_mode()
     console.clear()
     print_header()
 
@@ -137,10 +558,17 @@ def main():
             console.print(f"[red]  → {error}[/]")
         return
 
+    if mode == "reduced":
+        reduced = reduce_instance(actions, MAX_BUDGET)
+        console.print(
+            f"[cyan]Réduction de l'instance : {reduced.removed_count} variables retirées "
+            f"sur {len(actions)}[/]"
+        )
+
     # Recherche de la solution optimale
     best_actions, total_cost, total_benefit, _ = show_step_progress(
         "Recherche de la meilleure combinaison",
-        find_best_combination,
+        SEARCH_MODES[mode]['run'],
         actions, MAX_BUDGET
     )
 
@@ -148,7 +576,7 @@ def main():
     n_values, times, memories, execution_time, total_memory_used = show_step_progress(
         "Analyse des performances",
         measure_performance,
-        actions, MAX_BUDGET
+        actions, MAX_BUDGET, mode
     )
 
     # Préparation des données pour l'affichage
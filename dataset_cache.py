@@ -0,0 +1,169 @@
+"""
+Cache binaire des jeux de données déjà convertis et validés.
+
+Pour chaque fichier CSV et chaque mode de calcul (flottant ou virgule fixe), les colonnes des
+actions valides et invalides sont enregistrées en fichiers `.npy` dans un dossier `.cache` placé
+à côté du fichier, avec un manifeste (taille, date de modification et empreinte SHA-256 du CSV,
+erreurs de conversion). Un chargement suivant projette ces colonnes en mémoire sans les copier ni
+relire le CSV : changer de jeu de données ne prend alors que quelques millisecondes.
+
+Le cache est invalidé automatiquement : si la taille ou la date du CSV ont changé, l'empreinte est
+recalculée et, si le contenu diffère, les colonnes sont reconstruites. Un dossier de cache qui ne
+peut pas être écrit (support en lecture seule) n'empêche pas le chargement.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from action_loader import (ROW_INVALID, ROW_VALID, ParsedRows, load_action_table, read_action_frame,
+                           reasons_from_flags)
+from models.action import Action
+from models.action_table import ActionTable
+
+# Nom du dossier de cache, créé dans le dossier de chaque jeu de données
+CACHE_FOLDER_NAME = ".cache"
+# Version du format du cache : un cache d'une autre version est reconstruit
+CACHE_VERSION = 1
+# Taille des blocs lus pour calculer l'empreinte d'un fichier
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_digest(file_path: str) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_folder(file_path: str, fixed_point: bool = False, strip_names: bool = True) -> str:
+    """Dossier de cache d'un fichier pour un mode de calcul et de lecture des noms."""
+    folder, name = os.path.split(os.path.abspath(file_path))
+    mode = ("fixed" if fixed_point else "float") + ("" if strip_names else ".raw")
+    return os.path.join(folder, CACHE_FOLDER_NAME, f"{name}.{mode}")
+
+
+def read_manifest(folder: str) -> Optional[dict]:
+    """Manifeste d'un dossier de cache, None s'il est absent, illisible ou d'une autre version."""
+    try:
+        with open(os.path.join(folder, "manifest.json"), encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == CACHE_VERSION else None
+
+
+def write_manifest(folder: str, manifest: dict):
+    """Écrit le manifeste en remplaçant l'ancien d'un seul coup."""
+    path = os.path.join(folder, "manifest.json")
+    with open(path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def is_fresh(folder: str, manifest: Optional[dict], file_path: str, stat: os.stat_result) -> bool:
+    """
+    Vérifie que le cache correspond encore au fichier : même taille et même date, ou à défaut même
+    empreinte (fichier seulement « touché »), auquel cas la nouvelle date est notée dans le
+    manifeste.
+    """
+    if manifest is None or manifest['size'] != stat.st_size:
+        return False
+    if manifest['mtime_ns'] == stat.st_mtime_ns:
+        return True
+    if file_digest(file_path) != manifest['sha256']:
+        return False
+    manifest['mtime_ns'] = stat.st_mtime_ns
+    try:
+        write_manifest(folder, manifest)
+    except OSError:
+        pass
+    return True
+
+
+def invalid_actions_from(table: ActionTable, flags: np.ndarray) -> List[Tuple[Action, List[str]]]:
+    """Actions invalides et leurs raisons, d'après leur table et leurs codes de validation."""
+    codes = flags.tolist()
+    reasons = {code: reasons_from_flags(code) for code in set(codes)}
+    return [(action, list(reasons[code])) for action, code in zip(table.actions(), codes)]
+
+
+def write_cache(folder: str, manifest: dict, valid_table: ActionTable, invalid_table: ActionTable,
+                invalid_flags: np.ndarray):
+    """Écrit le cache dans un dossier temporaire, puis le met en place à la place de l'ancien."""
+    building = folder + ".building"
+    shutil.rmtree(building, ignore_errors=True)
+    os.makedirs(os.path.join(building, "valid"))
+    os.makedirs(os.path.join(building, "invalid"))
+    valid_table.save(os.path.join(building, "valid"))
+    invalid_table.save(os.path.join(building, "invalid"))
+    np.save(os.path.join(building, "invalid_flags.npy"), invalid_flags)
+    write_manifest(building, manifest)
+    shutil.rmtree(folder, ignore_errors=True)
+    os.replace(building, folder)
+
+
+def load_cached_table(file_path: str, fixed_point: bool = False,
+                      strip_names: bool = True
+                      ) -> Tuple[ActionTable, List[Tuple[Action, List[str]]], List[str]]:
+    """
+    Comme `action_loader.load_action_table`, en passant par le cache : les colonnes des actions
+    valides sont projetées en mémoire depuis le cache s'il est à jour, sinon le CSV est converti
+    et le cache (re)construit.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return load_action_table(file_path, fixed_point, strip_names)
+
+    folder = cache_folder(file_path, fixed_point, strip_names)
+    manifest = read_manifest(folder)
+    if is_fresh(folder, manifest, file_path, stat):
+        try:
+            valid_table = ActionTable.load(os.path.join(folder, "valid"), fixed_point)
+            invalid_table = ActionTable.load(os.path.join(folder, "invalid"), fixed_point,
+                                             mmap=False)
+            invalid_flags = np.load(os.path.join(folder, "invalid_flags.npy"))
+            invalid_actions = invalid_actions_from(invalid_table, invalid_flags)
+            return valid_table, invalid_actions, manifest['errors']
+        except (OSError, ValueError):
+            # Cache incomplet ou abîmé : on le reconstruit
+            pass
+
+    try:
+        data = read_action_frame(file_path)
+        if data.shape[1] < 3:
+            raise ValueError(
+                "Le fichier CSV doit contenir au moins trois colonnes : nom, coût, et bénéfice."
+            )
+        parsed = ParsedRows(data, fixed_point=fixed_point, strip_names=strip_names)
+    except Exception:
+        parsed = None
+    if parsed is None or parsed.failure is not None:
+        # Chargement interrompu : pas de cache, les messages d'erreur sont ceux du chargement direct
+        return load_action_table(file_path, fixed_point, strip_names)
+
+    valid_table = parsed.table(parsed.rows(ROW_VALID))
+    invalid_rows = parsed.rows(ROW_INVALID)
+    invalid_table = parsed.table(invalid_rows)
+    invalid_flags = parsed.flags[invalid_rows]
+    errors = parsed.error_messages()
+    manifest = {
+        'version': CACHE_VERSION,
+        'source': os.path.abspath(file_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': file_digest(file_path),
+        'errors': errors
+    }
+    try:
+        write_cache(folder, manifest, valid_table, invalid_table, invalid_flags)
+    except OSError:
+        pass
+    return valid_table, invalid_actions_from(invalid_table, invalid_flags), errors
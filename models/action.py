@@ -3,20 +3,75 @@ Classe Action représentant une action d'investissement avec ses méthodes de ca
 et de validation associées.
 """
 
-from typing import List
+import gc
+from typing import Iterable, List
+
+# Millionièmes d'euro par euro : unité exacte d'un bénéfice (centimes × centièmes de pourcent)
+MICROS_PER_EURO = 1_000_000
+
+
+def to_cents(value: float) -> int:
+    """Convertit un montant en euros (ou un pourcentage) en centièmes entiers."""
+    return int(round(value * 100))
 
 
 class Action:
 
+    # Attributs fixes (pas de __dict__) : un objet plus petit et un accès plus direct, ce qui compte
+    # quand on en manipule des centaines de milliers ou qu'on en crée comme vues d'une ActionTable
+    __slots__ = ('name', 'fixed_point', 'max_quantity', 'risk', 'cost_cents', 'benefit_micros',
+                 'cost', 'benefit_percent', 'benefit', 'ratio')
+
     # Initialisation
-    def __init__(self, name: str, cost: float, benefit_percent: float):
-        """Initialise une action avec son nom, coût et pourcentage de bénéfice."""
+    def __init__(self, name: str, cost: float, benefit_percent: float, fixed_point: bool = False,
+                 max_quantity: int = 1, risk: float = 0.0):
+        """
+        Initialise une action avec son nom, coût et pourcentage de bénéfice.
+
+        `max_quantity` est le nombre maximal de parts achetables (1 par défaut). Le coût et le
+        bénéfice restent ceux d'une seule part ; seul le solveur borné en achète plusieurs.
+        `risk` est un score de risque facultatif, seconde ressource du solveur à deux dimensions.
+
+        En mode virgule fixe (`fixed_point`), le coût est converti une fois pour toutes en centimes
+        et le bénéfice en millionièmes d'euro, et tous les calculs se font sur ces entiers exacts.
+        """
         self.name = name
+        self.fixed_point = fixed_point
+        self.max_quantity = max_quantity
+        self.risk = risk
+        if fixed_point:
+            self.cost_cents = to_cents(cost)
+            self.benefit_micros = self.cost_cents * to_cents(benefit_percent)
+            cost = self.cost_cents / 100
+            benefit_percent = to_cents(benefit_percent) / 100
         self.cost = cost
         self.benefit_percent = benefit_percent
         self.benefit = self.calculate_benefit()
         self.ratio = self.benefit / self.cost if self.cost > 0 else 0
 
+    @staticmethod
+    def from_columns(names: Iterable[str], costs: Iterable[float],
+                     benefit_percents: Iterable[float], fixed_point: bool,
+                     max_quantities: Iterable[int], risks: Iterable[float]) -> List['Action']:
+        """
+        Crée une action par ligne à partir de colonnes de même longueur (de préférence des listes).
+
+        Le ramasse-miettes cyclique est suspendu pendant la création : ces objets ne forment pas
+        de cycles, et ses passes répétées sur les objets déjà créés coûtaient plus que les
+        créations elles-mêmes.
+        """
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [
+                Action(name, cost, benefit_percent, fixed_point, max_quantity, risk)
+                for name, cost, benefit_percent, max_quantity, risk
+                in zip(names, costs, benefit_percents, max_quantities, risks)
+            ]
+        finally:
+            if enabled:
+                gc.enable()
+
     # Méthodes de calcul individuelles
     def calculate_cost(self) -> float:
         """Retourne le coût de l'action."""
@@ -24,6 +79,8 @@ class Action:
     
     def calculate_benefit(self) -> float:
         """Calcule le bénéfice en euros basé sur le pourcentage."""
+        if self.fixed_point:
+            return self.benefit_micros / MICROS_PER_EURO
         return (self.cost * self.benefit_percent) / 100.0
 
     # Méthodes de validation individuelles
@@ -32,6 +89,10 @@ class Action:
         try:
             if not isinstance(self.cost, (int, float)) or not isinstance(self.benefit_percent, (int, float)):
                 return False
+            if not isinstance(self.max_quantity, int):
+                return False
+            if self.max_quantity < 1 or self.risk < 0:
+                return False
             return self.cost > 0 and self.benefit_percent > 0
         except (TypeError, ValueError):
             return False
@@ -42,29 +103,60 @@ class Action:
         
         if not isinstance(self.cost, (int, float)) or not isinstance(self.benefit_percent, (int, float)):
             return ["Format invalide"]
+        if not isinstance(self.max_quantity, int):
+            return ["Format invalide"]
         
         if self.cost <= 0:
             reasons.append("Coût <= 0")
         if self.benefit_percent <= 0:
             reasons.append("Bénéfice % <= 0")
+        if self.max_quantity < 1:
+            reasons.append("Quantité maximale < 1")
+        if self.risk < 0:
+            reasons.append("Risque < 0")
             
         return reasons
 
 
     # Méthodes de calcul pour portefeuille
+    # Un portefeuille est en virgule fixe si ses actions le sont (on ne mélange pas les deux modes)
     @staticmethod
     def total_portfolio_cost(actions: List['Action']) -> float:
         """Calcule le coût total d'un portefeuille d'actions."""
+        if actions and actions[0].fixed_point:
+            return Action.total_portfolio_cost_cents(actions) / 100
         return sum(action.calculate_cost() for action in actions)
 
     @staticmethod
     def total_portfolio_benefit(actions: List['Action']) -> float:
         """Calcule le bénéfice total d'un portefeuille d'actions."""
+        if actions and actions[0].fixed_point:
+            return Action.total_portfolio_benefit_micros(actions) / MICROS_PER_EURO
         return sum(action.calculate_benefit() for action in actions)
 
+    @staticmethod
+    def total_portfolio_cost_cents(actions: List['Action']) -> int:
+        """Calcule le coût total exact d'un portefeuille d'actions en virgule fixe, en centimes."""
+        return sum(action.cost_cents for action in actions)
+
+    @staticmethod
+    def total_portfolio_benefit_micros(actions: List['Action']) -> int:
+        """
+        Calcule le bénéfice total exact d'un portefeuille d'actions en virgule fixe, en millionièmes
+        d'euro.
+        """
+        return sum(action.benefit_micros for action in actions)
+
+    @staticmethod
+    def total_portfolio_risk(actions: List['Action']) -> float:
+        """Calcule le risque total d'un portefeuille d'actions."""
+        return sum(action.risk for action in actions)
+
     @staticmethod
     def is_portfolio_within_budget(actions: List['Action'], max_budget: float) -> bool:
         """Vérifie si le portefeuille respecte le budget maximum."""
+        if actions and actions[0].fixed_point:
+            return Action.total_portfolio_cost_cents(actions) <= to_cents(max_budget)
         return Action.total_portfolio_cost(actions) <= max_budget
 
     # Représentation
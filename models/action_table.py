@@ -0,0 +1,196 @@
+"""
+Table d'actions en colonnes (struct of arrays) : une alternative compacte aux listes d'Action.
+
+Chaque caractéristique est un tableau NumPy (noms encodés en UTF-8, coût, pourcentage de
+bénéfice, bénéfice, ratio, et facultativement quantité maximale et risque). Une action n'est plus
+qu'un indice : tri, filtres et totaux de portefeuille se font sur des tableaux d'indices, et un
+univers d'un million d'actions tient en quelques dizaines de MB et se trie d'un seul `argsort`.
+`action(i)` crée à la demande une `Action` équivalente pour le code qui attend des objets.
+"""
+
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from models.action import MICROS_PER_EURO, Action
+
+# Colonnes de la table, dans l'ordre (benefit_micros n'existe qu'en virgule fixe, les deux
+# dernières sont facultatives)
+COLUMNS = ('names', 'cost', 'benefit_percent', 'benefit', 'ratio', 'benefit_micros',
+           'max_quantities', 'risks')
+
+
+class ActionTable:
+    """Actions stockées en colonnes, repérées par leur indice."""
+
+    def __init__(self, names, costs, benefit_percents, fixed_point: bool = False,
+                 max_quantities=None, risks=None):
+        """
+        Construit la table à partir de séquences de même longueur (listes ou tableaux NumPy).
+
+        Comme pour `Action`, le mode `fixed_point` arrondit coûts et pourcentages au centième et
+        calcule les bénéfices en entiers exacts (millionièmes d'euro) avant de les convertir en
+        euros.
+        """
+        if isinstance(names, np.ndarray) and names.dtype.kind == 'S':
+            self.names = names
+        else:
+            self.names = np.array([str(name).encode('utf-8') for name in names], dtype=np.bytes_)
+        self.fixed_point = fixed_point
+        self.cost = np.asarray(costs, dtype=np.float64)
+        self.benefit_percent = np.asarray(benefit_percents, dtype=np.float64)
+        if fixed_point:
+            self.cost = np.rint(self.cost * 100) / 100
+            self.benefit_percent = np.rint(self.benefit_percent * 100) / 100
+            percent_hundredths = np.rint(self.benefit_percent * 100).astype(np.int64)
+            self.benefit_micros = self.cents() * percent_hundredths
+            self.benefit = self.benefit_micros / MICROS_PER_EURO
+        else:
+            self.benefit_micros = None
+            self.benefit = self.cost * self.benefit_percent / 100.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.ratio = np.where(self.cost > 0, self.benefit / self.cost, 0.0)
+        self.max_quantities = None
+        if max_quantities is not None:
+            self.max_quantities = np.asarray(max_quantities, dtype=np.int64)
+        self.risks = None if risks is None else np.asarray(risks, dtype=np.float64)
+
+    @classmethod
+    def from_actions(cls, actions: List[Action]) -> 'ActionTable':
+        """Construit la table à partir d'une liste d'actions."""
+        return cls(
+            [action.name for action in actions],
+            [action.cost for action in actions],
+            [action.benefit_percent for action in actions],
+            fixed_point=bool(actions) and actions[0].fixed_point,
+            max_quantities=[action.max_quantity for action in actions],
+            risks=[action.risk for action in actions]
+        )
+
+    @classmethod
+    def concatenate(cls, tables: List['ActionTable']) -> 'ActionTable':
+        """Table des lignes de `tables` mises bout à bout (même mode de calcul pour toutes)."""
+        table = object.__new__(cls)
+        table.fixed_point = tables[0].fixed_point
+        for column in COLUMNS:
+            values = [getattr(part, column) for part in tables]
+            missing = any(value is None for value in values)
+            setattr(table, column, None if missing else np.concatenate(values))
+        return table
+
+    def save(self, folder: str):
+        """
+        Enregistre chaque colonne dans un fichier `<colonne>.npy` du dossier `folder` (qui doit
+        exister).
+        """
+        for column in COLUMNS:
+            values = getattr(self, column)
+            if values is not None:
+                np.save(os.path.join(folder, f"{column}.npy"), values)
+
+    @classmethod
+    def load(cls, folder: str, fixed_point: bool = False, mmap: bool = True) -> 'ActionTable':
+        """
+        Relit une table enregistrée par `save`. Avec `mmap`, les colonnes sont projetées en mémoire
+        (lecture seule, sans copie) : seules les pages réellement lues sont chargées.
+        """
+        table = object.__new__(cls)
+        table.fixed_point = fixed_point
+        for column in COLUMNS:
+            path = os.path.join(folder, f"{column}.npy")
+            values = None
+            if os.path.exists(path):
+                values = np.load(path, mmap_mode='r' if mmap else None)
+            setattr(table, column, values)
+        return table
+
+    def __len__(self) -> int:
+        """Nombre d'actions de la table."""
+        return self.cost.size
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les colonnes, en octets."""
+        columns = [getattr(self, column) for column in COLUMNS]
+        return sum(column.nbytes for column in columns if column is not None)
+
+    # Accès aux actions
+    def name(self, index: int) -> str:
+        """Nom de l'action `index`."""
+        return self.names[index].decode('utf-8')
+
+    def action(self, index: int) -> Action:
+        """Action équivalente à la ligne `index`, pour le code qui manipule des objets."""
+        return Action(
+            self.name(index), float(self.cost[index]), float(self.benefit_percent[index]),
+            fixed_point=self.fixed_point,
+            max_quantity=1 if self.max_quantities is None else int(self.max_quantities[index]),
+            risk=0.0 if self.risks is None else float(self.risks[index])
+        )
+
+    def actions(self, indices: Optional[np.ndarray] = None) -> List[Action]:
+        """Actions des lignes `indices` (toutes si None), dans cet ordre."""
+        if indices is None:
+            indices = np.arange(len(self))
+        count = len(indices)
+        quantities = [1] * count
+        if self.max_quantities is not None:
+            quantities = self.max_quantities[indices].tolist()
+        risks = [0.0] * count if self.risks is None else self.risks[indices].tolist()
+        return Action.from_columns(
+            [name.decode('utf-8') for name in self.names[indices].tolist()],
+            self.cost[indices].tolist(), self.benefit_percent[indices].tolist(),
+            self.fixed_point, quantities, risks
+        )
+
+    def take(self, indices: np.ndarray) -> 'ActionTable':
+        """Sous-table des lignes `indices`, sans recalcul des colonnes dérivées."""
+        table = object.__new__(ActionTable)
+        table.fixed_point = self.fixed_point
+        for column in COLUMNS:
+            values = getattr(self, column)
+            setattr(table, column, None if values is None else values[indices])
+        return table
+
+    # Colonnes dérivées, validation et tri
+    def cents(self) -> np.ndarray:
+        """Coûts en centimes entiers."""
+        return np.rint(self.cost * 100).astype(np.int64)
+
+    def valid_mask(self) -> np.ndarray:
+        """Masque des actions valides, selon les mêmes critères que `Action.is_valid`."""
+        mask = np.isfinite(self.cost) & np.isfinite(self.benefit_percent)
+        mask &= (self.cost > 0) & (self.benefit_percent > 0)
+        if self.max_quantities is not None:
+            mask &= self.max_quantities >= 1
+        if self.risks is not None:
+            mask &= self.risks >= 0
+        return mask
+
+    def sort_by_ratio(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Indices triés par ratio bénéfice/coût décroissant (tri stable), parmi `indices` ou toute la
+        table.
+        """
+        if indices is None:
+            return np.argsort(-self.ratio, kind='stable')
+        indices = np.asarray(indices)
+        return indices[np.argsort(-self.ratio[indices], kind='stable')]
+
+    # Totaux de portefeuille
+    def total_cost(self, indices: np.ndarray) -> float:
+        """Coût total du portefeuille formé des lignes `indices`."""
+        if self.fixed_point:
+            return int(self.cents()[indices].sum()) / 100
+        return float(self.cost[indices].sum())
+
+    def total_benefit(self, indices: np.ndarray) -> float:
+        """Bénéfice total du portefeuille formé des lignes `indices`."""
+        if self.fixed_point:
+            return int(self.benefit_micros[indices].sum()) / MICROS_PER_EURO
+        return float(self.benefit[indices].sum())
+
+    def is_within_budget(self, indices: np.ndarray, max_budget: float) -> bool:
+        """Vérifie si le portefeuille formé des lignes `indices` respecte le budget maximum."""
+        return int(self.cents()[indices].sum()) <= int(round(max_budget * 100))
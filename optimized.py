@@ -5,16 +5,33 @@ import time
 import webbrowser
 
 import dash_bootstrap_components as dbc
-import pandas as pd
 import plotly.graph_objs as go
 from dash import Dash, dash_table, dcc, html
 from dash.dependencies import Input, Output, State
 from InquirerPy import prompt
 
-from models.action import Action
+from action_loader import ROW_INVALID, ROW_VALID, ParsedRows, is_parquet, read_action_frame
+from dataset_cache import load_cached_table
+from models.action import MICROS_PER_EURO, Action, to_cents
+from solvers.bounded import count_quantities, knapsack_bounded
+from solvers.branch_and_bound import branch_and_bound, top_k_portfolios
+from solvers.cardinality import knapsack_cardinality
+from solvers.dispatcher import solve_auto
+from solvers.dynamic_programming import BudgetCurve, knapsack_dp
+from solvers.fptas import FPTAS_EPSILON, knapsack_fptas
+from solvers.incremental import IncrementalOptimizer
+from solvers.local_search import greedy_local_search
+from solvers.reduction import reduce_instance
+from solvers.two_dimensional import knapsack_2d
 
 WALLET = 500
 DATA_FOLDER = "data"
+# Nombre de portefeuilles alternatifs proposés, et limites (nœuds, secondes) de leur recherche
+TOP_K = 10
+TOP_K_MAX_NODES = 2_000_000
+TOP_K_TIME_LIMIT = 2.0
+# Arithmétique exacte en centimes entiers pour les prix et bénéfices (désactivée par défaut)
+FIXED_POINT = False
 
 # Décisions d'achat de Sienna
 SIENNA_DECISIONS = {
@@ -29,37 +46,69 @@ SIENNA_DECISIONS = {
 }
 
 
-def load_actions(file_path: str) -> tuple[list[Action], list[Action], list[str]]:
-    """Charge et valide les actions depuis un fichier CSV."""
+def load_actions(file_path: str, fixed_point: bool = False
+                 ) -> tuple[list[Action], list[Action], list[str]]:
+    """
+    Charge et valide les actions depuis un fichier CSV (en centimes entiers si `fixed_point`).
+    Des colonnes facultatives « quantity » (ou « quantité », « qty ») et « risk » (ou « risque »)
+    donnent la quantité maximale achetable et le score de risque de chaque action.
+    """
     try:
-        data = pd.read_csv(file_path, header=0)
+        data = read_action_frame(file_path)
         if data.shape[1] < 3:
             raise ValueError("Le fichier CSV doit contenir au moins trois colonnes : nom, coût, et bénéfice.")
 
-        valid_actions = []
-        invalid_actions = []
-        errors = []
-        
-        for _, row in data.iterrows():
-            try:
-                name = row.iloc[0]
-                cost = float(row.iloc[1])
-                benefit_percent = float(str(row.iloc[2]).strip('%'))
-                
-                action = Action(name, cost, benefit_percent)
-                if action.is_valid():
-                    valid_actions.append(action)
-                else:
-                    invalid_actions.append(action)
-                    errors.append(f"Action invalide {name}: {', '.join(action.get_invalid_reasons())}")
-            
-            except ValueError as e:
-                errors.append(f"Erreur de conversion pour {name}: {e}")
-                
+        # Conversion et validation colonne par colonne, les noms restant tels quels
+        parsed = ParsedRows(data, fixed_point=fixed_point, strip_names=False)
+        if parsed.failure is not None:
+            raise parsed.failure
+        valid_actions = parsed.actions(parsed.rows(ROW_VALID))
+        invalid_actions = parsed.actions(parsed.rows(ROW_INVALID))
+        errors = parsed.error_messages(include_invalid=True)
         return valid_actions, invalid_actions, errors
     except Exception as e:
         return [], [], [f"Erreur lors du chargement du fichier: {str(e)}"]
 
+
+# Jeux de données déjà chargés et triés, indexés par (chemin, date de modification)
+DATASET_CACHE = {}
+
+
+def load_dataset(file_path: str) -> tuple[list[Action], list[Action]]:
+    """
+    Charge un jeu de données trié par ratio, en le réutilisant tant que le fichier n'a pas changé.
+    Hors de ce processus, les colonnes converties sont relues depuis le cache binaire (voir
+    dataset_cache).
+    """
+    key = (file_path, os.path.getmtime(file_path), FIXED_POINT)
+    if key not in DATASET_CACHE:
+        valid_table, invalid_actions, _ = load_cached_table(
+            file_path, fixed_point=FIXED_POINT, strip_names=False
+        )
+        valid_actions = valid_table.actions(valid_table.sort_by_ratio())
+        DATASET_CACHE[key] = (valid_actions, [action for action, _ in invalid_actions])
+    return DATASET_CACHE[key]
+
+
+# Portefeuilles alternatifs déjà calculés, indexés par fichier, date de modification et budget
+TOP_K_CACHE = {}
+
+
+def get_alternatives(file_path: str, actions: list[Action], wallet: float):
+    """
+    Renvoie les meilleurs portefeuilles alternatifs et si leur recherche est allée au bout,
+    recalculés seulement quand le fichier ou le budget change.
+    """
+    key = (file_path, os.path.getmtime(file_path), FIXED_POINT, wallet)
+    if key not in TOP_K_CACHE:
+        stats = {}
+        portfolios, _ = top_k_portfolios(
+            actions, wallet, TOP_K,
+            max_nodes=TOP_K_MAX_NODES, stats=stats, time_limit=TOP_K_TIME_LIMIT
+        )
+        TOP_K_CACHE[key] = (portfolios, stats['complete'])
+    return TOP_K_CACHE[key]
+
 def measure_performance(actions: list[Action], wallet: float):
     n_values = []
     cumulative_times = []
@@ -69,15 +118,23 @@ def measure_performance(actions: list[Action], wallet: float):
     selected_actions = []
     cumulative_time = 0
     first_time = None
+    # En virgule fixe, les cumuls se font en entiers exacts et ne sont convertis en euros qu'à la
+    # fin
+    fixed_point = bool(actions) and actions[0].fixed_point
+    capacity = to_cents(wallet) if fixed_point else wallet
 
     for n in range(1, len(actions) + 1):
         current_action = actions[n-1]
         start_time = time.time()
         
-        if total_cost + current_action.cost <= wallet:
+        cost = current_action.cost_cents if fixed_point else current_action.cost
+        if total_cost + cost <= capacity:
             selected_actions.append(current_action)
-            total_cost += current_action.cost
-            total_benefit += current_action.benefit
+            total_cost += cost
+            if fixed_point:
+                total_benefit += current_action.benefit_micros
+            else:
+                total_benefit += current_action.benefit
 
         end_time = time.time()
         
@@ -94,8 +151,448 @@ def measure_performance(actions: list[Action], wallet: float):
         cumulative_times.append(cumulative_time)
         memories.append(memory_used)
 
+    if fixed_point:
+        total_cost /= 100
+        total_benefit /= MICROS_PER_EURO
     return selected_actions, total_cost, total_benefit, cumulative_times, memories, n_values
 
+
+def reduction_details(reduced) -> dict:
+    """Résume la réduction d'instance pour la carte de détails du moteur"""
+    stats = reduced.stats
+    return {
+        "Variables retirées par la réduction": f"{reduced.removed_count} sur {stats['original']}",
+        "Hors budget / dominées": f"{stats['over_budget']} / {stats['dominated']}",
+        "Fusionnées / fixées": f"{stats['merged']} / {stats['fixed_in'] + stats['fixed_out']}"
+    }
+
+
+def measure_dp_performance(actions: list[Action], wallet: float, reconstruction: str = "packed"):
+    """
+    Exécute la programmation dynamique exacte sur l'instance réduite et renvoie les mêmes mesures
+    que le Greedy
+    """
+    reduced = reduce_instance(actions, wallet)
+    history = []
+    start_time = time.time()
+    selection, _, _, memory_used = knapsack_dp(
+        reduced.actions, reduced.max_budget, history, reconstruction
+    )
+    elapsed_time = (time.time() - start_time) * 1000
+    selected_actions = reduced.expand(selection)
+    total_cost = Action.total_portfolio_cost(selected_actions)
+    total_benefit = Action.total_portfolio_benefit(selected_actions)
+
+    details = reduction_details(reduced)
+
+    if not history:
+        return (
+            selected_actions, total_cost, total_benefit,
+            [elapsed_time], [memory_used], [len(reduced.actions)], details
+        )
+
+    cumulative_times = [elapsed for elapsed, _ in history]
+    memories = [memory for _, memory in history]
+    n_values = list(range(1, len(history) + 1))
+
+    return (
+        selected_actions, total_cost, total_benefit,
+        cumulative_times, memories, n_values, details
+    )
+
+
+def measure_dp_hirschberg_performance(actions: list[Action], wallet: float):
+    """Programmation dynamique exacte avec reconstruction en mémoire O(W)"""
+    return measure_dp_performance(actions, wallet, "hirschberg")
+
+
+def measure_bb_performance(actions: list[Action], wallet: float):
+    """
+    Exécute le branch-and-bound exact sur l'instance réduite et renvoie les mêmes mesures que le
+    Greedy
+    """
+    start_time = time.time()
+    reduced = reduce_instance(actions, wallet)
+    selection, _, _, memory_used = branch_and_bound(reduced.actions, reduced.max_budget)
+    selected_actions = reduced.expand(selection)
+    elapsed_time = (time.time() - start_time) * 1000
+
+    total_cost = Action.total_portfolio_cost(selected_actions)
+    total_benefit = Action.total_portfolio_benefit(selected_actions)
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)], reduction_details(reduced)
+    )
+
+
+def measure_bounded_performance(actions: list[Action], wallet: float):
+    """
+    Exécute le sac à dos borné (plusieurs parts par action) et renvoie les mêmes mesures que le
+    Greedy
+    """
+    start_time = time.time()
+    selected_actions, total_cost, total_benefit, memory_used = knapsack_bounded(actions, wallet)
+    elapsed_time = (time.time() - start_time) * 1000
+
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)]
+    )
+
+
+def measure_cardinality_performance(actions: list[Action], wallet: float, min_count: int = 0,
+                                    max_count: int = None, min_position: float = 0.0):
+    """
+    Exécute le solveur sous contraintes de nombre d'actions et de position minimale, avec les
+    mesures du Greedy
+    """
+    upper = max_count if max_count is not None else 'illimité'
+    details = {
+        "Nombre d'actions autorisé": f"{min_count} à {upper}",
+        "Position minimale": f"{min_position:.2f}€"
+    }
+    start_time = time.time()
+    try:
+        selected_actions, total_cost, total_benefit, memory_used = knapsack_cardinality(
+            actions, wallet, min_count, max_count, min_position
+        )
+    except ValueError as error:
+        details["Erreur"] = str(error)
+        return [], 0.0, 0.0, [0.0], [0.0], [len(actions)], details
+    elapsed_time = (time.time() - start_time) * 1000
+
+    details["Actions retenues"] = (
+        f"{len(selected_actions)}" if selected_actions or min_count == 0
+        else "aucune sélection ne respecte les contraintes"
+    )
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)], details
+    )
+
+
+def measure_risk_performance(actions: list[Action], wallet: float, max_risk: float = None):
+    """
+    Exécute le sac à dos à deux dimensions (budget et risque) et renvoie les mesures du Greedy,
+    plus la méthode retenue
+    """
+    if max_risk is None:
+        max_risk = Action.total_portfolio_risk(actions)
+    stats = {}
+    selected_actions, total_cost, total_benefit, memory_used = knapsack_2d(
+        actions, wallet, max_risk, stats=stats
+    )
+
+    total_risk = Action.total_portfolio_risk(selected_actions)
+    details = {
+        "Risque total": f"{total_risk:.2f} sur {max_risk:.2f} autorisés",
+        "Méthode": stats['method'] + (" (optimale)" if stats['optimal'] else ""),
+        "Borne supérieure lagrangienne": f"{stats['upper_bound']:.2f}€",
+        "États de Pareto (maximum)": f"{stats['states']}"
+    }
+    return (
+        selected_actions, total_cost, total_benefit,
+        [stats['elapsed'] * 1000], [memory_used], [len(actions)], details
+    )
+
+
+# Optimiseurs incrémentaux par fichier : seules les lignes modifiées depuis l'appel précédent
+# sur le même fichier sont recalculées
+INCREMENTAL_STATE = {}
+
+
+def measure_incremental_performance(actions: list[Action], wallet: float, file_path: str = None):
+    """
+    Ré-optimise incrémentalement à partir de l'état précédent du même fichier et renvoie les
+    mesures du Greedy, plus les opérations appliquées
+    """
+    start_time = time.time()
+    optimizer = INCREMENTAL_STATE.get(file_path)
+    if optimizer is None:
+        optimizer = IncrementalOptimizer(actions, wallet)
+        INCREMENTAL_STATE[file_path] = optimizer
+        operations = len(actions)
+    else:
+        optimizer.set_budget(wallet)
+        operations = optimizer.sync(actions)
+    rows_before = optimizer.recomputed_rows
+    selected_actions, total_cost, total_benefit, memory_used = optimizer.selection()
+    elapsed_time = (time.time() - start_time) * 1000
+
+    recomputed = optimizer.recomputed_rows - rows_before
+    details = {
+        "Opérations appliquées": f"{operations}",
+        "Actions recalculées": f"{recomputed} sur {len(optimizer.items)}"
+    }
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)], details
+    )
+
+
+# Courbes budget/bénéfice déjà calculées, indexées par fichier et date de modification, avec le
+# message d'erreur quand la courbe dépasse la limite de mémoire
+CURVE_CACHE = {}
+
+
+def get_budget_curve(file_path: str, actions: list[Action], wallet: float):
+    """
+    Renvoie la courbe budget/bénéfice du fichier et un message d'erreur, recalculée seulement si
+    le fichier change ou si le budget dépasse sa plage ; la courbe est None, avec le message, si
+    elle occuperait trop de mémoire. Sans fichier, la courbe est calculée sans être gardée
+    """
+    def build():
+        try:
+            return BudgetCurve(actions, max(wallet, WALLET)), None
+        except ValueError as error:
+            return None, str(error)
+
+    if file_path is None:
+        return build()
+    key = (file_path, os.path.getmtime(file_path), FIXED_POINT)
+    cached, _ = CURVE_CACHE.get(key, (False, None))
+    if cached is False or (cached is not None and cached.max_budget < wallet):
+        CURVE_CACHE[key] = build()
+    return CURVE_CACHE[key]
+
+
+def measure_curve_performance(actions: list[Action], wallet: float, file_path: str = None):
+    """
+    Lit la sélection optimale sur la courbe budget/bénéfice et renvoie les mêmes mesures que le
+    Greedy ; si la courbe est trop grande, se rabat sur la programmation dynamique en mémoire O(W)
+    """
+    start_time = time.time()
+    curve, error = get_budget_curve(file_path, actions, wallet)
+    if curve is None:
+        details = {
+            "Courbe budget/bénéfice": "trop grande, résolution pour ce seul budget",
+            "Erreur": error
+        }
+        return measure_dp_hirschberg_performance(actions, wallet)[:6] + (details,)
+    selected_actions = curve.selection(wallet)
+    elapsed_time = (time.time() - start_time) * 1000
+
+    total_cost = Action.total_portfolio_cost(selected_actions)
+    total_benefit = Action.total_portfolio_benefit(selected_actions)
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [curve.memory_used], [len(actions)]
+    )
+
+
+def measure_fptas_performance(actions: list[Action], wallet: float, epsilon: float = FPTAS_EPSILON):
+    """
+    Exécute le schéma d'approximation (FPTAS) et renvoie les mesures du Greedy, plus la garantie
+    atteinte
+    """
+    start_time = time.time()
+    try:
+        selected_actions, total_cost, total_benefit, memory_used, upper_bound = knapsack_fptas(
+            actions, wallet, epsilon
+        )
+    except ValueError as error:
+        return [], 0.0, 0.0, [0.0], [0.0], [len(actions)], {"Erreur": str(error)}
+    elapsed_time = (time.time() - start_time) * 1000
+
+    reached = total_benefit / upper_bound * 100 if upper_bound > 0 else 100
+    details = {
+        "Borne supérieure de l'optimum": f"{upper_bound:.2f}€",
+        "Garantie atteinte": f"{reached:.2f}% de l'optimum",
+        "Garantie demandée": f"{(1 - epsilon) * 100:.2f}% de l'optimum (ε = {epsilon})"
+    }
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)], details
+    )
+
+
+def measure_local_search_performance(actions: list[Action], wallet: float):
+    """
+    Exécute le Greedy amélioré par recherche locale et renvoie les mesures du Greedy, plus le gain
+    obtenu
+    """
+    stats = {}
+    selected_actions, total_cost, total_benefit, memory_used = greedy_local_search(
+        actions, wallet, stats=stats
+    )
+
+    details = {}
+    if stats:
+        initial_benefit = f"{stats['initial_benefit']:.2f}€"
+        details = {
+            "Bénéfice initial (Greedy ou meilleure action seule)": initial_benefit,
+            "Gain de la recherche locale": f"{total_benefit - stats['initial_benefit']:.2f}€",
+            "Mouvements appliqués": f"{stats['moves']}"
+        }
+        elapsed_time = stats['elapsed'] * 1000
+    else:
+        elapsed_time = 0
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)], details
+    )
+
+
+def measure_auto_performance(actions: list[Action], wallet: float):
+    """
+    Laisse le répartiteur choisir le moteur et renvoie les mesures du Greedy, plus la raison du
+    choix
+    """
+    decision = {}
+    start_time = time.time()
+    selected_actions, total_cost, total_benefit, memory_used = solve_auto(
+        actions, wallet, decision=decision
+    )
+    elapsed_time = (time.time() - start_time) * 1000
+
+    details = {
+        "Moteur retenu": decision['label'],
+        "Raison": decision['reason'],
+        "Actions après réduction": f"{decision['reduced_count']} sur {len(actions)}",
+        "Moteurs écartés": ", ".join(decision['rejected']) or "aucun"
+    }
+    return (
+        selected_actions, total_cost, total_benefit,
+        [elapsed_time], [memory_used], [len(actions)], details
+    )
+
+
+# Moteurs de résolution sélectionnables depuis le dashboard ; « constrained » signale un problème
+# différent du sac à dos 0/1, pour lequel les portefeuilles alternatifs ne s'appliquent pas
+ENGINES = {
+    "greedy": {
+        "label": "Greedy (heuristique)",
+        "run": measure_performance,
+        "time_complexity": "O(n)",
+        "space_complexity": "O(n)",
+        "description": (
+            "Parcourt les actions par ratio bénéfice/coût décroissant et prend chacune tant "
+            "qu'elle tient dans le budget : très rapide, mais sans garantie d'optimalité."
+        )
+    },
+    "local_search": {
+        "label": "Greedy + recherche locale (heuristique)",
+        "run": measure_local_search_performance,
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(n)",
+        "description": (
+            "Part du meilleur entre le Greedy et la meilleure action seule, puis applique des "
+            "ajouts et des échanges d'une ou deux actions tant qu'ils améliorent le bénéfice, dans "
+            "un temps borné."
+        )
+    },
+    "dp": {
+        "label": "Programmation dynamique (exacte)",
+        "run": measure_dp_performance,
+        "time_complexity": "O(n×W)",
+        "space_complexity": "O(n×W/8)",
+        "description": (
+            "Programmation dynamique sur le budget en centimes : donne le portefeuille optimal, en "
+            "gardant une ligne de décisions compactée par action pour le reconstruire."
+        )
+    },
+    "dp_hirschberg": {
+        "label": "Programmation dynamique mémoire O(W) (exacte)",
+        "run": measure_dp_hirschberg_performance,
+        "time_complexity": "O(n×W)",
+        "space_complexity": "O(W)",
+        "description": (
+            "Même résultat optimal que la programmation dynamique classique, mais la "
+            "reconstruction par division (Hirschberg) ne garde que des lignes de taille W en "
+            "mémoire."
+        )
+    },
+    "bb": {
+        "label": "Branch-and-bound (exacte)",
+        "run": measure_bb_performance,
+        "time_complexity": "O(2ⁿ)",
+        "space_complexity": "O(n)",
+        "description": (
+            "Explore l'arbre des choix en écartant les branches dont la borne de Dantzig "
+            "(relaxation fractionnaire) ne peut pas battre la meilleure solution connue."
+        )
+    },
+    "bounded": {
+        "label": "Achats multiples, sac à dos borné (exacte)",
+        "constrained": True,
+        "run": measure_bounded_performance,
+        "time_complexity": "O(W×Σ log qᵢ)",
+        "space_complexity": "O(W×Σ log qᵢ/8)",
+        "description": (
+            "Chaque action peut être achetée plusieurs fois, jusqu'à sa quantité maximale ; les "
+            "quantités sont décomposées en lots binaires résolus comme un sac à dos 0/1."
+        )
+    },
+    "cardinality": {
+        "label": "Contraintes de conformité (exacte)",
+        "constrained": True,
+        "run": measure_cardinality_performance,
+        "options": ["min_count", "max_count", "min_position"],
+        "time_complexity": "O(n×K×W)",
+        "space_complexity": "O(K×W)",
+        "description": (
+            "Programmation dynamique qui respecte en plus un nombre minimal et maximal d'actions "
+            "et une part minimale du budget par position."
+        )
+    },
+    "risk": {
+        "label": "Budget et risque, sac à dos 2D (exacte)",
+        "constrained": True,
+        "run": measure_risk_performance,
+        "options": ["max_risk"],
+        "time_complexity": "O(n×états de Pareto)",
+        "space_complexity": "O(états de Pareto)",
+        "description": (
+            "Sac à dos à deux dimensions : le portefeuille optimal doit respecter le budget et un "
+            "plafond de risque cumulé ; seuls les états non dominés sont conservés."
+        )
+    },
+    "incremental": {
+        "label": "Programmation dynamique incrémentale (exacte)",
+        "run": measure_incremental_performance,
+        "options": ["file_path"],
+        "time_complexity": "O((n-k)×W) par modification",
+        "space_complexity": "O(n×W/8)",
+        "description": (
+            "Garde l'état de la programmation dynamique entre deux chargements du fichier et ne "
+            "recalcule que les actions situées après la première modification."
+        )
+    },
+    "curve": {
+        "label": "Courbe budget/bénéfice (exacte)",
+        "run": measure_curve_performance,
+        "options": ["file_path"],
+        "time_complexity": "O(n×W)",
+        "space_complexity": "O(n×W/8)",
+        "description": (
+            "Calcule en une passe le bénéfice optimal pour chaque budget jusqu'au budget choisi, "
+            "ce qui donne la courbe budget/bénéfice et les rendements marginaux."
+        )
+    },
+    "fptas": {
+        "label": "FPTAS (approchée à ε près)",
+        "run": measure_fptas_performance,
+        "options": ["epsilon"],
+        "time_complexity": "O(n log n + 1/ε⁴)",
+        "space_complexity": "O(n + 1/ε⁴)",
+        "description": (
+            "Arrondit les bénéfices pour borner la taille du problème : le bénéfice obtenu est "
+            "garanti à au moins (1 - ε) fois l'optimum."
+        )
+    },
+    "auto": {
+        "label": "Automatique (moteur exact le plus rapide)",
+        "run": measure_auto_performance,
+        "time_complexity": "selon le moteur",
+        "space_complexity": "selon le moteur",
+        "description": (
+            "Réduit d'abord le problème (actions dominées ou hors budget), puis choisit le moteur "
+            "exact le plus rapide d'après la taille du problème réduit."
+        )
+    }
+}
+DEFAULT_ENGINE = "greedy"
+
 def get_sienna_comparison(file_name: str, total_cost: float, total_benefit: float):
     """Calcule la comparaison avec les décisions de Sienna"""
     if file_name not in SIENNA_DECISIONS:
@@ -143,7 +640,52 @@ def create_data_controls(csv_files, selected_file):
                     )
                 ], className="pt-2 pb-2")
             ], className="h-100 shadow-sm")
-        ], width=6),
+        ], width=4),
+
+        # Sélection du moteur de résolution
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader([
+                    html.I(className="fas fa-cogs me-2"),
+                    html.H5("Algorithme", className="mb-0")
+                ], className="bg-black text-white border-bottom-0 d-flex align-items-center"),
+                dbc.CardBody([
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.Select(
+                                id='engine-selector',
+                                options=[
+                                    {'label': engine['label'], 'value': key}
+                                    for key, engine in ENGINES.items()
+                                ],
+                                value=DEFAULT_ENGINE,
+                                className="mb-0"
+                            )
+                        ], width=8),
+                        dbc.Col([
+                            dbc.InputGroup([
+                                dbc.InputGroupText("ε"),
+                                dbc.Input(
+                                    id='epsilon-input',
+                                    type='number',
+                                    value=FPTAS_EPSILON,
+                                    min=0.01,
+                                    max=0.999,
+                                    step=0.01
+                                )
+                            ])
+                        ], width=4)
+                    ], className="g-2 align-items-center"),
+                    dbc.Checklist(
+                        id='alternatives-toggle',
+                        options=[{'label': f"Top {TOP_K} des portefeuilles", 'value': 'show'}],
+                        value=[],
+                        switch=True,
+                        className="mt-1"
+                    )
+                ], className="pt-2 pb-2")
+            ], className="h-100 shadow-sm")
+        ], width=4),
         
         # Contrôle du Budget
         dbc.Col([
@@ -171,10 +713,40 @@ def create_data_controls(csv_files, selected_file):
                                 className="w-100"
                             )
                         ], width=3)
-                    ], className="g-2 align-items-center")
+                    ], className="g-2 align-items-center"),
+                    # Contraintes de conformité (moteur « Contraintes de conformité »)
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.InputGroup([
+                                dbc.InputGroupText("K min"),
+                                dbc.Input(id='min-count-input', type='number', min=0, step=1)
+                            ], size="sm")
+                        ], width=4),
+                        dbc.Col([
+                            dbc.InputGroup([
+                                dbc.InputGroupText("K max"),
+                                dbc.Input(id='max-count-input', type='number', min=0, step=1)
+                            ], size="sm")
+                        ], width=4),
+                        dbc.Col([
+                            dbc.InputGroup([
+                                dbc.InputGroupText("Pos. min €"),
+                                dbc.Input(id='min-position-input', type='number', min=0, step=1)
+                            ], size="sm")
+                        ], width=4)
+                    ], className="g-2 align-items-center mt-1"),
+                    # Budget de risque (moteur « Budget et risque »)
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.InputGroup([
+                                dbc.InputGroupText("Risque max"),
+                                dbc.Input(id='max-risk-input', type='number', min=0, step=0.1)
+                            ], size="sm")
+                        ], width=12)
+                    ], className="g-2 align-items-center mt-1")
                 ], className="pt-2 pb-2")
             ], className="h-100 shadow-sm")
-        ], width=6)
+        ], width=4)
     ], className="mb-4")
 
 def create_data_overview(valid_actions, invalid_actions, total_actions_count):
@@ -432,9 +1004,26 @@ def create_performance_card(title, value, description, icon, color, progress_val
             ])
         ])
     ], className="h-100 shadow-sm")
+
+
+def create_engine_details_card(engine_label, details):
+    """Crée la carte des informations propres au moteur de résolution (garanties, réductions...)"""
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="fas fa-info-circle me-2"),
+            engine_label
+        ], className="bg-black text-white d-flex align-items-center"),
+        dbc.CardBody([
+            html.Ul([
+                html.Li([html.Strong(f"{label} : "), value]) for label, value in details.items()
+            ], className="mb-0")
+        ])
+    ], className="shadow mb-4")
+
     # Composants de visualisation
 def create_cost_benefit_chart(selected_actions):
     """Crée le graphique coût-bénéfice"""
+    quantities = count_quantities(selected_actions)
     return dbc.Card([
         dbc.CardHeader([
             html.I(className="fas fa-chart-bar me-2"),
@@ -446,14 +1035,14 @@ def create_cost_benefit_chart(selected_actions):
                     'data': [
                         go.Bar(
                             name='Coût',
-                            x=[a.name for a in selected_actions],
-                            y=[a.cost for a in selected_actions],
+                            x=[a.name for a, _ in quantities],
+                            y=[a.cost * quantity for a, quantity in quantities],
                             marker_color='red'
                         ),
                         go.Bar(
                             name='Bénéfice',
-                            x=[a.name for a in selected_actions],
-                            y=[a.benefit for a in selected_actions],
+                            x=[a.name for a, _ in quantities],
+                            y=[a.benefit * quantity for a, quantity in quantities],
                             marker_color='green'
                         )
                     ],
@@ -472,6 +1061,58 @@ def create_cost_benefit_chart(selected_actions):
     ])
 
 
+def create_budget_curve_chart(curve, budget, step=10):
+    """Crée le graphique bénéfice optimal / budget, annoté du rendement marginal (prix fictif)"""
+    budgets, benefits, marginal_returns = curve.marginal_returns(step)
+    budget_benefit = curve.best_benefit(budget)
+    shadow_price = (budget_benefit - curve.best_benefit(budget - step)) / step
+
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="fas fa-chart-area me-2"),
+            "Bénéfice optimal selon le budget"
+        ], className="bg-black text-white"),
+        dbc.CardBody([
+            dcc.Graph(
+                figure={
+                    'data': [
+                        go.Scatter(
+                            name='Bénéfice optimal',
+                            x=budgets,
+                            y=benefits,
+                            mode='lines',
+                            line=dict(color='green')
+                        ),
+                        go.Bar(
+                            name=f'Rendement marginal (€ par € sur {step}€)',
+                            x=budgets,
+                            y=marginal_returns,
+                            yaxis='y2',
+                            marker_color='rgba(0, 0, 255, 0.3)'
+                        )
+                    ],
+                    'layout': go.Layout(
+                        title='Courbe budget/bénéfice',
+                        xaxis={'title': 'Budget (€)'},
+                        yaxis={'title': 'Bénéfice optimal (€)'},
+                        yaxis2={'title': 'Rendement marginal', 'overlaying': 'y', 'side': 'right'},
+                        annotations=[{
+                            'x': budget,
+                            'y': budget_benefit,
+                            'text': f"{budget_benefit:.2f}€ — prix fictif : {shadow_price:.3f}€/€",
+                            'showarrow': True,
+                            'arrowhead': 2
+                        }],
+                        legend={'orientation': 'h', 'y': -0.2},
+                        plot_bgcolor='white',
+                        paper_bgcolor='white',
+                        height=400
+                    )
+                }
+            )
+        ])
+    ], className="mt-4")
+
 def create_sienna_comparison_section(sienna_metrics):
     """Crée la section de comparaison avec Sienna"""
     return dbc.Card([
@@ -580,6 +1221,60 @@ def create_data_tables(selected_actions, invalid_actions):
         ], md=6)
     ], className="mb-4")
 
+
+def create_alternatives_table(portfolios, complete=True):
+    """Crée le tableau des meilleurs portefeuilles alternatifs"""
+    best_benefit = portfolios[0][2] if portfolios else 0
+    title = f"Top {len(portfolios)} des portefeuilles"
+    if not complete:
+        title += " (recherche interrompue, classement non garanti)"
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="fas fa-list-ol me-2"),
+            title
+        ], className="bg-black text-white"),
+        dbc.CardBody([
+            dash_table.DataTable(
+                id='alternatives-table',
+                columns=[
+                    {'name': 'Rang', 'id': 'rank'},
+                    {'name': 'Coût (€)', 'id': 'cost'},
+                    {'name': 'Bénéfice (€)', 'id': 'benefit'},
+                    {'name': 'Écart au meilleur (€)', 'id': 'gap'},
+                    {'name': "Nombre d'actions", 'id': 'count'},
+                    {'name': 'Actions', 'id': 'actions'}
+                ],
+                data=[{
+                    'rank': rank,
+                    'cost': f"{cost:.2f}",
+                    'benefit': f"{benefit:.2f}",
+                    'gap': f"{benefit - best_benefit:.4f}",
+                    'count': len(combination),
+                    'actions': ', '.join(action.name for action in combination)
+                } for rank, (combination, cost, benefit) in enumerate(portfolios, start=1)],
+                style_table={'maxHeight': '400px', 'overflowY': 'auto'},
+                style_cell={
+                    'textAlign': 'left', 'padding': '10px', 'whiteSpace': 'normal',
+                    'maxWidth': '600px'
+                },
+                style_header={
+                    'backgroundColor': 'rgb(230, 230, 230)',
+                    'fontWeight': 'bold'
+                }
+            )
+        ])
+    ], className="mb-4")
+
+
+def create_alternatives_unavailable(engine_label):
+    """Indique que les portefeuilles alternatifs ignorent les contraintes du moteur choisi"""
+    return dbc.Alert(
+        f"Les portefeuilles alternatifs ne tiennent pas compte des contraintes du moteur "
+        f"« {engine_label} » et ne sont donc pas affichés.",
+        color="secondary",
+        className="mb-4"
+    )
+
 def create_selected_actions_table(selected_actions):
     """Crée le tableau des actions sélectionnées"""
     return dbc.Card([
@@ -592,16 +1287,18 @@ def create_selected_actions_table(selected_actions):
                 id='selected-actions-table',
                 columns=[
                     {'name': 'Nom', 'id': 'name'},
+                    {'name': 'Quantité', 'id': 'quantity'},
                     {'name': 'Coût (€)', 'id': 'cost'},
                     {'name': 'Bénéfice (€)', 'id': 'benefit'},
                     {'name': 'Rendement (%)', 'id': 'benefit_percent'}
                 ],
                 data=[{
                     'name': a.name,
-                    'cost': f"{a.cost:.2f}",
-                    'benefit': f"{a.benefit:.2f}",
+                    'quantity': quantity,
+                    'cost': f"{a.cost * quantity:.2f}",
+                    'benefit': f"{a.benefit * quantity:.2f}",
                     'benefit_percent': f"{a.benefit_percent:.2f}"
-                } for a in selected_actions],
+                } for a, quantity in count_quantities(selected_actions)],
                 style_table={'maxHeight': '400px', 'overflowY': 'auto'},
                 style_cell={'textAlign': 'left', 'padding': '10px'},
                 style_header={
@@ -640,8 +1337,17 @@ def create_invalid_actions_table(invalid_actions):
         ])
     ])
 
-def create_complexity_section(times, memories, n_vals, selected_actions):
+
+def create_complexity_section(times, memories, n_vals, selected_actions, engine=DEFAULT_ENGINE):
     """Crée la section de complexité avec une nouvelle organisation des cartes"""
+    time_complexity = ENGINES[engine]['time_complexity']
+    space_complexity = ENGINES[engine]['space_complexity']
+    time_text, space_text = create_complexity_texts(engine)
+    # Les cartes sur le choix du Greedy ne concernent que lui ; les autres moteurs sont décrits
+    if engine == "greedy":
+        rationale_cards = [create_solutions_card(), create_greedy_choice_card()]
+    else:
+        rationale_cards = [create_engine_description_card(engine)]
     return dbc.Card([
         dbc.CardHeader([
             html.I(className="fas fa-cogs me-2"),
@@ -656,7 +1362,7 @@ def create_complexity_section(times, memories, n_vals, selected_actions):
                         dbc.CardHeader([
                             html.I(className="fas fa-clock me-2"),
                             "Complexité Temporelle",
-                            html.Span("O(n)", className="ms-auto")
+                            html.Span(time_complexity, className="ms-auto")
                         ], className="bg-black text-white d-flex align-items-center justify-content-between"),
                         dbc.CardBody([
                             dcc.Graph(
@@ -667,11 +1373,7 @@ def create_complexity_section(times, memories, n_vals, selected_actions):
                                     "blue"
                                 )
                             ),
-                            html.P([
-                                "Ce graphique illustre le temps d'exécution cumulé de notre algorithme Greedy en fonction du nombre d'actions. ",
-                                "La croissance linéaire O(n) démontre l'efficacité de notre approche, avec un temps de calcul qui augmente ",
-                                "proportionnellement au nombre d'actions analysées."
-                            ])
+                            html.P(time_text)
                         ], className="h-100")
                     ], className="mb-4 shadow-sm h-100")
                 ], md=6),
@@ -682,7 +1384,7 @@ def create_complexity_section(times, memories, n_vals, selected_actions):
                         dbc.CardHeader([
                             html.I(className="fas fa-memory me-2"),
                             "Complexité Spatiale",
-                            html.Span("O(n)", className="ms-auto")
+                            html.Span(space_complexity, className="ms-auto")
                         ], className="bg-black text-white d-flex align-items-center justify-content-between"),
                         dbc.CardBody([
                             dcc.Graph(
@@ -693,94 +1395,149 @@ def create_complexity_section(times, memories, n_vals, selected_actions):
                                     "green"
                                 )
                             ),
-                            html.P([
-                                "Le graphique montre l'utilisation mémoire linéaire de notre algorithme Greedy. ",
-                                "L'espace mémoire utilisé croît de manière linéaire (O(n)) avec le nombre d'actions, ",
-                                "permettant une gestion efficace des ressources système."
-                            ])
+                            html.P(space_text)
                         ], className="h-100")
                     ], className="mb-4 shadow-sm h-100")
                 ], md=6)
             ], className="mb-4"),
-            
+            *rationale_cards
+        ])
+    ], className="mb-4 shadow-sm")
 
-            dbc.Card([
-                dbc.CardHeader([
-                    html.I(className="fas fa-code-branch me-2"),
-                    "Solutions envisagées"
-                ], className="bg-black text-white"),
-                dbc.CardBody([
-                    html.P([
-                        "Avant d'opter pour l'algorithme Greedy, nous avons exploré plusieurs approches algorithmiques, ",
-                        "chacune présentant ses avantages et limitations :"
-                    ]),
-                    html.Ul([
-                        html.Li([
-                            html.Strong("Force brute (Complexités - Temps : O(2ⁿ), Espace : O(2ⁿ)) : "), 
-                            "Cette approche teste toutes les combinaisons possibles d'actions. Bien qu'elle garantisse la solution optimale, "
-                            "elle devient rapidement impraticable. Pour 30 actions, il faudrait évaluer plus d'un milliard de combinaisons, "
-                            "nécessitant un temps de calcul excessif et une importante quantité de mémoire pour stocker toutes les combinaisons."
-                        ]),
-                        html.Li([
-                            html.Strong("Récursivité (Complexités - Temps : O(2ⁿ), Espace : O(2ⁿ)) : "), 
-                            "Cette méthode divise le problème en sous-problèmes mais souffre aussi d'une croissance exponentielle. "
-                            "Elle présente des risques d'erreurs techniques liées à la mémoire (dépassement de la capacité de stockage temporaire du programme) "
-                            "pour les grands ensembles de données."
-                        ]),
-                        html.Li([
-                            html.Strong("Programmation dynamique (Complexités - Temps : O(n×W), Espace : O(n×W)) : "), 
-                            "Cette stratégie utilise une matrice 2D pour mémoriser les calculs intermédiaires. Pour un budget W de 500€ et 40 actions, "
-                            "elle nécessiterait une matrice de 20 000 cellules. Bien qu'elle garantisse une solution optimale, sa consommation mémoire "
-                            "devient problématique pour de grands ensembles de données ou des budgets élevés."
-                        ])
-                    ])
-                ], className="h-100")
-            ], className="mb-4 shadow-sm h-100"),
-            
 
-            dbc.Card([
-                dbc.CardHeader([
-                    html.I(className="fas fa-lightbulb me-2"),
-                    "Pourquoi avoir choisi la stratégie Greedy ?"
-                ], className="bg-black text-white"),
-                dbc.CardBody([
-                    html.P([
-                        "Après avoir analysé ces différentes approches, nous avons opté pour l'algorithme Greedy pour les raisons suivantes :"
-                    ]),
-                    html.Ul([
-                        html.Li([
-                            html.Strong("Efficacité : "), 
-                            "Complexité linéaire O(n) en temps et en espace, permettant de traiter rapidement de grands volumes de données "
-                            "sans compromettre les performances du système."
-                        ]),
-                        html.Li([
-                            html.Strong("Simplicité : "), 
-                            "Implementation simple et maintenable, facilitant les futures évolutions et la correction d'erreurs."
-                        ]),
-                        html.Li([
-                            html.Strong("Scalabilité : "), 
-                            "Parfaitement adapté au traitement de grands ensembles de données, contrairement aux autres approches qui deviennent "
-                            "rapidement limitées par leur consommation de ressources."
-                        ])
-                    ]),
-                    html.P([
-                        "Bien que l'algorithme Greedy ne garantisse pas toujours la solution optimale absolue, il offre un excellent compromis "
-                        "entre qualité de la solution et performances. Dans notre contexte d'optimisation financière, les solutions trouvées sont "
-                        "généralement très proches de l'optimal, avec l'avantage d'être calculées instantanément."
-                    ]),
-                    html.P([
-                        "Pour plus d'informations sur les algorithmes Greedy  : ",
+def create_complexity_texts(engine):
+    """Textes sous les graphiques de temps et de mémoire, selon le moteur choisi"""
+    if engine == "greedy":
+        time_text = [
+            "Ce graphique illustre le temps d'exécution cumulé de notre algorithme Greedy en ",
+            "fonction du nombre d'actions. La croissance linéaire O(n) démontre l'efficacité de ",
+            "notre approche, avec un temps de calcul qui augmente proportionnellement au nombre ",
+            "d'actions analysées."
+        ]
+        space_text = [
+            "Le graphique montre l'utilisation mémoire linéaire de notre algorithme Greedy. ",
+            "L'espace mémoire utilisé croît de manière linéaire (O(n)) avec le nombre d'actions, ",
+            "permettant une gestion efficace des ressources système."
+        ]
+        return time_text, space_text
+
+    label = ENGINES[engine]['label']
+    time_text = [
+        f"Ce graphique illustre le temps d'exécution du moteur « {label} » en fonction du nombre ",
+        f"d'actions ; sa complexité temporelle est en {ENGINES[engine]['time_complexity']}. ",
+        "Un seul point est affiché quand seule la résolution complète est mesurée."
+    ]
+    space_text = [
+        f"Le graphique montre la mémoire utilisée par le moteur « {label} », dont la complexité ",
+        f"spatiale est en {ENGINES[engine]['space_complexity']}."
+    ]
+    return time_text, space_text
 
-                        html.A("Introduction aux Algorithmes Greedy",
 
-                              href="https://www.geeksforgeeks.org/greedy-algorithms/", 
-                              target="_blank")
-                    ])
-                ], className="h-100")
-            ], className="mb-4 shadow-sm h-100")
-        ])
-    ], className="mb-4 shadow-sm")
+def create_engine_description_card(engine):
+    """Crée la carte de présentation du moteur choisi"""
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="fas fa-lightbulb me-2"),
+            f"À propos du moteur « {ENGINES[engine]['label']} »"
+        ], className="bg-black text-white"),
+        dbc.CardBody([
+            html.P(ENGINES[engine]['description'])
+        ], className="h-100")
+    ], className="mb-4 shadow-sm h-100")
+
+
+def create_solutions_card():
+    """Crée la carte des solutions envisagées avant le choix du Greedy"""
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="fas fa-code-branch me-2"),
+            "Solutions envisagées"
+        ], className="bg-black text-white"),
+        dbc.CardBody([
+            html.P([
+                "Avant d'opter pour l'algorithme Greedy, nous avons exploré plusieurs approches "
+                "algorithmiques, chacune présentant ses avantages et limitations :"
+            ]),
+            html.Ul([
+                html.Li([
+                    html.Strong("Force brute (Complexités - Temps : O(2ⁿ), Espace : O(2ⁿ)) : "),
+                    "Cette approche teste toutes les combinaisons possibles d'actions. Bien "
+                    "qu'elle garantisse la solution optimale, elle devient rapidement "
+                    "impraticable. Pour 30 actions, il faudrait évaluer plus d'un milliard de "
+                    "combinaisons, nécessitant un temps de calcul excessif et une importante "
+                    "quantité de mémoire pour stocker toutes les combinaisons."
+                ]),
+                html.Li([
+                    html.Strong("Récursivité (Complexités - Temps : O(2ⁿ), Espace : O(2ⁿ)) : "),
+                    "Cette méthode divise le problème en sous-problèmes mais souffre aussi d'une "
+                    "croissance exponentielle. Elle présente des risques d'erreurs techniques "
+                    "liées à la mémoire (dépassement de la capacité de stockage temporaire du "
+                    "programme) pour les grands ensembles de données."
+                ]),
+                html.Li([
+                    html.Strong(
+                        "Programmation dynamique (Complexités - Temps : O(n×W), Espace : O(n×W)) : "
+                    ),
+                    "Cette stratégie utilise une matrice 2D pour mémoriser les calculs "
+                    "intermédiaires. Pour un budget W de 500€ et 40 actions, elle nécessiterait "
+                    "une matrice de 20 000 cellules. Bien qu'elle garantisse une solution "
+                    "optimale, sa consommation mémoire devient problématique pour de grands "
+                    "ensembles de données ou des budgets élevés."
+                ])
+            ])
+        ], className="h-100")
+    ], className="mb-4 shadow-sm h-100")
+
 
+def create_greedy_choice_card():
+    """Crée la carte expliquant le choix de la stratégie Greedy"""
+    return dbc.Card([
+        dbc.CardHeader([
+            html.I(className="fas fa-lightbulb me-2"),
+            "Pourquoi avoir choisi la stratégie Greedy ?"
+        ], className="bg-black text-white"),
+        dbc.CardBody([
+            html.P([
+                "Après avoir analysé ces différentes approches, nous avons opté pour l'algorithme "
+                "Greedy pour les raisons suivantes :"
+            ]),
+            html.Ul([
+                html.Li([
+                    html.Strong("Efficacité : "),
+                    "Complexité linéaire O(n) en temps et en espace, permettant de traiter "
+                    "rapidement de grands volumes de données sans compromettre les performances du "
+                    "système."
+                ]),
+                html.Li([
+                    html.Strong("Simplicité : "),
+                    "Implementation simple et maintenable, facilitant les futures évolutions et la "
+                    "correction d'erreurs."
+                ]),
+                html.Li([
+                    html.Strong("Scalabilité : "),
+                    "Parfaitement adapté au traitement de grands ensembles de données, "
+                    "contrairement aux autres approches qui deviennent rapidement limitées par "
+                    "leur consommation de ressources."
+                ])
+            ]),
+            html.P([
+                "Bien que l'algorithme Greedy ne garantisse pas toujours la solution optimale "
+                "absolue, il offre un excellent compromis entre qualité de la solution et "
+                "performances. Dans notre contexte d'optimisation financière, les solutions "
+                "trouvées sont généralement très proches de l'optimal, avec l'avantage d'être "
+                "calculées instantanément."
+            ]),
+            html.P([
+                "Pour plus d'informations sur les algorithmes Greedy  : ",
+
+                html.A("Introduction aux Algorithmes Greedy",
+
+                       href="https://www.geeksforgeeks.org/greedy-algorithms/",
+                       target="_blank")
+            ])
+        ], className="h-100")
+    ], className="mb-4 shadow-sm h-100")
 
 
 def create_complexity_figure(x_vals, y_vals, name, color):
@@ -812,9 +1569,9 @@ app = Dash(__name__,
 )
 
 # Chargement initial des données
-csv_files = [f for f in os.listdir(DATA_FOLDER) if f.endswith(".csv")]
+csv_files = [f for f in os.listdir(DATA_FOLDER) if f.endswith(".csv") or is_parquet(f)]
 if not csv_files:
-    print("Aucun fichier CSV trouvé dans le dossier 'data'.")
+    print("Aucun fichier CSV ou Parquet trouvé dans le dossier 'data'.")
     exit()
 
 # Sélection initiale du fichier
@@ -843,11 +1600,18 @@ if load_errors:
 # Tri initial des actions valides
 valid_actions.sort(key=lambda x: x.ratio, reverse=True)
 
+
+def create_dashboard_title(engine):
+    """Titre du dashboard pour le moteur choisi"""
+    return f"Dashboard d'optimisation : {ENGINES[engine]['label']}"
+
+
 def create_main_layout():
     """Crée le layout principal de l'application"""
     return dbc.Container([
 
-        html.H1("Dashboard d'optimisation par algorithme Greedy", className="text-dark mb-4"),
+        html.H1(create_dashboard_title(DEFAULT_ENGINE), id='dashboard-title',
+                className="text-dark mb-4"),
         
 
         create_data_controls(csv_files, selected_file),
@@ -887,29 +1651,61 @@ def create_main_layout():
 
 
 @app.callback(
-    [Output('dataset-title', 'children'),
+    [Output('dashboard-title', 'children'),
+     Output('dataset-title', 'children'),
      Output('data-exploration-content', 'children'),
      Output('summary-content', 'children'),
      Output('cost-benefit-section', 'children'),
      Output('tables-section', 'children'),
      Output('complexity-section', 'children')],
     [Input('file-selector', 'value'),
-     Input('validate-budget', 'n_clicks')],
-    [State('budget-input', 'value')]
+     Input('engine-selector', 'value'),
+     Input('validate-budget', 'n_clicks'),
+     Input('alternatives-toggle', 'value')],
+    [State('budget-input', 'value'),
+     State('epsilon-input', 'value'),
+     State('min-count-input', 'value'),
+     State('max-count-input', 'value'),
+     State('min-position-input', 'value'),
+     State('max-risk-input', 'value')]
 )
-def update_dashboard(selected_file, n_clicks, budget):
+def update_dashboard(selected_file, engine, n_clicks, show_alternatives, budget, epsilon,
+                     min_count=None, max_count=None, min_position=None, max_risk=None):
     """Met à jour l'ensemble du dashboard"""
     if budget is None:
         budget = WALLET
-    
-    # Chargement des données
+    if engine not in ENGINES:
+        engine = DEFAULT_ENGINE
+    if epsilon is None or not 0 < epsilon < 1:
+        epsilon = FPTAS_EPSILON
+
+    min_count = max(int(min_count or 0), 0)
+    if max_count is not None:
+        max_count = max(int(max_count), min_count)
+    min_position = max(min_position or 0.0, 0.0)
+    if max_risk is not None:
+        max_risk = max(max_risk, 0.0)
+
+    # Paramètres propres au moteur choisi
     file_path = os.path.join(DATA_FOLDER, selected_file)
-    valid_actions, invalid_actions, _ = load_actions(file_path)
+    available_options = {
+        'file_path': file_path,
+        'epsilon': epsilon,
+        'min_count': min_count,
+        'max_count': max_count,
+        'min_position': min_position,
+        'max_risk': max_risk
+    }
+    options = {name: available_options[name] for name in ENGINES[engine].get('options', [])}
+    
+    # Chargement des données (triées par ratio)
+    valid_actions, invalid_actions = load_dataset(file_path)
     total_actions_count = len(valid_actions) + len(invalid_actions)
     
-    # Tri et mesures de performance
-    valid_actions.sort(key=lambda x: x.ratio, reverse=True)
-    selected, total_cost, total_benefit, times, memories, n_vals = measure_performance(valid_actions, budget)
+    # Mesures de performance
+    results = ENGINES[engine]['run'](valid_actions, budget, **options)
+    selected, total_cost, total_benefit, times, memories, n_vals = results[:6]
+    engine_details = results[6] if len(results) > 6 else {}
     
     # Titre du dataset
     dataset_title = f"Exploration des Données - {selected_file}"
@@ -969,18 +1765,29 @@ def update_dashboard(selected_file, n_clicks, budget):
     ], className="shadow mb-4") 
     
     summary_content = [performance_overview] 
+    if engine_details:
+        summary_content.append(create_engine_details_card(ENGINES[engine]['label'], engine_details))
     
    
     sienna_metrics = get_sienna_comparison(selected_file, total_cost, total_benefit)
     if sienna_metrics:
         summary_content.append(create_sienna_comparison_section(sienna_metrics))
     
-   
-    cost_benefit_content = create_cost_benefit_chart(selected)
-    tables_content = create_data_tables(selected, invalid_actions)
-    complexity_content = create_complexity_section(times, memories, n_vals, selected)
+    cost_benefit_content = [create_cost_benefit_chart(selected)]
+    curve = get_budget_curve(file_path, valid_actions, budget)[0] if engine == "curve" else None
+    if curve is not None:
+        cost_benefit_content.append(create_budget_curve_chart(curve, budget))
+    # Portefeuilles alternatifs : recherchés à la demande, et seulement pour le sac à dos 0/1
+    tables_content = [create_data_tables(selected, invalid_actions)]
+    if show_alternatives and ENGINES[engine].get('constrained'):
+        tables_content.insert(0, create_alternatives_unavailable(ENGINES[engine]['label']))
+    elif show_alternatives:
+        alternatives, complete = get_alternatives(file_path, valid_actions, budget)
+        tables_content.insert(0, create_alternatives_table(alternatives, complete))
+    complexity_content = create_complexity_section(times, memories, n_vals, selected, engine)
     
     return (
+        create_dashboard_title(engine),
         dataset_title,
         exploration_content,
         summary_content,
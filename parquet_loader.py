@@ -0,0 +1,102 @@
+"""
+Lecture et écriture des univers d'actions au format Parquet.
+
+Les fichiers Parquet publiés en amont sont lus sans conversion en CSV :
+- projection : seules les colonnes utiles sont lues, à savoir nom, coût et bénéfice (les trois
+  premières) et les colonnes facultatives de quantité et de risque, repérées par leur nom comme
+  pour un CSV ; les autres colonnes ne sont ni lues ni filtrées ;
+- filtre à la lecture : si le coût et le bénéfice sont numériques dans le schéma, les lignes au
+  coût ou au bénéfice non positif, de toute façon invalides, sont écartées par pyarrow, qui saute
+  les groupes de lignes d'après leurs statistiques. Elles n'apparaissent donc pas parmi les
+  actions invalides.
+Les lignes lues passent ensuite par la même conversion et la même validation que celles d'un CSV
+(`action_loader.ParsedRows`), puis dans une `ActionTable`. `write_parquet` enregistre un jeu
+nettoyé (bénéfice numérique, sans « % ») pour que la lecture suivante profite du filtre.
+"""
+
+from contextlib import closing
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from action_loader import optional_column_positions
+from models.action_table import ActionTable
+
+# Noms des colonnes écrites par `write_parquet`, dans l'ordre attendu à la lecture
+PARQUET_COLUMNS = ("name", "price", "profit", "quantity", "risk")
+
+
+def projected_columns(schema: pa.Schema) -> List[str]:
+    """Colonnes à lire : nom, coût, bénéfice, puis quantité et risque s'ils sont présents."""
+    optional = [column for column in optional_column_positions(schema.names) if column is not None]
+    return [schema.names[position] for position in sorted([0, 1, 2] + optional)]
+
+
+def positive_filter(schema: pa.Schema) -> Optional[ds.Expression]:
+    """Filtre coût > 0 et bénéfice > 0, limité aux colonnes numériques (None s'il n'y en a pas)."""
+    types = {position: schema.field(position).type for position in (1, 2)}
+    numeric = [
+        position for position, kind in types.items()
+        if pa.types.is_integer(kind) or pa.types.is_floating(kind)
+    ]
+    conditions = [pc.field(schema.names[position]) > 0 for position in numeric]
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else conditions[0] & conditions[1]
+
+
+def open_dataset(file_path: str):
+    """
+    Ouvre un fichier Parquet.
+
+    Retourne: (jeu de données pyarrow, colonnes projetées, filtre)
+    """
+    dataset = ds.dataset(file_path, format="parquet")
+    if len(dataset.schema.names) < 3:
+        raise ValueError(
+            "Le fichier Parquet doit contenir au moins trois colonnes : nom, coût, et bénéfice."
+        )
+    return dataset, projected_columns(dataset.schema), positive_filter(dataset.schema)
+
+
+def read_parquet_frame(file_path: str) -> pd.DataFrame:
+    """
+    Lit les colonnes utiles d'un fichier Parquet, hormis les lignes au coût ou bénéfice non positif.
+    """
+    dataset, columns, condition = open_dataset(file_path)
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
+def iter_parquet_frames(file_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Comme `read_parquet_frame`, par blocs d'au plus `chunk_size` lignes (pour
+    `action_loader.iter_action_batches`). S'utilise comme un lecteur CSV par blocs, dans un `with`.
+    """
+    dataset, columns, condition = open_dataset(file_path)
+
+    def frames():
+        for batch in dataset.to_batches(columns=columns, filter=condition, batch_size=chunk_size):
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    return closing(frames())
+
+
+def write_parquet(table: ActionTable, file_path: str):
+    """Enregistre une table d'actions (par exemple les actions valides d'un chargement)."""
+    count = len(table)
+    quantities = table.max_quantities
+    risks = table.risks
+    columns = [
+        pa.array(table.names, type=pa.binary()).cast(pa.string()),
+        pa.array(table.cost),
+        pa.array(table.benefit_percent),
+        pa.array(np.ones(count, dtype=np.int64) if quantities is None else quantities),
+        pa.array(np.zeros(count) if risks is None else risks),
+    ]
+    pq.write_table(pa.Table.from_arrays(columns, names=list(PARQUET_COLUMNS)), file_path)
@@ -0,0 +1,67 @@
+"""
+Résolution groupée de nombreux scénarios (jeu de données, budget).
+
+Les scénarios sont regroupés par jeu de données : chaque fichier est chargé, validé et trié une
+seule fois, puis une unique courbe budget/bénéfice, calculée jusqu'au plus grand budget demandé,
+répond à tous les budgets du groupe. Si cette courbe dépasse sa limite de mémoire, chaque budget
+est résolu séparément par programmation dynamique en mémoire O(W).
+"""
+
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from action_loader import load_actions
+from models.action import Action
+from solvers.dynamic_programming import BudgetCurve, knapsack_dp
+
+# Colonnes du tableau de résultats, dans l'ordre
+BATCH_COLUMNS = [
+    'dataset', 'budget', 'total_cost', 'total_benefit', 'action_count', 'actions', 'error'
+]
+
+
+def group_queries(queries: List[Tuple[str, float]]) -> Dict[str, List[int]]:
+    """Regroupe les indices des scénarios par jeu de données, dans l'ordre d'arrivée."""
+    groups = {}
+    for position, (file_path, _) in enumerate(queries):
+        groups.setdefault(file_path, []).append(position)
+    return groups
+
+
+def solve_batch(queries: List[Tuple[str, float]]) -> pd.DataFrame:
+    """
+    Résout une liste de scénarios (chemin du jeu de données, budget) en un seul appel.
+
+    Retourne: un tableau en colonnes (une ligne par scénario, dans l'ordre des scénarios) avec le
+    coût, le bénéfice optimal, le nombre et les noms des actions retenues, et l'éventuelle erreur
+    de chargement.
+    """
+    columns = {name: [None] * len(queries) for name in BATCH_COLUMNS}
+
+    for file_path, positions in group_queries(queries).items():
+        valid_actions, _, errors = load_actions(file_path)
+        valid_actions.sort(key=lambda action: action.ratio, reverse=True)
+        budgets = [queries[position][1] for position in positions]
+        curve = None
+        if valid_actions:
+            try:
+                curve = BudgetCurve(valid_actions, max(budgets))
+            except ValueError:
+                # Courbe trop grande : chaque budget est résolu seul, en mémoire O(W)
+                pass
+
+        for position, budget in zip(positions, budgets):
+            if curve is not None:
+                selection = curve.selection(budget) if budget >= 0 else []
+            else:
+                selection = knapsack_dp(valid_actions, budget, reconstruction="hirschberg")[0]
+            columns['dataset'][position] = file_path
+            columns['budget'][position] = budget
+            columns['total_cost'][position] = Action.total_portfolio_cost(selection)
+            columns['total_benefit'][position] = Action.total_portfolio_benefit(selection)
+            columns['action_count'][position] = len(selection)
+            columns['actions'][position] = ', '.join(action.name for action in selection)
+            columns['error'][position] = '; '.join(errors) if not valid_actions else None
+
+    return pd.DataFrame(columns, columns=BATCH_COLUMNS)
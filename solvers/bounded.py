@@ -0,0 +1,77 @@
+"""
+Sac à dos borné : plusieurs parts d'une même action, jusqu'à sa quantité maximale.
+
+Chaque action de quantité q est découpée en lots de 1, 2, 4, ..., reste parts (O(log q) lots),
+puis le problème 0/1 obtenu passe par la réduction et la programmation dynamique habituelles.
+Le temps de calcul croît donc avec log q et non avec q.
+"""
+
+from typing import Dict, List, Tuple
+
+from models.action import Action
+from solvers.dynamic_programming import knapsack_dp, to_cents
+from solvers.reduction import binary_sizes, make_bundle, solve_reduced
+
+
+def split_into_lots(actions: List[Action], capacity: int
+                    ) -> Tuple[List[Action], Dict[int, Tuple[Action, int]]]:
+    """
+    Découpe chaque action en lots binaires, sans dépasser le nombre de parts qui tient dans le
+    budget.
+
+    Retourne: (lots, {id(lot): (action_d_origine, nombre_de_parts)})
+    """
+    lots = []
+    owners = {}
+    for action in actions:
+        cost = to_cents(action.cost)
+        quantity = action.max_quantity if cost == 0 else min(action.max_quantity, capacity // cost)
+        for size in binary_sizes(quantity):
+            lot = action if size == 1 else make_bundle(action, size)
+            lots.append(lot)
+            owners[id(lot)] = (action, size)
+    return lots, owners
+
+
+def count_quantities(selection: List[Action]) -> List[Tuple[Action, int]]:
+    """
+    Regroupe une sélection où une action peut apparaître plusieurs fois en (action, quantité), dans
+    l'ordre.
+    """
+    quantities = {}
+    for action in selection:
+        if id(action) in quantities:
+            quantities[id(action)][1] += 1
+        else:
+            quantities[id(action)] = [action, 1]
+    return [(action, quantity) for action, quantity in quantities.values()]
+
+
+def knapsack_bounded(actions: List[Action], max_budget: float
+                     ) -> Tuple[List[Action], float, float, float]:
+    """
+    Sélection optimale lorsque chaque action peut être achetée jusqu'à `max_quantity` fois.
+
+    La combinaison renvoyée contient une action autant de fois que de parts achetées, ce qui
+    permet de garder `Action.total_portfolio_cost` et `Action.total_portfolio_benefit` ;
+    `count_quantities` la regroupe en (action, quantité).
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    lots, owners = split_into_lots(actions, max(to_cents(max_budget), 0))
+    selected_lots, _, _, memory_used = solve_reduced(knapsack_dp, lots, max_budget)
+
+    chosen = {}
+    for lot in selected_lots:
+        action, size = owners[id(lot)]
+        chosen[id(action)] = chosen.get(id(action), 0) + size
+
+    best_combination = []
+    for action in actions:
+        best_combination.extend([action] * chosen.get(id(action), 0))
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
@@ -0,0 +1,211 @@
+"""
+Solveur exact par séparation et évaluation (branch-and-bound).
+
+Les actions sont triées par ratio décroissant, puis l'arbre des décisions est parcouru
+en profondeur. Chaque nœud est élagué grâce à la borne de Dantzig : la valeur de la
+relaxation continue du sac à dos, calculée en O(log n) à partir de sommes préfixes.
+
+La variante `top_k_portfolios` garde un tas borné des k meilleures solutions rencontrées
+et élague par rapport à la k-ième au lieu de la meilleure.
+"""
+
+import heapq
+import sys
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from models.action import Action
+from solvers.dynamic_programming import (
+    solver_benefit, to_cents, to_exact_benefit, traced_peak_memory
+)
+
+# Nombre de nœuds explorés entre deux lectures de l'horloge quand une durée maximale est fixée
+TIME_CHECK_INTERVAL = 4096
+
+
+def sort_by_ratio(actions: List[Action]) -> List[Action]:
+    """Trie les actions par ratio bénéfice/coût décroissant."""
+    return sorted(actions, key=lambda action: action.ratio, reverse=True)
+
+
+def dantzig_bound(index: int, capacity: int, value: float,
+                  prefix_costs: List[int], prefix_benefits: List[float],
+                  costs: List[int], benefits: List[float]) -> float:
+    """
+    Calcule la borne supérieure fractionnaire à partir de l'action `index`.
+
+    Les actions sont prises entières tant qu'elles tiennent dans `capacity`, puis une fraction
+    de l'action critique complète le budget.
+    """
+    # Dernier indice j tel que les actions index..j-1 tiennent entières dans le budget
+    critical = bisect_right(prefix_costs, prefix_costs[index] + capacity) - 1
+    bound = value + prefix_benefits[critical] - prefix_benefits[index]
+    if critical < len(costs):
+        remaining = capacity - (prefix_costs[critical] - prefix_costs[index])
+        bound += remaining * benefits[critical] / costs[critical]
+    return bound
+
+
+def branch_and_bound(
+    actions: List[Action], max_budget: float, max_nodes: Optional[int] = None,
+    stats: Optional[Dict[str, object]] = None
+) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche la combinaison optimale d'actions par séparation et évaluation.
+
+    Si `max_nodes` est fourni, la recherche s'arrête après ce nombre de nœuds et renvoie la
+    meilleure solution trouvée. Si `stats` est fourni, on y indique le nombre de nœuds explorés
+    et si la recherche est allée jusqu'au bout (solution prouvée optimale).
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, pic_mémoire_allouée)
+    """
+    capacity = to_cents(max_budget)
+    candidates = sort_by_ratio([action for action in actions if to_cents(action.cost) <= capacity])
+    if stats is not None:
+        stats.update(nodes=0, complete=True)
+    if not candidates:
+        return [], 0.0, 0.0, 0.0
+
+    def solve():
+        costs = [to_cents(action.cost) for action in candidates]
+        benefits = [solver_benefit(action) for action in candidates]
+        prefix_costs = [0] + list(accumulate(costs))
+        prefix_benefits = [0.0] + list(accumulate(benefits))
+        n = len(candidates)
+
+        best_value = 0.0
+        best_chosen = None
+
+        # Nœud : (indice, budget restant, bénéfice courant, actions prises en liste chaînée)
+        stack = [(0, capacity, 0.0, None)]
+        nodes = 0
+        while stack:
+            if max_nodes is not None and nodes >= max_nodes:
+                break
+            nodes += 1
+            index, remaining, value, chosen = stack.pop()
+            if value > best_value:
+                best_value = value
+                best_chosen = chosen
+
+            if index == n:
+                continue
+            bound = dantzig_bound(
+                index, remaining, value, prefix_costs, prefix_benefits, costs, benefits
+            )
+            if bound <= best_value:
+                continue
+
+            # L'exclusion est empilée en premier pour explorer d'abord la branche d'inclusion
+            stack.append((index + 1, remaining, value, chosen))
+            if costs[index] <= remaining:
+                taken = (index, chosen)
+                stack.append((index + 1, remaining - costs[index], value + benefits[index], taken))
+
+        if stats is not None:
+            stats.update(nodes=nodes, complete=not stack)
+
+        best_combination = []
+        while best_chosen is not None:
+            index, best_chosen = best_chosen
+            best_combination.append(candidates[index])
+        best_combination.reverse()
+        return best_combination
+
+    best_combination, memory_used = traced_peak_memory(solve)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+def top_k_portfolios(
+    actions: List[Action], max_budget: float, k: int = 10, max_nodes: Optional[int] = None,
+    stats: Optional[Dict[str, object]] = None, time_limit: Optional[float] = None
+) -> Tuple[List[Tuple[List[Action], float, float]], float]:
+    """
+    Recherche les k meilleurs portefeuilles distincts par séparation et évaluation.
+
+    Chaque portefeuille est enregistré une seule fois, au nœud où sa dernière action est ajoutée,
+    dans un tas borné à k éléments ; un nœud est élagué dès que sa borne ne dépasse pas le k-ième
+    bénéfice. Les bénéfices sont comparés en valeurs exactes pour que le classement soit fiable.
+    `max_nodes` et `stats` fonctionnent comme pour `branch_and_bound` ; `time_limit` (en secondes)
+    interrompt de même la recherche, qui est alors signalée incomplète.
+
+    Retourne: ([(combinaison, coût_total, bénéfice_total), ...] du meilleur au moins bon,
+    mémoire estimée de la pile et du tas, sans les listes de travail)
+    """
+    if k < 1:
+        raise ValueError("Le nombre de portefeuilles demandés doit être au moins 1.")
+
+    capacity = to_cents(max_budget)
+    candidates = sort_by_ratio([action for action in actions if to_cents(action.cost) <= capacity])
+    if stats is not None:
+        stats.update(nodes=0, complete=True)
+    if capacity < 0:
+        return [], 0.0
+
+    costs = [to_cents(action.cost) for action in candidates]
+    benefits = [to_exact_benefit(action) for action in candidates]
+    prefix_costs = [0] + list(accumulate(costs))
+    prefix_benefits = [0] + list(accumulate(benefits))
+    n = len(candidates)
+
+    # Tas min des k meilleurs : (bénéfice, -coût, ordre d'arrivée, actions prises) ;
+    # le moins bon est en tête
+    best = [(0, 0, 0, None)]
+    stack = [(0, capacity, 0, None)]
+    max_stack_size = 1
+    nodes = 0
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    while stack:
+        if max_nodes is not None and nodes >= max_nodes:
+            break
+        checkpoint = deadline is not None and nodes % TIME_CHECK_INTERVAL == 0
+        if checkpoint and time.perf_counter() > deadline:
+            break
+        nodes += 1
+        index, remaining, value, chosen = stack.pop()
+        if index == n:
+            continue
+        bound = dantzig_bound(
+            index, remaining, value, prefix_costs, prefix_benefits, costs, benefits
+        )
+        if len(best) == k and bound <= best[0][0]:
+            continue
+
+        stack.append((index + 1, remaining, value, chosen))
+        if costs[index] <= remaining:
+            remaining -= costs[index]
+            value += benefits[index]
+            chosen = (index, chosen)
+            entry = (value, remaining - capacity, nodes, chosen)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+            stack.append((index + 1, remaining, value, chosen))
+        max_stack_size = max(max_stack_size, len(stack))
+
+    if stats is not None:
+        stats.update(nodes=nodes, complete=not stack)
+
+    portfolios = []
+    for _, _, _, chosen in sorted(best, reverse=True):
+        combination = []
+        while chosen is not None:
+            index, chosen = chosen
+            combination.append(candidates[index])
+        combination.reverse()
+        portfolios.append((
+            combination,
+            Action.total_portfolio_cost(combination),
+            Action.total_portfolio_benefit(combination)
+        ))
+
+    memory_used = (max_stack_size + k) * sys.getsizeof((0, capacity, 0, None)) / (1024 * 1024)
+    return portfolios, memory_used
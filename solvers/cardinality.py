@@ -0,0 +1,182 @@
+"""
+Sac à dos avec contraintes de conformité : nombre de lignes et taille minimale de position.
+
+Le portefeuille doit contenir entre K_min et K_max actions, et aucune position ne doit coûter
+moins de `min_position` euros. La taille minimale se traite en écartant les actions trop petites ;
+le nombre de lignes ajoute au tableau DP une dimension « nombre d'actions prises », bornée par
+K_max (ou par K_min si K_max n'est pas fixé, la dernière ligne comptant alors « K_min ou plus »).
+La mémoire est donc en O(K×W) et non en O(n×W), et la sélection est reconstituée à la Hirschberg.
+On résout d'abord sans contrainte de nombre (sac à dos ordinaire), puis avec K_min seul : dès
+qu'une de ces sélections respecte les deux bornes, elle est optimale et le tableau suivant n'est
+jamais construit. K_max est de
+plus ignoré s'il dépasse le nombre d'actions qui tiennent ensemble dans le budget. Comme pour
+`BudgetCurve`, un tableau qui dépasserait `CURVE_MAX_MEMORY_MB` est refusé par une ValueError.
+
+Seule la suppression des actions dominées de `solvers.reduction` est appliquée au préalable
+(avec K_max comme borne supplémentaire) : échanger une action contre une dominante garde le même
+nombre d'actions, ce qui n'est pas le cas de la fixation de variables.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from models.action import Action
+from solvers.dynamic_programming import (CURVE_MAX_MEMORY_MB, reconstruct_hirschberg,
+                                         solver_benefit, to_cents, traced_peak_memory)
+from solvers.reduction import group_identical_actions, remove_dominated_groups
+
+# Nombre de tableaux (K+1)×(W+1) présents à la fois pendant la reconstruction, pour estimer la
+# mémoire : les deux moitiés, leurs maxima cumulés, les lignes associées deux à deux et leurs sommes
+CARDINALITY_TABLES = 5
+
+
+def count_table(costs: List[int], benefits: List[float], capacity: int, top: int,
+                saturate: bool) -> np.ndarray:
+    """
+    Tableau DP à deux dimensions : meilleur bénéfice avec exactement k actions pour chaque budget
+    de 0 à `capacity` (-inf si impossible). Si `saturate`, la ligne `top` compte « top actions ou
+    plus ».
+    """
+    dp = np.full((top + 1, capacity + 1), -np.inf)
+    dp[0] = 0.0
+    for cost, benefit in zip(costs, benefits):
+        if cost > capacity:
+            continue
+        # Copie des anciennes valeurs : chaque action n'est prise qu'une fois
+        source = dp[:, :capacity + 1 - cost] + benefit
+        np.maximum(dp[1:, cost:], source[:-1], out=dp[1:, cost:])
+        if saturate:
+            np.maximum(dp[top, cost:], source[top], out=dp[top, cost:])
+    return dp
+
+
+def reconstruct_cardinality(costs: List[int], benefits: List[float], capacity: int,
+                            target: int, top: int, saturate: bool) -> List[int]:
+    """
+    Reconstitue une sélection optimale de `target` actions (ou plus si `saturate` et target == top)
+    en mémoire O(K×W), par diviser pour régner comme `reconstruct_hirschberg`.
+
+    Le budget et le nombre d'actions sont partagés entre les deux moitiés : les lignes des partages
+    k1 + k2 du nombre d'actions sont sommées d'un bloc, et un seul argmax donne le meilleur
+    partage du nombre d'actions et du budget.
+
+    Retourne: les indices des actions sélectionnées
+    """
+    def category(count: int) -> int:
+        return min(count, top) if saturate else count
+
+    def solve(low: int, high: int, budget: int, target: int) -> List[int]:
+        if high - low == 1:
+            taken = category(1)
+            keep = taken == target and costs[low] <= budget and (target > 0 or benefits[low] > 0)
+            return [low] if keep else []
+        middle = (low + high) // 2
+        left = count_table(costs[low:middle], benefits[low:middle], budget, top, saturate)
+        right = count_table(costs[middle:high], benefits[middle:high], budget, top, saturate)
+
+        at_least = saturate and target == top
+        if at_least:
+            # « top ou plus » : avec k1 actions à gauche, il en faut au moins top - k1 à droite
+            left_counts = np.arange(top + 1)
+            suffix_best = np.maximum.accumulate(right[::-1], axis=0)[::-1]
+            right_rows = suffix_best[top - left_counts]
+            del suffix_best
+        else:
+            left_counts = np.arange(target + 1)
+            right_rows = right[target - left_counts]
+        values = left[left_counts]
+        values += right_rows[:, ::-1]
+        del right_rows
+        row, split = np.unravel_index(int(np.argmax(values)), values.shape)
+        del values
+        left_count = int(left_counts[row])
+        split = int(split)
+        if at_least:
+            right_count = top - left_count
+            right_count += int(np.argmax(right[right_count:, budget - split]))
+        else:
+            right_count = target - left_count
+        del left, right
+
+        selection = solve(low, middle, split, left_count)
+        return selection + solve(middle, high, budget - split, right_count)
+
+    return solve(0, len(costs), capacity, target)
+
+
+def knapsack_cardinality(actions: List[Action], max_budget: float, min_count: int = 0,
+                         max_count: Optional[int] = None,
+                         min_position: float = 0.0,
+                         max_memory_mb: float = CURVE_MAX_MEMORY_MB
+                         ) -> Tuple[List[Action], float, float, float]:
+    """
+    Sélection optimale contenant entre `min_count` et `max_count` actions (sans maximum si None),
+    chacune coûtant au moins `min_position` euros.
+
+    Si aucune sélection ne respecte les contraintes, la combinaison renvoyée est vide. Lève une
+    ValueError si les tableaux dépasseraient `max_memory_mb`.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, pic_mémoire_allouée)
+    """
+    if min_count < 0 or (max_count is not None and max_count < min_count):
+        raise ValueError("Il faut 0 <= nombre minimal d'actions <= nombre maximal d'actions.")
+
+    capacity = to_cents(max_budget)
+    minimum_cost = to_cents(min_position)
+    candidates = [action for action in actions if minimum_cost <= to_cents(action.cost) <= capacity]
+    if capacity >= 0 and candidates:
+        groups = remove_dominated_groups(group_identical_actions(candidates), capacity, max_count)
+        candidates = [action for group in groups for action in group]
+    if capacity < 0 or len(candidates) < min_count:
+        return [], 0.0, 0.0, 0.0
+
+    costs = [to_cents(action.cost) for action in candidates]
+    granularity = math.gcd(*costs) or 1
+    costs = [cost // granularity for cost in costs]
+    capacity //= granularity
+    benefits = [solver_benefit(action) for action in candidates]
+
+    # Au plus `feasible` actions tiennent ensemble dans le budget : les moins chères
+    feasible = int(np.searchsorted(np.cumsum(sorted(costs)), capacity, side='right'))
+    if min_count > feasible:
+        return [], 0.0, 0.0, 0.0
+    if max_count is not None and max_count >= feasible:
+        max_count = None
+
+    def select(top: int, saturate: bool) -> List[int]:
+        """Sélection optimale ; la dernière ligne du tableau compte K_max ou « K_min ou plus »."""
+        if top == 0 and saturate:
+            # Aucune contrainte de nombre : sac à dos 0/1 ordinaire, en mémoire O(W)
+            return reconstruct_hirschberg(costs, benefits, capacity)
+        memory_mb = CARDINALITY_TABLES * (top + 1) * (capacity + 1) * 8 / (1024 * 1024)
+        if memory_mb > max_memory_mb:
+            raise ValueError(
+                f"Le tableau par nombre d'actions pour {max_budget}€ occuperait "
+                f"{memory_mb:.0f} MB, au-delà de la limite de {max_memory_mb} MB."
+            )
+        final = count_table(costs, benefits, capacity, top, saturate)[:, capacity]
+        target = min_count + int(np.argmax(final[min_count:]))
+        if final[target] == -np.inf:
+            return []
+        return reconstruct_cardinality(costs, benefits, capacity, target, top, saturate)
+
+    def solve():
+        if not candidates:
+            return []
+        # Un optimum moins contraint qui respecte les bornes est l'optimum cherché
+        chosen = select(0, True)
+        if len(chosen) < min_count:
+            chosen = select(min_count, True)
+        if max_count is not None and len(chosen) > max_count:
+            chosen = select(max_count, False)
+        return [candidates[i] for i in chosen]
+
+    best_combination, memory_used = traced_peak_memory(solve)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
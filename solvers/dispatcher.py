@@ -0,0 +1,179 @@
+"""
+Choix automatique du moteur de résolution le plus adapté à chaque instance.
+
+L'instance est d'abord réduite (voir `solvers.reduction`), puis le temps et la mémoire de chaque
+moteur sont estimés à partir du nombre d'actions, de la granularité du budget (PGCD des coûts)
+et de l'étendue des bénéfices. Le moteur exact le plus rapide qui respecte les limites est retenu ;
+à défaut, on se rabat sur le Greedy amélioré par recherche locale.
+"""
+
+import logging
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.action import Action
+from solvers.branch_and_bound import branch_and_bound
+from solvers.dynamic_programming import (knapsack_dp, knapsack_dp_by_profit, to_cents,
+                                         to_exact_benefit)
+from solvers.local_search import LOCAL_SEARCH_TIME_BUDGET, greedy_local_search
+from solvers.reduction import reduce_instance
+
+logger = logging.getLogger(__name__)
+
+# Limites par défaut d'une résolution
+DISPATCH_MAX_TIME = 1.0
+DISPATCH_MAX_MEMORY_MB = 256
+
+# Constantes de calibration (mesurées sur les jeux de données fournis)
+DP_SECONDS_PER_CELL = 2e-9
+DP_SECONDS_PER_ACTION = 1e-5
+BRUTE_FORCE_SECONDS_PER_SUBSET = 1e-8
+BRUTE_FORCE_MAX_ACTIONS = 40
+BB_SECONDS_PER_NODE = 3e-6
+MB = 1024 * 1024
+
+
+class EngineEstimate:
+    """Estimation du coût d'un moteur de résolution sur une instance donnée."""
+
+    def __init__(self, name: str, label: str, exact: bool, time: float, memory_mb: float,
+                 run: Callable):
+        """Initialise l'estimation ; `run` suit l'interface (actions, budget) -> résultat."""
+        self.name = name
+        self.label = label
+        self.exact = exact
+        self.time = time
+        self.memory_mb = memory_mb
+        self.run = run
+
+    def fits(self, max_time: float, max_memory_mb: float) -> bool:
+        """Vérifie que l'estimation respecte les limites de temps et de mémoire."""
+        return self.time <= max_time and self.memory_mb <= max_memory_mb
+
+    def __str__(self) -> str:
+        """Résumé lisible de l'estimation."""
+        return f"{self.name} (~{self.time * 1000:.3g} ms, ~{self.memory_mb:.3g} MB)"
+
+
+def estimate_engines(actions: List[Action], max_budget: float,
+                     max_time: float) -> List[EngineEstimate]:
+    """Estime le temps et la mémoire de chaque moteur candidat pour l'instance (déjà réduite)."""
+    n = len(actions)
+    capacity = to_cents(max_budget)
+    costs = [to_cents(action.cost) for action in actions]
+    profits = [to_exact_benefit(action) for action in actions if to_cents(action.cost) <= capacity]
+
+    # Granularité du budget et étendue des bénéfices
+    budget_units = capacity // (math.gcd(*costs) or 1) + 1
+    profit_units = sum(profits) // (math.gcd(*profits) or 1) + 1
+
+    estimates = []
+    if n <= BRUTE_FORCE_MAX_ACTIONS:
+        from brute_force import find_best_combination_vectorized
+        estimates.append(EngineEstimate(
+            "brute_force", "Force brute vectorisée", True,
+            2 ** n * BRUTE_FORCE_SECONDS_PER_SUBSET, 4, find_best_combination_vectorized
+        ))
+
+    estimates.append(EngineEstimate(
+        "dp", "Programmation dynamique par coût", True,
+        n * (budget_units * DP_SECONDS_PER_CELL + DP_SECONDS_PER_ACTION),
+        (n * budget_units / 8 + budget_units * 17) / MB, knapsack_dp
+    ))
+    estimates.append(EngineEstimate(
+        "dp_hirschberg", "Programmation dynamique par coût, mémoire O(W)", True,
+        2 * n * (budget_units * DP_SECONDS_PER_CELL + DP_SECONDS_PER_ACTION),
+        budget_units * 24 / MB,
+        lambda candidates, budget: knapsack_dp(candidates, budget, reconstruction="hirschberg")
+    ))
+    estimates.append(EngineEstimate(
+        "dp_profit", "Programmation dynamique par bénéfice", True,
+        n * (profit_units * DP_SECONDS_PER_CELL + DP_SECONDS_PER_ACTION),
+        (n * profit_units / 8 + profit_units * 17) / MB, knapsack_dp_by_profit
+    ))
+
+    # Branch-and-bound : n² nœuds dans les cas courants, mais le pire cas est exponentiel.
+    # La recherche est donc bornée en nœuds pour rester dans la limite de temps.
+    max_nodes = max(int(max_time / BB_SECONDS_PER_NODE), 1)
+    estimates.append(EngineEstimate(
+        "bb", "Branch-and-bound", True,
+        n * n * BB_SECONDS_PER_NODE, n * 100 / MB,
+        lambda candidates, budget: run_bounded_branch_and_bound(candidates, budget, max_nodes)
+    ))
+
+    search_time = min(max_time, LOCAL_SEARCH_TIME_BUDGET)
+    estimates.append(EngineEstimate(
+        "local_search", "Greedy + recherche locale", False,
+        search_time, n * 64 / MB,
+        lambda candidates, budget: greedy_local_search(candidates, budget, search_time)
+    ))
+    return estimates
+
+
+def run_bounded_branch_and_bound(actions: List[Action], max_budget: float, max_nodes: int):
+    """Branch-and-bound limité en nœuds ; renvoie None si l'optimalité n'a pas pu être prouvée."""
+    stats = {}
+    result = branch_and_bound(actions, max_budget, max_nodes=max_nodes, stats=stats)
+    return result if stats['complete'] else None
+
+
+def solve_auto(actions: List[Action], max_budget: float,
+               max_time: float = DISPATCH_MAX_TIME, max_memory_mb: float = DISPATCH_MAX_MEMORY_MB,
+               decision: Optional[Dict[str, object]] = None
+               ) -> Tuple[List[Action], float, float, float]:
+    """
+    Réduit l'instance, choisit le moteur exact le plus rapide dans les limites puis résout.
+
+    Si `decision` est fourni, on y renseigne le moteur retenu, la raison du choix et les
+    estimations.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    reduced = reduce_instance(actions, max_budget)
+    estimates = estimate_engines(reduced.actions, reduced.max_budget, max_time)
+
+    exact = sorted(
+        [estimate for estimate in estimates
+         if estimate.exact and estimate.fits(max_time, max_memory_mb)],
+        key=lambda estimate: estimate.time
+    )
+    rejected = [str(estimate) for estimate in estimates
+                if estimate.exact and not estimate.fits(max_time, max_memory_mb)]
+    fallback = next(estimate for estimate in estimates if not estimate.exact)
+
+    chosen, result, reason = None, None, ""
+    for estimate in exact:
+        result = estimate.run(reduced.actions, reduced.max_budget)
+        if result is not None:
+            chosen = estimate
+            limits = f"{max_time} s, {max_memory_mb} MB"
+            reason = f"moteur exact le plus rapide dans les limites ({limits})"
+            break
+        rejected.append(f"{estimate.name} (optimalité non prouvée dans la limite de temps)")
+    if chosen is None:
+        chosen = fallback
+        result = fallback.run(reduced.actions, reduced.max_budget)
+        reason = "aucun moteur exact ne respecte les limites, repli sur l'heuristique"
+
+    logger.info(
+        "Moteur %s retenu pour %d actions (%d après réduction) : %s. Écartés : %s",
+        chosen, len(actions), len(reduced.actions), reason, ", ".join(rejected) or "aucun"
+    )
+    if decision is not None:
+        decision.update(
+            engine=chosen.name,
+            label=chosen.label,
+            reason=reason,
+            rejected=rejected,
+            reduced_count=len(reduced.actions),
+            estimates=[str(estimate) for estimate in estimates]
+        )
+
+    selection, _, _, memory_used = result
+    best_combination = reduced.expand(selection)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
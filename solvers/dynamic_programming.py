@@ -0,0 +1,331 @@
+"""
+Solveur exact du problème du sac à dos 0/1 par programmation dynamique.
+
+Les coûts sont convertis en centimes entiers afin que le budget devienne un indice
+de tableau. Le tableau DP est mis à jour action par action avec un seul `np.maximum`
+vectorisé, sans boucle Python interne sur le budget.
+"""
+
+import math
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from models.action import MICROS_PER_EURO, Action, to_cents
+
+# Modes de reconstruction de la sélection optimale
+RECONSTRUCTION_MODES = ("packed", "hirschberg")
+# Mémoire maximale d'une courbe budget/bénéfice (tableau DP et table des décisions), en MB
+CURVE_MAX_MEMORY_MB = 256
+
+
+def to_exact_benefit(action: Action) -> int:
+    """Bénéfice exact d'une action en millionièmes d'euro : centimes × centièmes de pourcent."""
+    if action.fixed_point:
+        return action.benefit_micros
+    return to_cents(action.cost) * to_cents(action.benefit_percent)
+
+
+def solver_benefit(action: Action):
+    """Bénéfice utilisé par les solveurs : entier exact en virgule fixe, flottant en euros sinon."""
+    return action.benefit_micros if action.fixed_point else action.benefit
+
+
+def benefit_dtype(actions: List[Action]) -> type:
+    """Type NumPy des tableaux de bénéfices : entiers exacts en virgule fixe, flottants sinon."""
+    return np.int64 if actions and actions[0].fixed_point else np.float64
+
+
+def traced_peak_memory(func: Callable, *args) -> Tuple[object, float]:
+    """
+    Exécute `func(*args)` et mesure son pic de mémoire allouée (tableaux NumPy compris) avec
+    tracemalloc.
+
+    Retourne: (résultat, pic_mémoire_en_MB)
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = func(*args)
+    finally:
+        peak = tracemalloc.get_traced_memory()[1]
+        if not already_tracing:
+            tracemalloc.stop()
+    return result, (peak - baseline) / (1024 * 1024)
+
+
+def add_to_table(dp: np.ndarray, take: np.ndarray, cost: int, benefit) -> np.ndarray:
+    """
+    Ajoute une action au tableau DP `dp` (modifié sur place) et renvoie sa ligne de décisions
+    compactée.
+    `take` est un tampon booléen de même taille que `dp`, réutilisé d'une action à l'autre.
+    """
+    take[:] = False
+    if cost == 0:
+        dp += benefit
+        take[:] = True
+    elif cost < len(dp):
+        candidate = dp[:-cost] + benefit
+        take[cost:] = candidate > dp[cost:]
+        np.maximum(dp[cost:], candidate, out=dp[cost:])
+    return np.packbits(take)
+
+
+def fill_table(actions: List[Action], costs: List[int], capacity: int,
+               history: Optional[List[Tuple[float, float]]] = None
+               ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Remplit le tableau DP et la table des décisions pour tous les budgets de 0 à `capacity`
+    centimes.
+
+    La table des décisions est compactée avec `np.packbits` : 1 bit par cellule au lieu d'un octet.
+
+    Retourne: (dp, keep) où dp[w] est le meilleur bénéfice pour un coût <= w et le bit (i, w) de
+    keep indique si l'action i est prise dans la solution optimale du préfixe i pour le budget w.
+    """
+    dp = np.zeros(capacity + 1, dtype=benefit_dtype(actions))
+    keep = np.zeros((len(actions), capacity // 8 + 1), dtype=np.uint8)
+    take = np.zeros(capacity + 1, dtype=np.bool_)
+
+    start_time = time.time()
+    for i, (action, cost) in enumerate(zip(actions, costs)):
+        keep[i] = add_to_table(dp, take, cost, solver_benefit(action))
+
+        if history is not None:
+            memory_used = (dp.nbytes + take.nbytes + keep[:i + 1].nbytes) / (1024 * 1024)
+            history.append(((time.time() - start_time) * 1000, memory_used))
+
+    return dp, keep
+
+
+def is_taken(keep: np.ndarray, index: int, budget: int) -> bool:
+    """Lit le bit de décision de l'action `index` pour un budget en centimes."""
+    return bool(keep[index, budget >> 3] >> (7 - (budget & 7)) & 1)
+
+
+def reconstruct(actions: List[Action], costs: List[int], keep: np.ndarray,
+                budget: int) -> List[Action]:
+    """
+    Reconstitue la sélection optimale pour un budget en centimes en remontant la table des
+    décisions.
+    """
+    selection = []
+    for i in range(len(actions) - 1, -1, -1):
+        if is_taken(keep, i, budget):
+            selection.append(actions[i])
+            budget -= costs[i]
+    selection.reverse()
+    return selection
+
+
+def best_values(costs: List[int], benefits: List[float], capacity: int) -> np.ndarray:
+    """
+    Tableau DP seul (sans table des décisions) : meilleur bénéfice pour chaque budget de 0 à
+    `capacity`.
+    """
+    dp = np.zeros(capacity + 1, dtype=np.asarray(benefits[:1]).dtype if benefits else np.float64)
+    for cost, benefit in zip(costs, benefits):
+        if cost == 0:
+            dp += benefit
+        elif cost <= capacity:
+            np.maximum(dp[cost:], dp[:-cost] + benefit, out=dp[cost:])
+    return dp
+
+
+def reconstruct_hirschberg(costs: List[int], benefits: List[float], capacity: int) -> List[int]:
+    """
+    Reconstitue la sélection optimale en mémoire O(W), par diviser pour régner (à la Hirschberg).
+
+    Les actions sont coupées en deux moitiés dont on calcule le tableau DP seul. Le meilleur partage
+    du budget w + (W - w) entre les deux moitiés est trouvé d'un seul argmax, puis chaque moitié est
+    résolue récursivement avec sa part du budget. Le temps reste en O(n×W), à un facteur près.
+
+    Retourne: les indices des actions sélectionnées
+    """
+    def solve(low: int, high: int, budget: int) -> List[int]:
+        if high - low == 1:
+            return [low] if costs[low] <= budget and benefits[low] > 0 else []
+        middle = (low + high) // 2
+        left = best_values(costs[low:middle], benefits[low:middle], budget)
+        right = best_values(costs[middle:high], benefits[middle:high], budget)
+        split = int(np.argmax(left + right[::-1]))
+        del left, right
+        return solve(low, middle, split) + solve(middle, high, budget - split)
+
+    return solve(0, len(costs), capacity) if costs else []
+
+
+def knapsack_dp(actions: List[Action], max_budget: float,
+                history: Optional[List[Tuple[float, float]]] = None,
+                reconstruction: str = "packed") -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche la combinaison optimale d'actions par programmation dynamique sur les centimes.
+
+    `reconstruction` choisit comment la sélection est reconstituée :
+    - "packed" : table des décisions compactée à 1 bit par cellule (n×W/8 octets) ;
+    - "hirschberg" : diviser pour régner en mémoire O(W), au prix d'environ deux fois plus de
+      calcul.
+
+    Si `history` est fourni (mode "packed" seulement), on y ajoute après chaque action le couple
+    (temps cumulé en ms, mémoire utilisée en MB) pour les graphiques de complexité.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, pic_mémoire_allouée)
+    """
+    if reconstruction not in RECONSTRUCTION_MODES:
+        raise ValueError(f"Mode de reconstruction inconnu : {reconstruction}")
+
+    capacity = to_cents(max_budget)
+    if not actions or capacity < 0:
+        return [], 0.0, 0.0, 0.0
+
+    # Granularité : si tous les coûts sont multiples de g centimes, le budget se compte en unités
+    # de g
+    costs = [to_cents(action.cost) for action in actions]
+    granularity = math.gcd(*costs) or 1
+    costs = [cost // granularity for cost in costs]
+    capacity //= granularity
+    if reconstruction == "packed":
+        def solve():
+            _, keep = fill_table(actions, costs, capacity, history)
+            return reconstruct(actions, costs, keep, capacity)
+    else:
+        def solve():
+            benefits = [solver_benefit(action) for action in actions]
+            return [actions[i] for i in reconstruct_hirschberg(costs, benefits, capacity)]
+
+    best_combination, memory_used = traced_peak_memory(solve)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+def knapsack_dp_by_profit(actions: List[Action], max_budget: float
+                          ) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche la combinaison optimale par programmation dynamique sur les bénéfices exacts.
+
+    Le tableau donne le coût minimal pour atteindre chaque bénéfice (divisé par le PGCD des
+    bénéfices), ce qui est préférable à la version par coût quand les bénéfices sont peu nombreux
+    et petits.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, pic_mémoire_allouée)
+    """
+    capacity = to_cents(max_budget)
+    candidates = [action for action in actions if to_cents(action.cost) <= capacity]
+    if not candidates:
+        return [], 0.0, 0.0, 0.0
+
+    costs = [to_cents(action.cost) for action in candidates]
+    profits = [to_exact_benefit(action) for action in candidates]
+    granularity = math.gcd(*profits) or 1
+    profits = [profit // granularity for profit in profits]
+
+    def solve():
+        total = sum(profits)
+        infinity = np.iinfo(np.int64).max // 2
+        min_costs = np.full(total + 1, infinity, dtype=np.int64)
+        min_costs[0] = 0
+        keep = np.zeros((len(candidates), total // 8 + 1), dtype=np.uint8)
+        take = np.zeros(total + 1, dtype=np.bool_)
+        for i, (cost, profit) in enumerate(zip(costs, profits)):
+            take[:] = False
+            if profit > 0:
+                candidate = min_costs[:-profit] + cost
+                take[profit:] = candidate < min_costs[profit:]
+                np.minimum(min_costs[profit:], candidate, out=min_costs[profit:])
+            keep[i] = np.packbits(take)
+
+        best = int(np.flatnonzero(min_costs <= capacity).max())
+        return reconstruct(candidates, profits, keep, best)
+
+    best_combination, memory_used = traced_peak_memory(solve)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
+
+
+class BudgetCurve:
+    """
+    Courbe budget/bénéfice optimale obtenue en une seule passe de programmation dynamique.
+
+    Le tableau DP final donne déjà le bénéfice optimal pour chaque budget au centime près,
+    et la table des décisions permet d'en reconstituer la sélection sans nouveau calcul.
+    Comme dans `knapsack_dp`, le budget se compte en unités du PGCD des coûts.
+    """
+
+    def __init__(self, actions: List[Action], max_budget: float,
+                 max_memory_mb: float = CURVE_MAX_MEMORY_MB):
+        """
+        Calcule la courbe pour tous les budgets de 0 à `max_budget` euros.
+        Lève une ValueError si le tableau et la table des décisions dépasseraient `max_memory_mb`.
+        """
+        self.actions = actions
+        costs = [to_cents(action.cost) for action in actions]
+        self.granularity = math.gcd(*costs) or 1
+        self.costs = [cost // self.granularity for cost in costs]
+        self.capacity = max(to_cents(max_budget), 0) // self.granularity
+
+        cells = self.capacity + 1
+        itemsize = np.dtype(benefit_dtype(actions)).itemsize
+        memory_mb = (len(actions) * (cells // 8 + 1) + cells * (itemsize + 1)) / (1024 * 1024)
+        if memory_mb > max_memory_mb:
+            raise ValueError(
+                f"La courbe jusqu'à {max_budget}€ occuperait {memory_mb:.0f} MB, "
+                f"au-delà de la limite de {max_memory_mb} MB."
+            )
+        self.benefits, self.keep = fill_table(actions, self.costs, self.capacity)
+
+    @property
+    def max_budget(self) -> float:
+        """Budget maximal couvert par la courbe, en euros."""
+        return self.capacity * self.granularity / 100
+
+    @property
+    def memory_used(self) -> float:
+        """Mémoire occupée par le tableau DP et la table des décisions, en MB."""
+        return (self.benefits.nbytes + self.keep.nbytes) / (1024 * 1024)
+
+    def budget_index(self, budget: float) -> int:
+        """Indice du tableau correspondant à un budget, borné à la plage couverte par la courbe."""
+        return min(max(to_cents(budget), 0) // self.granularity, self.capacity)
+
+    def best_benefit(self, budget: float) -> float:
+        """Bénéfice optimal pour un budget donné, en euros."""
+        return float(self.to_euros(self.benefits[self.budget_index(budget)]))
+
+    def to_euros(self, values):
+        """
+        Convertit des valeurs du tableau DP en euros (elles sont en millionièmes d'euro en virgule
+        fixe).
+        """
+        if self.benefits.dtype == np.int64:
+            return values / MICROS_PER_EURO
+        return values
+
+    def selection(self, budget: float) -> List[Action]:
+        """Sélection optimale pour un budget donné."""
+        return reconstruct(self.actions, self.costs, self.keep, self.budget_index(budget))
+
+    def marginal_returns(self, step: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Échantillonne la courbe tous les `step` euros et calcule le rendement marginal (prix
+        fictif), c'est-à-dire le bénéfice supplémentaire par euro de budget ajouté.
+
+        Retourne: (budgets, bénéfices, rendements_marginaux)
+        """
+        stride = max(to_cents(step) // self.granularity, 1)
+        indices = np.arange(0, self.capacity + 1, stride)
+        benefits = self.to_euros(self.benefits[indices])
+        returns = np.diff(benefits, prepend=0.0) / (stride * self.granularity / 100)
+        return indices * self.granularity / 100, benefits, returns
@@ -0,0 +1,145 @@
+"""
+Schéma d'approximation entièrement polynomial (FPTAS) pour les très grands univers d'actions.
+
+Variante de Lawler : seules les actions « grandes » (bénéfice >= ε/2 × borne inférieure) passent
+par la programmation dynamique sur les bénéfices arrondis, et pour chaque valeur arrondie on ne
+garde que les moins chères pouvant figurer ensemble dans une solution. Les « petites » actions
+complètent ensuite le budget restant par ratio décroissant. Le coût du calcul ne dépend plus que
+de n log n et de 1/ε, et la solution vaut au moins (1 - ε) fois l'optimum. Ce coût croît
+toutefois vite quand ε diminue : comme pour `BudgetCurve`, un tableau qui dépasserait
+`CURVE_MAX_MEMORY_MB` est refusé par une ValueError.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from models.action import Action
+from solvers.dynamic_programming import CURVE_MAX_MEMORY_MB, to_cents, traced_peak_memory
+from solvers.reduction import greedy_lower_bound
+
+# Précision par défaut : solution garantie à 10 % de l'optimum
+FPTAS_EPSILON = 0.1
+# Octets par bénéfice arrondi des vecteurs de la programmation dynamique (coûts minimaux, bénéfices
+# exacts, candidats et temporaires de np.where, masque), hors décisions compactées
+FPTAS_BYTES_PER_PROFIT = 33
+
+
+def select_large_actions(profits: np.ndarray, costs: np.ndarray, upper_bound: float,
+                         scale: float) -> np.ndarray:
+    """
+    Ne garde, pour chaque bénéfice arrondi q, que les floor(U / (q × K)) actions les moins chères :
+    une solution de valeur <= U ne peut pas en contenir davantage.
+
+    Retourne: les indices des actions conservées
+    """
+    order = np.lexsort((costs, profits))
+    sorted_profits = profits[order]
+    group_starts = np.searchsorted(sorted_profits, sorted_profits, side='left')
+    ranks = np.arange(order.size) - group_starts
+    # La tolérance évite qu'un arrondi flottant ne ramène une limite de 1 à 0
+    limits = np.floor(upper_bound / (sorted_profits * scale) * (1 + 1e-9)).astype(np.int64)
+    return order[ranks < limits]
+
+
+def knapsack_fptas(actions: List[Action], max_budget: float,
+                   epsilon: float = FPTAS_EPSILON, max_memory_mb: float = CURVE_MAX_MEMORY_MB
+                   ) -> Tuple[List[Action], float, float, float, float]:
+    """
+    Recherche une combinaison d'actions dont le bénéfice vaut au moins (1 - ε) fois l'optimum.
+
+    La borne supérieure renvoyée majore l'optimum : min(relaxation continue, bénéfice / (1 - ε)).
+    Lève une ValueError si le tableau dépasserait `max_memory_mb`.
+
+    Retourne: (combinaison, coût_total, bénéfice_total, pic_mémoire_allouée, borne_supérieure)
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon doit être compris strictement entre 0 et 1.")
+
+    capacity = to_cents(max_budget)
+    candidates = [action for action in actions if to_cents(action.cost) <= capacity]
+    if not candidates:
+        return [], 0.0, 0.0, 0.0, 0.0
+
+    def solve():
+        ratios = np.array([action.ratio for action in candidates], dtype=np.float64)
+        order = np.argsort(-ratios, kind='stable')
+        costs = np.array([to_cents(candidates[i].cost) for i in order], dtype=np.int64)
+        benefits = np.array([candidates[i].benefit for i in order], dtype=np.float64)
+
+        # Bornes : Greedy (inférieure) et relaxation continue de Dantzig (supérieure)
+        lower_bound = greedy_lower_bound(costs.tolist(), benefits.tolist(), capacity)
+        prefix_costs = np.concatenate(([0], np.cumsum(costs)))
+        prefix_benefits = np.concatenate(([0.0], np.cumsum(benefits)))
+        critical = int(np.searchsorted(prefix_costs, capacity, side='right')) - 1
+        upper_bound = prefix_benefits[critical]
+        if critical < costs.size:
+            leftover = capacity - prefix_costs[critical]
+            upper_bound += leftover * benefits[critical] / costs[critical]
+        if lower_bound <= 0:
+            return [], upper_bound
+
+        # La moitié de ε va à l'arrondi des grandes actions, l'autre au complément par les petites
+        delta = epsilon / 2
+        scale = delta * delta * lower_bound / 2
+        is_large = benefits >= delta * lower_bound
+        large = np.flatnonzero(is_large)
+        small = np.flatnonzero(~is_large)
+
+        scaled = np.floor(benefits[large] / scale).astype(np.int64)
+        kept = select_large_actions(scaled, costs[large], upper_bound, scale)
+        large, scaled = large[kept], scaled[kept]
+
+        # Programmation dynamique par bénéfice arrondi : coût minimal pour atteindre chaque total q
+        max_scaled = int(upper_bound // scale) + 1
+        table_bytes = large.size * (max_scaled // 8 + 1) + FPTAS_BYTES_PER_PROFIT * (max_scaled + 1)
+        memory_mb = table_bytes / (1024 * 1024)
+        if memory_mb > max_memory_mb:
+            raise ValueError(
+                f"Le tableau pour ε = {epsilon} occuperait {memory_mb:.0f} MB, "
+                f"au-delà de la limite de {max_memory_mb} MB : augmentez ε."
+            )
+        infinity = np.iinfo(np.int64).max // 2
+        min_costs = np.full(max_scaled + 1, infinity, dtype=np.int64)
+        min_costs[0] = 0
+        true_benefits = np.zeros(max_scaled + 1, dtype=np.float64)
+        keep = np.zeros((large.size, max_scaled // 8 + 1), dtype=np.uint8)
+        take = np.zeros(max_scaled + 1, dtype=np.bool_)
+        for row, (index, profit) in enumerate(zip(large, scaled)):
+            if profit > max_scaled:
+                continue
+            candidate = min_costs[:-profit] + costs[index]
+            take[:] = False
+            take[profit:] = candidate < min_costs[profit:]
+            np.minimum(min_costs[profit:], candidate, out=min_costs[profit:])
+            true_benefits[profit:] = np.where(
+                take[profit:], true_benefits[:-profit] + benefits[index], true_benefits[profit:]
+            )
+            keep[row] = np.packbits(take)
+
+        # Complément par les petites actions : plus long préfixe (par ratio) tenant dans le reste
+        small_prefix_costs = np.concatenate(([0], np.cumsum(costs[small])))
+        small_prefix_benefits = np.concatenate(([0.0], np.cumsum(benefits[small])))
+        reachable = np.flatnonzero(min_costs <= capacity)
+        leftovers = capacity - min_costs[reachable]
+        small_counts = np.searchsorted(small_prefix_costs, leftovers, side='right') - 1
+        totals = true_benefits[reachable] + small_prefix_benefits[small_counts]
+        best = int(np.argmax(totals))
+
+        selection = [int(i) for i in small[:small_counts[best]]]
+        total = int(reachable[best])
+        for row in range(large.size - 1, -1, -1):
+            if keep[row, total >> 3] >> (7 - (total & 7)) & 1:
+                selection.append(int(large[row]))
+                total -= int(scaled[row])
+        return [candidates[order[i]] for i in sorted(selection)], upper_bound
+
+    (best_combination, upper_bound), memory_used = traced_peak_memory(solve)
+    total_benefit = Action.total_portfolio_benefit(best_combination)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        total_benefit,
+        memory_used,
+        min(upper_bound, total_benefit / (1 - epsilon))
+    )
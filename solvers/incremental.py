@@ -0,0 +1,269 @@
+"""
+Ré-optimisation incrémentale lorsque quelques lignes du jeu de données changent à la fois.
+
+`IncrementalOptimizer` garde l'état des solveurs entre deux modifications :
+- l'ordre du Greedy dans une liste triée (insertion et suppression par dichotomie) ;
+- la programmation dynamique exacte : une ligne de décisions compactée par action et une copie du
+  tableau DP toutes les `checkpoint_every` actions. Une modification à la position k ne recalcule
+  que les actions à partir du point de reprise précédant k. Une action modifiée est replacée en
+  fin d'ordre, si bien que les actions qui bougent souvent coûtent peu à recalculer.
+Baisser le budget ne demande aucun calcul, le tableau couvrant déjà tous les budgets inférieurs.
+
+`replay_ticks` rejoue un flux de modifications enregistré (voir `load_ticks`) pour tester et
+mesurer l'optimiseur, en comparant au besoin chaque résultat à une résolution complète.
+"""
+
+import time
+from bisect import bisect_left, insort
+from itertools import count
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.action import Action
+from solvers.dynamic_programming import (add_to_table, benefit_dtype, knapsack_dp, reconstruct,
+                                         solver_benefit, to_cents, to_exact_benefit)
+
+# Nombre d'actions entre deux copies du tableau DP
+INCREMENTAL_CHECKPOINT = 32
+# Opérations reconnues dans un flux de modifications
+TICK_OPERATIONS = ("insert", "delete", "update")
+
+
+class IncrementalOptimizer:
+    """
+    Optimiseur qui accepte des insertions, suppressions et mises à jour d'actions identifiées par
+    leur nom.
+
+    Un nom peut désigner plusieurs lignes (les jeux de données en contiennent) : suppression et mise
+    à jour portent alors sur la plus ancienne.
+    """
+
+    def __init__(self, actions: List[Action], max_budget: float,
+                 checkpoint_every: int = INCREMENTAL_CHECKPOINT):
+        """Construit l'état initial pour un budget de `max_budget` euros."""
+        self.checkpoint_every = checkpoint_every
+        self.budget = max(to_cents(max_budget), 0)
+        self.capacity = self.budget
+        self.dtype = benefit_dtype(actions)
+        self.items = []
+        self.costs = []
+        # Nom -> actions de ce nom, de la plus ancienne à la plus récente
+        self.actions_by_name = {}
+        self.greedy_order = []
+        self.greedy_entries = {}
+        self.serial = count()
+        self.recomputed_rows = 0
+        self.reset_table(len(actions))
+        for action in actions:
+            self.insert(action)
+
+    def reset_table(self, rows: int):
+        """Réalloue la table des décisions et repart du tableau DP vide."""
+        self.keep = np.zeros((max(rows, 1), self.capacity // 8 + 1), dtype=np.uint8)
+        self.checkpoints = [np.zeros(self.capacity + 1, dtype=self.dtype)]
+        self.dp = self.checkpoints[0].copy()
+        self.dirty_from = 0
+
+    def mark_dirty(self, index: int):
+        """Invalide les points de reprise situés après la position `index`."""
+        del self.checkpoints[index // self.checkpoint_every + 1:]
+        self.dirty_from = index if self.dirty_from is None else min(self.dirty_from, index)
+
+    # Opérations sur les actions
+    def insert(self, action: Action):
+        """Ajoute une action en fin d'ordre."""
+        self.actions_by_name.setdefault(action.name, []).append(action)
+        entry = (-action.ratio, next(self.serial), action)
+        self.greedy_entries[id(action)] = entry
+        insort(self.greedy_order, entry)
+
+        if len(self.items) == len(self.keep):
+            self.keep = np.concatenate([self.keep, np.zeros_like(self.keep)])
+        self.items.append(action)
+        self.costs.append(to_cents(action.cost))
+        self.mark_dirty(len(self.items) - 1)
+
+    def delete(self, name: str) -> Action:
+        """Retire l'action `name` (la plus ancienne de ce nom) et la renvoie."""
+        homonyms = self.actions_by_name.get(name)
+        if not homonyms:
+            raise KeyError(f"L'action {name} n'existe pas.")
+        action = homonyms.pop(0)
+        if not homonyms:
+            del self.actions_by_name[name]
+        entry = self.greedy_entries.pop(id(action))
+        del self.greedy_order[bisect_left(self.greedy_order, entry)]
+
+        index = next(i for i, item in enumerate(self.items) if item is action)
+        del self.items[index]
+        del self.costs[index]
+        self.mark_dirty(index)
+        return action
+
+    def update(self, name: str, cost: float, benefit_percent: float) -> Action:
+        """Change le prix et le bénéfice (en %) de l'action `name`, replacée en fin d'ordre."""
+        old = self.delete(name)
+        action = Action(name, cost, benefit_percent, fixed_point=old.fixed_point,
+                        max_quantity=old.max_quantity, risk=old.risk)
+        self.insert(action)
+        return action
+
+    def sync(self, actions: List[Action]) -> int:
+        """
+        Aligne l'état sur une nouvelle liste d'actions (par exemple un fichier relu) en n'appliquant
+        que les différences. Retourne le nombre d'opérations appliquées.
+        """
+        def signature(homonyms: List[Action]) -> List[Tuple[int, float]]:
+            return sorted((to_cents(action.cost), action.benefit_percent) for action in homonyms)
+
+        incoming = {}
+        for action in actions:
+            incoming.setdefault(action.name, []).append(action)
+        operations = 0
+        for name in [name for name in self.actions_by_name if name not in incoming]:
+            for _ in range(len(self.actions_by_name[name])):
+                self.delete(name)
+                operations += 1
+        for name, homonyms in incoming.items():
+            current = self.actions_by_name.get(name, [])
+            if signature(current) == signature(homonyms):
+                continue
+            # `current` est la liste que `delete` vide : sa taille est lue avant les suppressions
+            removed = len(current)
+            for _ in range(removed):
+                self.delete(name)
+            for action in homonyms:
+                self.insert(action)
+            operations += removed + len(homonyms)
+        return operations
+
+    def set_budget(self, max_budget: float):
+        """Change le budget ; le tableau n'est recalculé que si le budget dépasse sa largeur."""
+        self.budget = max(to_cents(max_budget), 0)
+        if self.budget > self.capacity:
+            self.capacity = self.budget
+            self.reset_table(len(self.keep))
+
+    # Résolution
+    def refresh(self):
+        """Recalcule le tableau DP à partir du dernier point de reprise valide."""
+        if self.dirty_from is None:
+            return
+        start = (len(self.checkpoints) - 1) * self.checkpoint_every
+        self.dp = self.checkpoints[-1].copy()
+        take = np.zeros(self.capacity + 1, dtype=np.bool_)
+        for i in range(start, len(self.items)):
+            block, offset = divmod(i, self.checkpoint_every)
+            if offset == 0 and block == len(self.checkpoints):
+                self.checkpoints.append(self.dp.copy())
+            self.keep[i] = add_to_table(self.dp, take, self.costs[i], solver_benefit(self.items[i]))
+        self.recomputed_rows += len(self.items) - start
+        self.dirty_from = None
+
+    @property
+    def memory_used(self) -> float:
+        """Mémoire occupée par la table des décisions et les points de reprise, en MB."""
+        checkpoints = sum(checkpoint.nbytes for checkpoint in self.checkpoints)
+        return (self.keep.nbytes + checkpoints) / (1024 * 1024)
+
+    def selection(self) -> Tuple[List[Action], float, float, float]:
+        """
+        Sélection optimale pour le budget courant.
+
+        Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+        """
+        self.refresh()
+        best_combination = reconstruct(self.items, self.costs, self.keep, self.budget)
+        return (
+            best_combination,
+            Action.total_portfolio_cost(best_combination),
+            Action.total_portfolio_benefit(best_combination),
+            self.memory_used
+        )
+
+    def greedy_selection(self) -> Tuple[List[Action], float, float]:
+        """
+        Sélection du Greedy (actions par ratio décroissant tant qu'elles tiennent dans le budget).
+
+        Retourne: (combinaison, coût_total, bénéfice_total)
+        """
+        remaining = self.budget
+        selected = []
+        for _, _, action in self.greedy_order:
+            cost = to_cents(action.cost)
+            if cost <= remaining:
+                selected.append(action)
+                remaining -= cost
+        return (
+            selected,
+            Action.total_portfolio_cost(selected),
+            Action.total_portfolio_benefit(selected)
+        )
+
+
+def load_ticks(file_path: str) -> List[Dict[str, object]]:
+    """
+    Charge un flux de modifications enregistré : un CSV aux colonnes op, name, price, profit,
+    où op vaut insert, delete ou update (price et profit sont vides pour delete).
+    """
+    data = pd.read_csv(file_path, header=0)
+    ticks = []
+    for row in data.itertuples(index=False):
+        if row.op not in TICK_OPERATIONS:
+            raise ValueError(f"Opération inconnue : {row.op}")
+        ticks.append({
+            'op': row.op,
+            'name': row.name,
+            'cost': None if pd.isna(row.price) else float(row.price),
+            'benefit_percent': None if pd.isna(row.profit) else float(str(row.profit).strip('%'))
+        })
+    return ticks
+
+
+def apply_tick(optimizer: IncrementalOptimizer, tick: Dict[str, object]):
+    """Applique une modification du flux à l'optimiseur."""
+    if tick['op'] == "insert":
+        optimizer.insert(Action(tick['name'], tick['cost'], tick['benefit_percent']))
+    elif tick['op'] == "delete":
+        optimizer.delete(tick['name'])
+    elif tick['op'] == "update":
+        optimizer.update(tick['name'], tick['cost'], tick['benefit_percent'])
+    else:
+        raise ValueError(f"Opération inconnue : {tick['op']}")
+
+
+def replay_ticks(optimizer: IncrementalOptimizer, ticks: List[Dict[str, object]],
+                 verify: bool = False) -> pd.DataFrame:
+    """
+    Rejoue un flux de modifications en ré-optimisant après chacune.
+
+    Avec `verify`, chaque résultat est comparé à une résolution complète (`knapsack_dp` sur toutes
+    les actions) dont le temps est aussi mesuré ; une différence de bénéfice lève une
+    AssertionError.
+
+    Retourne: un DataFrame avec, par modification, l'opération, le temps incrémental (ms), le
+    bénéfice, et avec `verify` le temps de la résolution complète (ms).
+    """
+    records = []
+    for tick in ticks:
+        start_time = time.time()
+        apply_tick(optimizer, tick)
+        selection, _, total_benefit, _ = optimizer.selection()
+        record = {
+            'op': tick['op'],
+            'name': tick['name'],
+            'incremental_ms': (time.time() - start_time) * 1000,
+            'total_benefit': total_benefit
+        }
+        if verify:
+            start_time = time.time()
+            expected, _, _, _ = knapsack_dp(optimizer.items, optimizer.budget / 100)
+            record['cold_ms'] = (time.time() - start_time) * 1000
+            if sum(map(to_exact_benefit, selection)) != sum(map(to_exact_benefit, expected)):
+                raise AssertionError(
+                    f"Résultat incrémental différent de la résolution complète après {tick}"
+                )
+        records.append(record)
+    return pd.DataFrame(records)
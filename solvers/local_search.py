@@ -0,0 +1,245 @@
+"""
+Heuristique Greedy améliorée par recherche locale.
+
+Le point de départ est le meilleur entre le Greedy complet (toutes les actions parcourues par
+ratio décroissant, sans s'arrêter à la première qui ne tient pas) et la meilleure action seule,
+ce qui garantit déjà la moitié de l'optimum. Des mouvements d'ajout (d'une ou deux actions) et
+d'échange 1-1, 1-2, 2-1 et 2-2 (une ou deux actions sortent, une ou deux entrent) sont ensuite
+appliqués tant qu'ils améliorent le bénéfice et que le temps le permet.
+
+Les actions entrantes sont cherchées dans des index triés par coût : toutes les actions hors
+portefeuille pour une entrée seule, et les paires formées parmi les `LOCAL_SEARCH_POOL_SIZE`
+actions hors portefeuille de meilleur ratio pour deux entrées. Les paires sortantes sont
+parcourues par blocs d'au plus `LOCAL_SEARCH_PAIR_CHUNK` paires, la mémoire reste donc bornée
+quelle que soit la taille du portefeuille.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from models.action import Action
+from models.action_table import ActionTable
+from solvers.dynamic_programming import to_cents, traced_peak_memory
+
+# Temps maximal accordé à la recherche locale, en secondes
+LOCAL_SEARCH_TIME_BUDGET = 1.0
+# Nombre d'actions hors portefeuille (meilleurs ratios) combinées deux à deux pour entrer ensemble
+LOCAL_SEARCH_POOL_SIZE = 256
+# Nombre maximal de paires d'actions du portefeuille évaluées à la fois pour sortir ensemble
+LOCAL_SEARCH_PAIR_CHUNK = 1 << 20
+
+
+class CandidateIndex:
+    """
+    Index des actions hors portefeuille, triées par coût, avec le maximum de bénéfice de chaque
+    préfixe.
+
+    Il répond en O(log n) à : « quelle action non sélectionnée rapporte le plus pour un coût
+    <= X ? ».
+    """
+
+    def __init__(self, costs: np.ndarray, benefits: np.ndarray):
+        """Prépare l'ordre par coût, calculé une seule fois."""
+        self.order = np.argsort(costs, kind='stable')
+        self.sorted_costs = costs[self.order]
+        self.sorted_benefits = benefits[self.order]
+
+    def rebuild(self, selected: np.ndarray):
+        """Recalcule les maxima de préfixe des actions non sélectionnées (masque `selected`)."""
+        values = np.where(selected[self.order], -np.inf, self.sorted_benefits)
+        self.prefix_best = np.maximum.accumulate(values)
+        positions = np.where(values == self.prefix_best, np.arange(values.size), 0)
+        self.prefix_position = np.maximum.accumulate(positions)
+
+    def best_within(self, limits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pour chaque limite de coût, donne la meilleure action non sélectionnée qui tient dedans.
+
+        Retourne: (indices_des_actions, bénéfices), avec un bénéfice de -inf s'il n'y en a aucune.
+        """
+        positions = np.searchsorted(self.sorted_costs, limits, side='right') - 1
+        found = positions >= 0
+        positions = np.maximum(positions, 0)
+        benefits = np.where(found, self.prefix_best[positions], -np.inf)
+        return self.order[self.prefix_position[positions]], benefits
+
+
+def initial_solution(costs: np.ndarray, benefits: np.ndarray, ratios: np.ndarray,
+                     capacity: int) -> np.ndarray:
+    """Meilleur entre le Greedy complet par ratio et la meilleure action seule, en masque."""
+    selected = np.zeros(costs.size, dtype=np.bool_)
+    remaining = capacity
+    # Greedy vectorisé : on prend le plus long préfixe qui tient, on saute l'action suivante
+    # (elle ne tient plus), puis on recommence sur les actions encore abordables
+    pending = np.argsort(-ratios, kind='stable')
+    while pending.size:
+        pending = pending[costs[pending] <= remaining]
+        if not pending.size:
+            break
+        cumulative = np.cumsum(costs[pending])
+        count = int(np.searchsorted(cumulative, remaining, side='right'))
+        selected[pending[:count]] = True
+        remaining -= int(cumulative[count - 1])
+        pending = pending[count + 1:]
+
+    affordable = np.flatnonzero(costs <= capacity)
+    if affordable.size:
+        best_single = affordable[np.argmax(benefits[affordable])]
+        if benefits[best_single] > benefits[selected].sum():
+            selected[:] = False
+            selected[best_single] = True
+    return selected
+
+
+def iter_pairs(size: int, max_pairs: int = LOCAL_SEARCH_PAIR_CHUNK):
+    """Produit les paires (i, j), i < j < size, par blocs d'environ `max_pairs` paires au plus."""
+    rows = max(max_pairs // max(size, 1), 1)
+    for start in range(0, size - 1, rows):
+        firsts = np.arange(start, min(start + rows, size))
+        first, second = np.nonzero(firsts[:, None] < np.arange(size))
+        yield first + start, second
+
+
+def pair_candidates(costs: np.ndarray, benefits: np.ndarray, selected: np.ndarray,
+                    capacity: int) -> Optional[Tuple[CandidateIndex, np.ndarray, np.ndarray]]:
+    """
+    Index des paires formées parmi les actions hors portefeuille de meilleur ratio.
+
+    Retourne: (index des paires, première action, seconde action de chaque paire), ou None s'il y a
+    moins de deux actions candidates
+    """
+    outside = np.flatnonzero(~selected & (costs <= capacity))
+    if outside.size < 2:
+        return None
+    ratios = benefits[outside] / np.maximum(costs[outside], 1)
+    if outside.size > LOCAL_SEARCH_POOL_SIZE:
+        best_ratios = np.argpartition(-ratios, LOCAL_SEARCH_POOL_SIZE)[:LOCAL_SEARCH_POOL_SIZE]
+        outside = outside[best_ratios]
+    first, second = np.triu_indices(outside.size, k=1)
+    first, second = outside[first], outside[second]
+    index = CandidateIndex(costs[first] + costs[second], benefits[first] + benefits[second])
+    index.rebuild(np.zeros(first.size, dtype=np.bool_))
+    return index, first, second
+
+
+def improve(costs: np.ndarray, benefits: np.ndarray, selected: np.ndarray, capacity: int,
+            deadline: float) -> int:
+    """
+    Applique le meilleur mouvement améliorant (ajout d'une ou deux actions, échanges 1-1, 1-2, 2-1
+    et 2-2) jusqu'à ce qu'il n'y en ait plus ou que `deadline` soit dépassée. Le masque `selected`
+    est modifié en place.
+
+    Retourne: le nombre de mouvements appliqués
+    """
+    index = CandidateIndex(costs, benefits)
+    moves = 0
+    while time.perf_counter() < deadline:
+        index.rebuild(selected)
+        pairs = pair_candidates(costs, benefits, selected, capacity)
+        inside = np.flatnonzero(selected)
+        slack = capacity - int(costs[inside].sum())
+        # Meilleur mouvement trouvé : (gain, actions sortantes, actions entrantes)
+        best = (0.0, [], [])
+
+        def entering(limits: np.ndarray) -> List[Tuple[np.ndarray, List[np.ndarray]]]:
+            """Meilleure entrée seule et meilleure paire entrante pour chaque limite de coût."""
+            added, gains = index.best_within(limits)
+            options = [(gains, [added])]
+            if pairs is not None:
+                pair_index, first, second = pairs
+                chosen, pair_gains = pair_index.best_within(limits)
+                options.append((pair_gains, [first[chosen], second[chosen]]))
+            return options
+
+        # Ajouts dans le budget restant, puis échanges où une action sort
+        for gains, added in entering(np.array([slack])):
+            if gains[0] > best[0]:
+                best = (gains[0], [], [column[0] for column in added])
+        if inside.size:
+            for gains, added in entering(slack + costs[inside]):
+                gains = gains - benefits[inside]
+                k = int(np.argmax(gains))
+                if gains[k] > best[0]:
+                    best = (gains[k], [inside[k]], [column[k] for column in added])
+
+        # Échanges où deux actions sortent, par blocs de paires du portefeuille
+        for first, second in iter_pairs(inside.size):
+            out_first, out_second = inside[first], inside[second]
+            freed = costs[out_first] + costs[out_second]
+            lost = benefits[out_first] + benefits[out_second]
+            for gains, added in entering(slack + freed):
+                gains = gains - lost
+                k = int(np.argmax(gains))
+                if gains[k] > best[0]:
+                    removed = [out_first[k], out_second[k]]
+                    best = (gains[k], removed, [column[k] for column in added])
+            if time.perf_counter() >= deadline:
+                break
+
+        gain, removed, added = best
+        if gain <= 1e-9:
+            break
+        selected[removed] = False
+        selected[added] = True
+        moves += 1
+    return moves
+
+
+def local_search_indices(costs: np.ndarray, benefits: np.ndarray, ratios: np.ndarray, capacity: int,
+                         time_budget: float,
+                         stats: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Cœur de la recherche sur les colonnes : renvoie les indices des actions retenues."""
+    start_time = time.perf_counter()
+    selected = initial_solution(costs, benefits, ratios, capacity)
+    initial_benefit = float(benefits[selected].sum())
+    moves = improve(costs, benefits, selected, capacity, start_time + time_budget)
+
+    if stats is not None:
+        stats.update(
+            initial_benefit=initial_benefit,
+            moves=moves,
+            elapsed=time.perf_counter() - start_time
+        )
+    return np.flatnonzero(selected)
+
+
+def greedy_local_search(actions: Union[List[Action], ActionTable], max_budget: float,
+                        time_budget: float = LOCAL_SEARCH_TIME_BUDGET,
+                        stats: Optional[Dict[str, float]] = None
+                        ) -> Tuple[List[Action], float, float, float]:
+    """
+    Recherche une bonne combinaison d'actions : Greedy (ou meilleure action seule) puis recherche
+    locale pendant au plus `time_budget` secondes.
+
+    `actions` peut être une liste d'actions ou une `ActionTable`, dont les colonnes sont alors
+    utilisées directement ; seules les actions retenues sont converties en objets `Action`.
+    Si `stats` est fourni, on y renseigne le bénéfice initial, le nombre de mouvements et la durée.
+
+    Retourne: (combinaison, coût_total, bénéfice_total, pic_mémoire_allouée)
+    """
+    capacity = to_cents(max_budget)
+    if not len(actions) or capacity < 0:
+        return [], 0.0, 0.0, 0.0
+
+    if isinstance(actions, ActionTable):
+        def solve():
+            indices = local_search_indices(actions.cents(), actions.benefit, actions.ratio,
+                                           capacity, time_budget, stats)
+            return actions.actions(indices)
+    else:
+        def solve():
+            costs = np.array([to_cents(action.cost) for action in actions], dtype=np.int64)
+            benefits = np.array([action.benefit for action in actions], dtype=np.float64)
+            ratios = np.array([action.ratio for action in actions], dtype=np.float64)
+            indices = local_search_indices(costs, benefits, ratios, capacity, time_budget, stats)
+            return [actions[i] for i in indices]
+
+    best_combination, memory_used = traced_peak_memory(solve)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
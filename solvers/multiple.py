@@ -0,0 +1,194 @@
+"""
+Répartition d'un même univers d'actions entre plusieurs portefeuilles clients (sac à dos multiple).
+
+Chaque action (une part) ne peut être attribuée qu'à un seul portefeuille. La répartition se fait
+en trois temps :
+- Greedy : actions par ratio décroissant, chacune placée dans le portefeuille au plus petit
+  budget restant qui peut la contenir (best fit) ;
+- réparation : chaque portefeuille est re-optimisé exactement (réduction + programmation
+  dynamique) sur ses propres actions et les meilleures actions encore libres, ce qui ne peut
+  que l'améliorer ;
+- sur les petites instances, un branch-and-bound exact part de ce résultat et le prouve optimal
+  ou l'améliore, la borne étant la relaxation continue sur le budget total restant.
+"""
+
+import time
+from bisect import bisect_left, insort
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from models.action import Action
+from solvers.branch_and_bound import dantzig_bound, sort_by_ratio
+from solvers.dynamic_programming import knapsack_dp, to_cents, to_exact_benefit
+from solvers.reduction import solve_reduced
+
+# Nombre maximal de passes de réparation sur l'ensemble des portefeuilles, et nombre d'actions
+# libres (les meilleurs ratios qui tiennent dans le budget) proposées à chaque portefeuille
+MULTIPLE_REPAIR_PASSES = 3
+MULTIPLE_REPAIR_POOL = 256
+# Taille maximale des instances confiées au branch-and-bound exact, et sa limite de nœuds
+MULTIPLE_EXACT_MAX_ACTIONS = 20
+MULTIPLE_EXACT_MAX_NODES = 500_000
+
+
+def greedy_best_fit(actions: List[Action], capacities: List[int]) -> List[List[Action]]:
+    """
+    Place les actions (déjà triées par ratio) dans le portefeuille au plus petit budget restant
+    suffisant.
+    """
+    allocations = [[] for _ in capacities]
+    remaining = sorted((capacity, wallet) for wallet, capacity in enumerate(capacities))
+    for action in actions:
+        cost = to_cents(action.cost)
+        position = bisect_left(remaining, (cost, -1))
+        if position == len(remaining):
+            continue
+        capacity, wallet = remaining.pop(position)
+        allocations[wallet].append(action)
+        insort(remaining, (capacity - cost, wallet))
+    return allocations
+
+
+def repair_allocations(allocations: List[List[Action]], actions: List[Action],
+                       budgets: List[float]) -> Tuple[List[List[Action]], int]:
+    """
+    Re-optimise chaque portefeuille sur ses actions et les meilleures actions libres (au plus
+    MULTIPLE_REPAIR_POOL, `actions` étant triées par ratio), jusqu'à stabilisation.
+
+    Retourne: (répartition, nombre_de_portefeuilles_améliorés)
+    """
+    allocated_ids = {id(action) for allocation in allocations for action in allocation}
+    improved = 0
+    for _ in range(MULTIPLE_REPAIR_PASSES):
+        changed = False
+        for wallet, budget in enumerate(budgets):
+            capacity = to_cents(budget)
+            free_actions = []
+            for action in actions:
+                if len(free_actions) == MULTIPLE_REPAIR_POOL:
+                    break
+                if id(action) not in allocated_ids and to_cents(action.cost) <= capacity:
+                    free_actions.append(action)
+            if not free_actions:
+                continue
+
+            current = sum(to_exact_benefit(action) for action in allocations[wallet])
+            pool = allocations[wallet] + free_actions
+            selection, _, _, _ = solve_reduced(knapsack_dp, pool, budget)
+            if sum(to_exact_benefit(action) for action in selection) <= current:
+                continue
+            allocated_ids.difference_update(id(action) for action in allocations[wallet])
+            allocated_ids.update(id(action) for action in selection)
+            allocations[wallet] = selection
+            improved += 1
+            changed = True
+        if not changed:
+            break
+    return allocations, improved
+
+
+def exact_allocation(actions: List[Action], capacities: List[int], best_value: int,
+                     max_nodes: int) -> Tuple[Optional[List[int]], bool]:
+    """
+    Branch-and-bound exact : chaque action (triée par ratio) va dans un portefeuille ou nulle part.
+
+    Les portefeuilles de même budget restant sont interchangeables, un seul est essayé.
+
+    Retourne: (portefeuille de chaque action ou -1 si la recherche a trouvé mieux que `best_value`
+               sinon None, recherche_complète)
+    """
+    costs = [to_cents(action.cost) for action in actions]
+    benefits = [to_exact_benefit(action) for action in actions]
+    prefix_costs = [0] + list(accumulate(costs))
+    prefix_benefits = [0] + list(accumulate(benefits))
+    remaining = list(capacities)
+    assignment = [-1] * len(actions)
+    best = {'value': best_value, 'assignment': None, 'nodes': 0}
+
+    def search(index: int, value: int) -> bool:
+        best['nodes'] += 1
+        if best['nodes'] > max_nodes:
+            return False
+        if value > best['value']:
+            best['value'] = value
+            best['assignment'] = assignment[:index] + [-1] * (len(actions) - index)
+        if index == len(actions):
+            return True
+        bound = dantzig_bound(index, sum(remaining), value, prefix_costs, prefix_benefits, costs,
+                              benefits)
+        if bound <= best['value']:
+            return True
+
+        tried = set()
+        for wallet, capacity in enumerate(remaining):
+            if capacity < costs[index] or capacity in tried:
+                continue
+            tried.add(capacity)
+            remaining[wallet] -= costs[index]
+            assignment[index] = wallet
+            complete = search(index + 1, value + benefits[index])
+            remaining[wallet] += costs[index]
+            assignment[index] = -1
+            if not complete:
+                return False
+        return search(index + 1, value)
+
+    complete = search(0, 0)
+    return best['assignment'], complete
+
+
+def allocate_wallets(actions: List[Action], budgets: List[float],
+                     stats: Optional[Dict[str, object]] = None
+                     ) -> Tuple[List[List[Action]], float, float, float]:
+    """
+    Répartit les actions entre les portefeuilles de budgets `budgets`, chaque action allant
+    dans un portefeuille au plus, pour maximiser le bénéfice total.
+
+    Si `stats` est fourni, on y indique la méthode retenue ("exacte" si l'optimalité est prouvée,
+    "greedy + réparation" sinon), le nombre de portefeuilles améliorés par la réparation,
+    la borne supérieure de la relaxation continue et le temps écoulé.
+
+    Retourne: (actions de chaque portefeuille, dans l'ordre de `budgets`, coût_total,
+    bénéfice_total, mémoire_utilisée)
+    """
+    start_time = time.time()
+    capacities = [max(to_cents(budget), 0) for budget in budgets]
+    largest = max(capacities, default=0)
+    candidates = sort_by_ratio([action for action in actions if to_cents(action.cost) <= largest])
+
+    allocations = greedy_best_fit(candidates, capacities)
+    allocations, improved = repair_allocations(allocations, candidates, budgets)
+
+    method = "greedy + réparation"
+    if len(candidates) <= MULTIPLE_EXACT_MAX_ACTIONS:
+        allocated = [action for allocation in allocations for action in allocation]
+        current = sum(to_exact_benefit(action) for action in allocated)
+        assignment, complete = exact_allocation(candidates, capacities, current,
+                                                MULTIPLE_EXACT_MAX_NODES)
+        if assignment is not None:
+            allocations = [[] for _ in capacities]
+            for action, wallet in zip(candidates, assignment):
+                if wallet >= 0:
+                    allocations[wallet].append(action)
+        if complete:
+            method = "exacte"
+
+    selected = [action for allocation in allocations for action in allocation]
+    if stats is not None:
+        costs = [to_cents(action.cost) for action in candidates]
+        benefits = [action.benefit for action in candidates]
+        stats.update(
+            method=method,
+            improved_wallets=improved,
+            upper_bound=dantzig_bound(0, sum(capacities), 0.0, [0] + list(accumulate(costs)),
+                                      [0.0] + list(accumulate(benefits)), costs, benefits),
+            elapsed=time.time() - start_time
+        )
+
+    memory_used = len(candidates) * 8 / (1024 * 1024)
+    return (
+        allocations,
+        Action.total_portfolio_cost(selected),
+        Action.total_portfolio_benefit(selected),
+        memory_used
+    )
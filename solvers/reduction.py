@@ -0,0 +1,252 @@
+"""
+Réduction d'instance avant résolution.
+
+Les actions valides (issues de `action_loader.load_actions` ou de `optimized.load_actions`)
+passent par quatre filtres successifs :
+- suppression des actions plus chères que le budget ;
+- suppression des actions dominées (plus chères et moins rentables que suffisamment d'autres) ;
+- fusion des actions identiques (même coût, même bénéfice) en lots de tailles 1, 2, 4, ... ;
+- fixation de variables par les coûts réduits de la relaxation continue (bornes de Dembo-Hammer).
+"""
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.action import Action
+from solvers.branch_and_bound import sort_by_ratio
+from solvers.dynamic_programming import to_cents
+
+
+class ReducedInstance:
+    """Problème réduit, avec ce qu'il faut pour revenir à la sélection d'actions d'origine."""
+
+    def __init__(self, actions: List[Action], max_budget: float, fixed_actions: List[Action],
+                 bundles: Dict[int, List[Action]], stats: Dict[str, int]):
+        """Initialise l'instance réduite."""
+        self.actions = actions
+        self.max_budget = max_budget
+        self.fixed_actions = fixed_actions
+        self.bundles = bundles
+        self.stats = stats
+
+    @property
+    def removed_count(self) -> int:
+        """Nombre de variables retirées du problème vu par le solveur."""
+        return self.stats['original'] - len(self.actions)
+
+    def expand(self, selection: List[Action]) -> List[Action]:
+        """
+        Convertit une sélection sur l'instance réduite en actions d'origine, actions fixées
+        comprises.
+        """
+        expanded = list(self.fixed_actions)
+        for action in selection:
+            expanded.extend(self.bundles.get(id(action), [action]))
+        return expanded
+
+
+def group_identical_actions(actions: List[Action]) -> List[List[Action]]:
+    """Regroupe les actions de même coût (en centimes) et de même pourcentage de bénéfice."""
+    groups = {}
+    for action in actions:
+        groups.setdefault((to_cents(action.cost), action.benefit_percent), []).append(action)
+    return list(groups.values())
+
+
+def remove_dominated_groups(groups: List[List[Action]], capacity: int,
+                            max_count: Optional[int] = None) -> List[List[Action]]:
+    """
+    Supprime les groupes d'actions dominées.
+
+    Une action j est dominée par i si i coûte moins et rapporte plus. Contrairement au sac à dos
+    non borné, cela ne suffit pas en 0/1 : j n'est supprimée que si elle a plus de dominantes
+    qu'il ne peut tenir d'actions à ses côtés dans le budget (K_j, compté avec les actions les
+    moins chères). Toute solution contenant j laisse alors une dominante de côté, que l'on peut
+    échanger avec j.
+
+    Les groupes sont parcourus par coût croissant : K_j ne fait que diminuer, il suffit donc de
+    garder dans un tas les K_j + 1 meilleurs bénéfices déjà vus, soit O(n log K) au total.
+
+    Si le portefeuille est limité à `max_count` actions, K_j est en plus borné par max_count - 1.
+    """
+    costs = np.array([to_cents(group[0].cost) for group in groups], dtype=np.int64)
+    benefits = np.array([group[0].benefit for group in groups], dtype=np.float64)
+    multiplicities = np.array([len(group) for group in groups], dtype=np.int64)
+
+    # K_j : nombre maximal d'actions (les moins chères de toutes) tenant avec j dans le budget
+    all_costs = np.sort(np.repeat(costs, multiplicities))
+    fitting = np.searchsorted(np.cumsum(all_costs), capacity - costs, side='right')
+    if max_count is not None:
+        fitting = np.minimum(fitting, max(max_count - 1, 0))
+
+    kept = []
+    best_benefits = []
+    for j in np.lexsort((-benefits, costs)):
+        limit = int(fitting[j]) + 1
+        while len(best_benefits) > limit:
+            heapq.heappop(best_benefits)
+        # Plus de K_j actions moins chères rapportent au moins autant : j est dominée
+        if len(best_benefits) < limit or best_benefits[0] < benefits[j]:
+            kept.append(j)
+
+        for _ in range(min(int(multiplicities[j]), limit)):
+            if len(best_benefits) < limit:
+                heapq.heappush(best_benefits, benefits[j])
+            elif best_benefits[0] < benefits[j]:
+                heapq.heapreplace(best_benefits, benefits[j])
+    return [groups[j] for j in sorted(kept)]
+
+
+def split_into_bundles(group: List[Action]) -> List[Tuple[Action, List[Action]]]:
+    """
+    Découpe un groupe d'actions identiques en lots de tailles 1, 2, 4, ..., reste.
+
+    Toute quantité entre 0 et len(group) s'obtient avec une combinaison de ces lots, ce qui
+    remplace m variables par O(log m). Un lot est une action de coût k × coût, au même pourcentage.
+    """
+    if len(group) == 1:
+        return [(group[0], group)]
+
+    bundles = []
+    start = 0
+    for size in binary_sizes(len(group)):
+        members = group[start:start + size]
+        bundles.append((make_bundle(members[0], size), members))
+        start += size
+    return bundles
+
+
+def binary_sizes(count: int) -> List[int]:
+    """
+    Tailles de lots 1, 2, 4, ..., reste, dont les sommes partielles couvrent toutes les quantités de
+    0 à `count`.
+    """
+    sizes = []
+    size = 1
+    while count > 0:
+        size = min(size, count)
+        sizes.append(size)
+        count -= size
+        size *= 2
+    return sizes
+
+
+def make_bundle(reference: Action, size: int) -> Action:
+    """Lot de `size` exemplaires d'une action : coût multiplié, même pourcentage de bénéfice."""
+    return Action(f"{reference.name} ×{size}", reference.cost * size, reference.benefit_percent,
+                  fixed_point=reference.fixed_point)
+
+
+def greedy_lower_bound(costs: List[int], benefits: List[float], capacity: int) -> float:
+    """
+    Valeur du meilleur entre le Greedy complet (actions triées par ratio) et la meilleure action
+    seule.
+    """
+    value = 0.0
+    remaining = capacity
+    for cost, benefit in zip(costs, benefits):
+        if cost <= remaining:
+            remaining -= cost
+            value += benefit
+    affordable = (benefit for cost, benefit in zip(costs, benefits) if cost <= capacity)
+    best_single = max(affordable, default=0.0)
+    return max(value, best_single)
+
+
+def fix_variables(actions: List[Action], capacity: int
+                  ) -> Tuple[List[Action], List[Action], List[Action]]:
+    """
+    Fixe les variables dont la valeur optimale est certaine grâce aux coûts réduits.
+
+    Avec r le ratio de l'action critique de la relaxation continue et U sa valeur, forcer une
+    action j à l'inverse de la relaxation donne une borne U - |b_j - r × c_j|. Si cette borne est
+    strictement inférieure à la valeur d'une solution connue, l'action est fixée.
+
+    Retourne: (actions_libres, actions_fixées_à_1, actions_fixées_à_0)
+    """
+    actions = sort_by_ratio(actions)
+    costs = [to_cents(action.cost) for action in actions]
+    benefits = [action.benefit for action in actions]
+
+    # Relaxation continue : actions entières jusqu'à l'action critique, puis une fraction de
+    # celle-ci
+    upper_bound = 0.0
+    remaining = capacity
+    critical = len(actions)
+    for i, (cost, benefit) in enumerate(zip(costs, benefits)):
+        if cost > remaining:
+            critical = i
+            upper_bound += remaining * benefit / cost
+            break
+        remaining -= cost
+        upper_bound += benefit
+    if critical == len(actions):
+        # Tout tient dans le budget : la solution est triviale
+        return [], actions, []
+
+    critical_ratio = benefits[critical] / costs[critical]
+    lower_bound = greedy_lower_bound(costs, benefits, capacity)
+    # Marge de sécurité contre les erreurs d'arrondi flottant
+    tolerance = 1e-9 * max(upper_bound, 1.0)
+
+    free, fixed_in, fixed_out = [], [], []
+    for i, action in enumerate(actions):
+        reduced_cost = abs(benefits[i] - critical_ratio * costs[i])
+        if i != critical and upper_bound - reduced_cost + tolerance < lower_bound:
+            (fixed_in if i < critical else fixed_out).append(action)
+        else:
+            free.append(action)
+    return free, fixed_in, fixed_out
+
+
+def reduce_instance(actions: List[Action], max_budget: float) -> ReducedInstance:
+    """Applique toutes les réductions et renvoie l'instance que verra le solveur."""
+    capacity = to_cents(max_budget)
+    stats = {'original': len(actions)}
+
+    affordable = [action for action in actions if to_cents(action.cost) <= capacity]
+    stats['over_budget'] = len(actions) - len(affordable)
+
+    groups = group_identical_actions(affordable)
+    kept_groups = remove_dominated_groups(groups, capacity) if groups else []
+    kept_count = sum(len(group) for group in kept_groups)
+    stats['dominated'] = sum(len(group) for group in groups) - kept_count
+
+    # Au-delà de capacité / coût, les copies d'une même action ne peuvent jamais être achetées
+    candidates = []
+    bundles = {}
+    for group in kept_groups:
+        group = group[:capacity // max(to_cents(group[0].cost), 1)]
+        for bundle, members in split_into_bundles(group):
+            candidates.append(bundle)
+            bundles[id(bundle)] = members
+    stats['merged'] = sum(len(group) for group in kept_groups) - len(candidates)
+
+    free, fixed_in, fixed_out = fix_variables(candidates, capacity) if candidates else ([], [], [])
+    stats['fixed_in'] = len(fixed_in)
+    stats['fixed_out'] = len(fixed_out)
+
+    fixed_actions = [member for bundle in fixed_in for member in bundles[id(bundle)]]
+    remaining_budget = (capacity - sum(to_cents(bundle.cost) for bundle in fixed_in)) / 100
+    return ReducedInstance(free, remaining_budget, fixed_actions, bundles, stats)
+
+
+def solve_reduced(solver: Callable, actions: List[Action], max_budget: float
+                  ) -> Tuple[List[Action], float, float, float]:
+    """
+    Réduit l'instance, la résout avec `solver` puis reconstitue la sélection d'origine.
+
+    `solver` suit l'interface de `find_best_combination` et le résultat aussi :
+    (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    reduced = reduce_instance(actions, max_budget)
+    selection, _, _, memory_used = solver(reduced.actions, reduced.max_budget)
+    best_combination = reduced.expand(selection)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
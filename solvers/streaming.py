@@ -0,0 +1,122 @@
+"""
+Greedy en flux pour les fichiers d'actions trop gros pour être chargés en entier.
+
+Les blocs produits par `action_loader.iter_action_batches` passent un à un dans un tas borné
+(sous forme de colonnes) qui ne garde que les `heap_size` meilleurs ratios parmi les actions
+tenant dans le budget ; le Greedy parcourt ensuite ces seuls candidats. Le résultat est celui du
+Greedy sur le fichier entier dès que le budget restant est inférieur au coût de toutes les actions
+écartées du tas, ce que `selection` vérifie.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from action_loader import ROW_VALID, STREAM_CHUNK_ROWS, LoadSummary, iter_action_batches
+from models.action import Action
+from models.action_table import ActionTable
+from solvers.dynamic_programming import to_cents
+
+# Nombre maximal de candidats gardés par le Greedy en flux
+STREAM_HEAP_SIZE = 10_000
+
+
+class StreamingGreedy:
+    """Tas borné des meilleurs ratios, alimenté bloc par bloc."""
+
+    def __init__(self, max_budget: float, heap_size: int = STREAM_HEAP_SIZE):
+        """Prépare un tas vide pour un budget de `max_budget` euros."""
+        self.capacity = to_cents(max_budget)
+        self.heap_size = heap_size
+        self.candidates = None
+        # Position des candidats dans le fichier, pour départager les ratios égaux comme un tri
+        # stable
+        self.rows = np.zeros(0, dtype=np.int64)
+        self.min_evicted_cost = None
+
+    def add(self, table: ActionTable, rows: np.ndarray):
+        """Ajoute les actions valides d'un bloc (`rows` : leurs positions dans le fichier)."""
+        # Un coût infini, bien que positif, ne tient dans aucun budget
+        finite = np.flatnonzero(np.isfinite(table.cost))
+        table, rows = table.take(finite), rows[finite]
+        fits = table.cents() <= self.capacity
+        if not fits.any():
+            return
+        table, rows = table.take(np.flatnonzero(fits)), rows[fits]
+        if self.candidates is not None:
+            table = ActionTable.concatenate([self.candidates, table])
+            rows = np.concatenate([self.rows, rows])
+
+        order = np.lexsort((rows, -table.ratio))
+        if len(order) > self.heap_size:
+            evicted = table.cents()[order[self.heap_size:]].min()
+            if self.min_evicted_cost is not None:
+                evicted = min(self.min_evicted_cost, evicted)
+            self.min_evicted_cost = evicted
+            order = order[:self.heap_size]
+        self.candidates, self.rows = table.take(order), rows[order]
+
+    def selection(self) -> Tuple[List[Action], bool]:
+        """
+        Greedy sur les candidats (par ratio décroissant, chaque action qui tient encore est prise).
+
+        Retourne: (combinaison, identique_au_greedy_complet)
+        """
+        if self.candidates is None or self.capacity < 0:
+            return [], True
+        remaining = self.capacity
+        chosen = []
+        for index, cost in enumerate(self.candidates.cents().tolist()):
+            if cost <= remaining:
+                chosen.append(index)
+                remaining -= cost
+        exact = self.min_evicted_cost is None or remaining < int(self.min_evicted_cost)
+        return self.candidates.actions(chosen), exact
+
+    @property
+    def memory_used(self) -> float:
+        """Mémoire occupée par les candidats, en MB."""
+        if self.candidates is None:
+            return 0.0
+        return (self.candidates.nbytes + self.rows.nbytes) / (1024 * 1024)
+
+
+def stream_greedy(file_path: str, max_budget: float, fixed_point: bool = False,
+                  chunk_size: int = STREAM_CHUNK_ROWS, heap_size: int = STREAM_HEAP_SIZE,
+                  stats: Optional[Dict[str, object]] = None
+                  ) -> Tuple[List[Action], float, float, LoadSummary]:
+    """
+    Greedy sur un fichier lu par blocs, sans jamais le charger en entier.
+
+    Les compteurs du chargement (raisons d'invalidité, erreurs, statistiques des actions valides)
+    sont tenus dans un `LoadSummary` ; une erreur qui interrompt la lecture y est ajoutée et le
+    Greedy porte alors sur les lignes lues jusque-là. Si `stats` est fourni, on y indique si le
+    résultat est prouvé identique au Greedy complet, la mémoire du tas et le temps écoulé.
+
+    Retourne: (combinaison, coût_total, bénéfice_total, résumé_du_chargement)
+    """
+    start_time = time.time()
+    summary = LoadSummary()
+    greedy = StreamingGreedy(max_budget, heap_size)
+    try:
+        batches = iter_action_batches(file_path, fixed_point=fixed_point, chunk_size=chunk_size)
+        for offset, parsed in batches:
+            valid_rows = parsed.rows(ROW_VALID)
+            table = parsed.table(valid_rows)
+            summary.update(parsed, table)
+            greedy.add(table, offset + valid_rows)
+    except FileNotFoundError:
+        summary.errors.append(f"Le fichier {file_path} n'a pas été trouvé.")
+    except Exception as e:
+        summary.errors.append(f"Erreur lors de la lecture du fichier: {str(e)}")
+
+    selection, exact = greedy.selection()
+    if stats is not None:
+        stats.update(exact=exact, memory_used=greedy.memory_used, elapsed=time.time() - start_time)
+    return (
+        selection,
+        Action.total_portfolio_cost(selection),
+        Action.total_portfolio_benefit(selection),
+        summary
+    )
@@ -0,0 +1,237 @@
+"""
+Sac à dos à deux dimensions : budget en euros et budget de risque.
+
+Le risque (score `Action.risk`, compté au centième) est une seconde ressource à ne pas dépasser.
+Ajouter une dimension W×R au tableau DP multiplierait le temps par l'étendue du risque ; on combine
+plutôt deux méthodes :
+- heuristique par relaxation lagrangienne : la contrainte de risque passe dans l'objectif avec un
+  multiplicateur λ (bénéfice - λ × risque), chaque sous-problème est un sac à dos 1D résolu par
+  programmation dynamique, et λ est ajusté par dichotomie. Elle donne une solution réalisable et
+  une borne supérieure de l'optimum ;
+- programmation dynamique exacte sur les états de Pareto (coût, risque, bénéfice) : un état dominé
+  par un autre (coût et risque inférieurs, bénéfice supérieur) est supprimé, de même qu'un état dont
+  la borne de Dantzig ne dépasse pas la meilleure solution connue.
+Sur les grandes instances, si le nombre d'états dépasse `max_states`, on garde la solution
+lagrangienne.
+"""
+
+import math
+import sys
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from models.action import MICROS_PER_EURO, Action
+from solvers.branch_and_bound import dantzig_bound, sort_by_ratio
+from solvers.dynamic_programming import reconstruct_hirschberg, to_cents, to_exact_benefit
+
+# Nombre maximal d'états de Pareto conservés avant de s'en remettre à l'heuristique lagrangienne
+PARETO_MAX_STATES = 50_000
+# Nombre d'itérations de la dichotomie sur le multiplicateur de Lagrange
+LAGRANGIAN_ITERATIONS = 12
+# Plus petit multiplicateur essayé, relativement au plus grand rapport bénéfice/risque
+LAGRANGIAN_MIN_RATIO = 1e-9
+
+
+def solve_penalized(costs: List[int], risks: List[int], benefits: List[int], capacity: int,
+                    multiplier: float) -> Tuple[List[int], float]:
+    """
+    Sac à dos 1D sur les bénéfices pénalisés b - λ × r (les actions de bénéfice pénalisé négatif
+    sont écartées).
+
+    Retourne: (indices sélectionnés, valeur pénalisée)
+    """
+    indices = [i for i in range(len(costs)) if benefits[i] - multiplier * risks[i] > 0]
+    if not indices:
+        return [], 0.0
+    penalized = [benefits[i] - multiplier * risks[i] for i in indices]
+    sub_costs = [costs[i] for i in indices]
+    granularity = math.gcd(*sub_costs) or 1
+    scaled_costs = [cost // granularity for cost in sub_costs]
+    chosen = reconstruct_hirschberg(scaled_costs, penalized, capacity // granularity)
+    return [indices[i] for i in chosen], sum(penalized[i] for i in chosen)
+
+
+def complete_greedily(selection: List[int], costs: List[int], risks: List[int],
+                      capacity: int, risk_capacity: int) -> List[int]:
+    """
+    Ajoute, par ratio décroissant (ordre des indices), les actions qui tiennent encore dans les
+    deux budgets.
+    """
+    chosen = set(selection)
+    remaining = capacity - sum(costs[i] for i in selection)
+    remaining_risk = risk_capacity - sum(risks[i] for i in selection)
+    for i in range(len(costs)):
+        if i not in chosen and costs[i] <= remaining and risks[i] <= remaining_risk:
+            chosen.add(i)
+            remaining -= costs[i]
+            remaining_risk -= risks[i]
+    return sorted(chosen)
+
+
+def lagrangian_heuristic(costs: List[int], risks: List[int], benefits: List[int], capacity: int,
+                         risk_capacity: int,
+                         iterations: int = LAGRANGIAN_ITERATIONS) -> Tuple[List[int], float, bool]:
+    """
+    Meilleure solution réalisable trouvée en ajustant λ par dichotomie, et borne supérieure
+    min λ×R + valeur pénalisée. Si la solution sans pénalité respecte déjà le risque, elle est
+    optimale.
+
+    Retourne: (indices sélectionnés, borne_supérieure, optimalité_prouvée)
+    """
+    selection, value = solve_penalized(costs, risks, benefits, capacity, 0.0)
+    if sum(risks[i] for i in selection) <= risk_capacity:
+        return selection, value, True
+
+    best = complete_greedily([], costs, risks, capacity, risk_capacity)
+    upper_bound = value
+    # Au-delà du plus grand rapport bénéfice/risque, seules les actions sans risque restent : la
+    # dichotomie est géométrique car ces rapports s'étalent sur plusieurs ordres de grandeur
+    high = max((benefit / risk for benefit, risk in zip(benefits, risks) if risk > 0), default=0.0)
+    low = high * LAGRANGIAN_MIN_RATIO
+    for _ in range(iterations):
+        multiplier = math.sqrt(low * high)
+        selection, value = solve_penalized(costs, risks, benefits, capacity, multiplier)
+        upper_bound = min(upper_bound, value + multiplier * risk_capacity)
+        if sum(risks[i] for i in selection) <= risk_capacity:
+            high = multiplier
+            selection = complete_greedily(selection, costs, risks, capacity, risk_capacity)
+            if sum(benefits[i] for i in selection) > sum(benefits[i] for i in best):
+                best = selection
+        else:
+            low = multiplier
+    return best, upper_bound, False
+
+
+def pareto_dp(costs: List[int], risks: List[int], benefits: List[int], capacity: int,
+              risk_capacity: int, best_value: int,
+              max_states: int) -> Tuple[Optional[List[int]], int, bool]:
+    """
+    Programmation dynamique sur les états de Pareto (coût, risque, bénéfice), actions triées par
+    ratio.
+
+    Après chaque action, les états sont triés par coût croissant puis bénéfice décroissant ; un état
+    est dominé si un état déjà gardé a un risque inférieur ou égal et un bénéfice supérieur ou égal,
+    ce que l'on teste avec un arbre de Fenwick (maximum préfixe) sur les risques.
+
+    Retourne: (indices de la meilleure sélection si elle dépasse `best_value` sinon None,
+               nombre maximal d'états, recherche_complète)
+    """
+    prefix_costs = [0] + list(accumulate(costs))
+    prefix_benefits = [0] + list(accumulate(benefits))
+    # État : (coût, risque, bénéfice, actions prises sous forme de liste chaînée)
+    states = [(0, 0, 0, None)]
+    best_chosen = None
+    max_states_seen = 1
+
+    for index in range(len(costs)):
+        cost, risk, benefit = costs[index], risks[index], benefits[index]
+        candidates = list(states)
+        for state_cost, state_risk, value, chosen in states:
+            if state_cost + cost <= capacity and state_risk + risk <= risk_capacity:
+                state = (state_cost + cost, state_risk + risk, value + benefit, (index, chosen))
+                candidates.append(state)
+                if state[2] > best_value:
+                    best_value = state[2]
+                    best_chosen = state[3]
+
+        # Élagage par la borne : les actions suivantes ne peuvent pas battre la meilleure solution
+        candidates = [
+            state for state in candidates
+            if dantzig_bound(index + 1, capacity - state[0], state[2],
+                             prefix_costs, prefix_benefits, costs, benefits) > best_value
+        ]
+
+        # Élagage par dominance
+        candidates.sort(key=lambda state: (state[0], -state[2], state[1]))
+        levels = sorted({state[1] for state in candidates})
+        tree = [-1] * (len(levels) + 1)
+        states = []
+        for state in candidates:
+            position = bisect_right(levels, state[1])
+            best_below = -1
+            i = position
+            while i > 0:
+                best_below = max(best_below, tree[i])
+                i -= i & -i
+            if best_below >= state[2]:
+                continue
+            states.append(state)
+            while position <= len(levels):
+                tree[position] = max(tree[position], state[2])
+                position += position & -position
+
+        max_states_seen = max(max_states_seen, len(states))
+        if len(states) > max_states:
+            return None, max_states_seen, False
+
+    selection = []
+    while best_chosen is not None:
+        index, best_chosen = best_chosen
+        selection.append(index)
+    return (sorted(selection) if selection else None), max_states_seen, True
+
+
+def knapsack_2d(
+    actions: List[Action], max_budget: float, max_risk: float,
+    max_states: int = PARETO_MAX_STATES, stats: Optional[Dict[str, object]] = None
+) -> Tuple[List[Action], float, float, float]:
+    """
+    Sélection de bénéfice maximal dont le coût ne dépasse pas `max_budget` et le risque total
+    `max_risk`.
+
+    Si `stats` est fourni, on y indique la méthode retenue, si la solution est prouvée optimale,
+    la borne supérieure lagrangienne, le nombre maximal d'états de Pareto et le temps écoulé.
+
+    Retourne: (meilleure_combinaison, coût_total, bénéfice_total, mémoire_utilisée)
+    """
+    start_time = time.time()
+    capacity = to_cents(max_budget)
+    risk_capacity = to_cents(max_risk)
+    candidates = sort_by_ratio([
+        action for action in actions
+        if to_cents(action.cost) <= capacity and to_cents(action.risk) <= risk_capacity
+    ])
+    if not candidates:
+        if stats is not None:
+            stats.update(method="aucune action possible", optimal=True, upper_bound=0.0, states=0,
+                         elapsed=time.time() - start_time)
+        return [], 0.0, 0.0, 0.0
+
+    costs = [to_cents(action.cost) for action in candidates]
+    risks = [to_cents(action.risk) for action in candidates]
+    benefits = [to_exact_benefit(action) for action in candidates]
+
+    selection, upper_bound, optimal = lagrangian_heuristic(
+        costs, risks, benefits, capacity, risk_capacity
+    )
+    method = "relaxation lagrangienne"
+    states = 0
+    if not optimal:
+        value = sum(benefits[i] for i in selection)
+        pareto_selection, states, optimal = pareto_dp(
+            costs, risks, benefits, capacity, risk_capacity, value, max_states
+        )
+        if optimal:
+            method = "programmation dynamique de Pareto"
+            if pareto_selection is not None:
+                selection = pareto_selection
+
+    best_combination = [candidates[i] for i in selection]
+    if stats is not None:
+        stats.update(
+            method=method,
+            optimal=optimal,
+            upper_bound=upper_bound / MICROS_PER_EURO,
+            states=states,
+            elapsed=time.time() - start_time
+        )
+
+    memory_used = max(states, len(candidates)) * sys.getsizeof((0, 0, 0, None)) / (1024 * 1024)
+    return (
+        best_combination,
+        Action.total_portfolio_cost(best_combination),
+        Action.total_portfolio_benefit(best_combination),
+        memory_used
+    )
@@ -0,0 +1,39 @@
+"""
+Rejeu d'un flux de modifications enregistré (data/ticks_sample.csv) sur data/actions.csv : après
+chaque modification, l'optimiseur incrémental doit donner le même bénéfice qu'une résolution
+complète par `knapsack_dp`.
+"""
+
+import os
+
+from action_loader import load_actions
+from solvers.dynamic_programming import knapsack_dp, to_exact_benefit
+from solvers.incremental import IncrementalOptimizer, apply_tick, load_ticks, replay_ticks
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+ACTIONS_FILE = os.path.join(DATA_DIR, 'actions.csv')
+TICKS_FILE = os.path.join(DATA_DIR, 'ticks_sample.csv')
+# Budget de l'exercice, et petit intervalle de copies pour que les reprises soient exercées
+BUDGET = 500
+CHECKPOINT_EVERY = 4
+
+
+def build_optimizer() -> IncrementalOptimizer:
+    actions, _, _ = load_actions(ACTIONS_FILE)
+    return IncrementalOptimizer(actions, BUDGET, checkpoint_every=CHECKPOINT_EVERY)
+
+
+def test_every_tick_matches_cold_solve():
+    optimizer = build_optimizer()
+    for tick in load_ticks(TICKS_FILE):
+        apply_tick(optimizer, tick)
+        selection, _, _, _ = optimizer.selection()
+        expected, _, _, _ = knapsack_dp(optimizer.items, BUDGET)
+        assert sum(map(to_exact_benefit, selection)) == sum(map(to_exact_benefit, expected)), tick
+
+
+def test_replay_with_verification():
+    ticks = load_ticks(TICKS_FILE)
+    results = replay_ticks(build_optimizer(), ticks, verify=True)
+    assert len(results) == len(ticks)
+    assert list(results['op']) == [tick['op'] for tick in ticks]